@@ -0,0 +1,51 @@
+"""Add parsed posting hour/minute to autopilot_configs
+
+Revision ID: k8l9m0n1o2p3
+Revises: j7k8l9m0n1o2
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "k8l9m0n1o2p3"
+down_revision = "j7k8l9m0n1o2"
+branch_labels = None
+depends_on = None
+
+
+def _column_exists(conn, table_name: str, column_name: str) -> bool:
+    result = conn.execute(sa.text(
+        "SELECT 1 FROM information_schema.columns WHERE table_name = :t AND column_name = :c"
+    ), {"t": table_name, "c": column_name})
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    if not _column_exists(conn, "autopilot_configs", "preferred_posting_hour"):
+        op.add_column(
+            "autopilot_configs",
+            sa.Column("preferred_posting_hour", sa.SmallInteger, nullable=True),
+        )
+    if not _column_exists(conn, "autopilot_configs", "preferred_posting_minute"):
+        op.add_column(
+            "autopilot_configs",
+            sa.Column("preferred_posting_minute", sa.SmallInteger, nullable=True),
+        )
+
+    # Backfill from the existing "HH:MM" strings
+    op.execute(
+        "UPDATE autopilot_configs SET "
+        "preferred_posting_hour = split_part(preferred_posting_time, ':', 1)::smallint, "
+        "preferred_posting_minute = split_part(preferred_posting_time, ':', 2)::smallint "
+        "WHERE preferred_posting_time ~ '^([01]?[0-9]|2[0-3]):[0-5][0-9]$'"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("autopilot_configs", "preferred_posting_minute")
+    op.drop_column("autopilot_configs", "preferred_posting_hour")
@@ -0,0 +1,38 @@
+"""Add composite index for listing CM interactions
+
+Revision ID: l9m0n1o2p3q4
+Revises: k8l9m0n1o2p3
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "l9m0n1o2p3q4"
+down_revision = "k8l9m0n1o2p3"
+branch_labels = None
+depends_on = None
+
+
+def _index_exists(conn, index_name: str) -> bool:
+    result = conn.execute(sa.text(
+        "SELECT 1 FROM pg_indexes WHERE indexname = :i"
+    ), {"i": index_name})
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    if not _index_exists(conn, "ix_cm_brand_status_class_created"):
+        op.create_index(
+            "ix_cm_brand_status_class_created",
+            "cm_interactions",
+            ["brand_id", "response_status", "classification", sa.text("created_at DESC")],
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_cm_brand_status_class_created", table_name="cm_interactions")
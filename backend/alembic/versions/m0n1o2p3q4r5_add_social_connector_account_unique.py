@@ -0,0 +1,67 @@
+"""Make social connectors unique per brand/platform/account
+
+Revision ID: m0n1o2p3q4r5
+Revises: l9m0n1o2p3q4
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "m0n1o2p3q4r5"
+down_revision = "l9m0n1o2p3q4"
+branch_labels = None
+depends_on = None
+
+
+def _constraint_exists(conn, constraint_name: str) -> bool:
+    result = conn.execute(sa.text(
+        "SELECT 1 FROM information_schema.table_constraints WHERE constraint_name = :c"
+    ), {"c": constraint_name})
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    if _constraint_exists(conn, "uq_social_connector_brand_platform_account"):
+        return
+
+    # Collapse duplicates left by the old SELECT-then-INSERT race: keep the
+    # most recently updated row and move dependent rows onto it.
+    op.execute("""
+        CREATE TEMP TABLE _connector_dupes ON COMMIT DROP AS
+        SELECT id, keep_id FROM (
+            SELECT id,
+                   first_value(id) OVER (
+                       PARTITION BY brand_id, platform, account_id
+                       ORDER BY updated_at DESC, id
+                   ) AS keep_id
+            FROM social_connectors
+        ) ranked
+        WHERE id <> keep_id
+    """)
+    for table in ("scheduled_posts", "metrics_snapshots"):
+        op.execute(
+            f"UPDATE {table} t SET connector_id = d.keep_id "
+            "FROM _connector_dupes d WHERE t.connector_id = d.id"
+        )
+    op.execute(
+        "DELETE FROM social_connectors WHERE id IN (SELECT id FROM _connector_dupes)"
+    )
+
+    op.create_unique_constraint(
+        "uq_social_connector_brand_platform_account",
+        "social_connectors",
+        ["brand_id", "platform", "account_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "uq_social_connector_brand_platform_account",
+        "social_connectors",
+        type_="unique",
+    )
@@ -0,0 +1,38 @@
+"""Add pre-encoded API payload to dishes
+
+Revision ID: n1o2p3q4r5s6
+Revises: m0n1o2p3q4r5
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "n1o2p3q4r5s6"
+down_revision = "m0n1o2p3q4r5"
+branch_labels = None
+depends_on = None
+
+
+def _column_exists(conn, table_name: str, column_name: str) -> bool:
+    result = conn.execute(sa.text(
+        "SELECT 1 FROM information_schema.columns WHERE table_name = :t AND column_name = :c"
+    ), {"t": table_name, "c": column_name})
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    # Existing rows stay NULL; ContentLibraryService fills them on first list
+    if not _column_exists(conn, "dishes", "payload_json"):
+        op.add_column(
+            "dishes",
+            sa.Column("payload_json", sa.LargeBinary, nullable=True),
+        )
+
+
+def downgrade() -> None:
+    op.drop_column("dishes", "payload_json")
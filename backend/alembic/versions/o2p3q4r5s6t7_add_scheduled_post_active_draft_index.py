@@ -0,0 +1,59 @@
+"""Allow one pending scheduled post per draft
+
+Revision ID: o2p3q4r5s6t7
+Revises: n1o2p3q4r5s6
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "o2p3q4r5s6t7"
+down_revision = "n1o2p3q4r5s6"
+branch_labels = None
+depends_on = None
+
+
+def _index_exists(conn, index_name: str) -> bool:
+    result = conn.execute(sa.text(
+        "SELECT 1 FROM pg_indexes WHERE indexname = :i"
+    ), {"i": index_name})
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    if _index_exists(conn, "uq_scheduled_posts_active_draft"):
+        return
+
+    # Cancel duplicates left by the old SELECT-then-INSERT race, keeping the
+    # most recently updated pending post of each draft
+    op.execute("""
+        UPDATE scheduled_posts SET status = 'CANCELLED'
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id,
+                       row_number() OVER (
+                           PARTITION BY draft_id ORDER BY updated_at DESC, id
+                       ) AS rn
+                FROM scheduled_posts
+                WHERE draft_id IS NOT NULL AND status IN ('SCHEDULED', 'QUEUED')
+            ) ranked
+            WHERE rn > 1
+        )
+    """)
+
+    op.create_index(
+        "uq_scheduled_posts_active_draft",
+        "scheduled_posts",
+        ["draft_id"],
+        unique=True,
+        postgresql_where=sa.text("status IN ('SCHEDULED', 'QUEUED')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_scheduled_posts_active_draft", table_name="scheduled_posts")
@@ -0,0 +1,38 @@
+"""Index content ideas for keyset pagination
+
+Revision ID: p3q4r5s6t7u8
+Revises: o2p3q4r5s6t7
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "p3q4r5s6t7u8"
+down_revision = "o2p3q4r5s6t7"
+branch_labels = None
+depends_on = None
+
+
+def _index_exists(conn, index_name: str) -> bool:
+    result = conn.execute(sa.text(
+        "SELECT 1 FROM pg_indexes WHERE indexname = :i"
+    ), {"i": index_name})
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    if not _index_exists(conn, "ix_content_ideas_brand_created_id"):
+        op.create_index(
+            "ix_content_ideas_brand_created_id",
+            "content_ideas",
+            ["brand_id", "created_at", "id"],
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_content_ideas_brand_created_id", table_name="content_ideas")
@@ -0,0 +1,39 @@
+"""Index active knowledge item categories per brand
+
+Revision ID: q4r5s6t7u8v9
+Revises: p3q4r5s6t7u8
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "q4r5s6t7u8v9"
+down_revision = "p3q4r5s6t7u8"
+branch_labels = None
+depends_on = None
+
+
+def _index_exists(conn, index_name: str) -> bool:
+    result = conn.execute(sa.text(
+        "SELECT 1 FROM pg_indexes WHERE indexname = :i"
+    ), {"i": index_name})
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    if not _index_exists(conn, "ix_knowledge_items_brand_category"):
+        op.create_index(
+            "ix_knowledge_items_brand_category",
+            "knowledge_items",
+            ["brand_id", "category"],
+            postgresql_where=sa.text("is_active AND category IS NOT NULL"),
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_knowledge_items_brand_category", table_name="knowledge_items")
@@ -0,0 +1,43 @@
+"""Index media assets and voice notes for the library stats
+
+Revision ID: r5s6t7u8v9w0
+Revises: q4r5s6t7u8v9
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "r5s6t7u8v9w0"
+down_revision = "q4r5s6t7u8v9"
+branch_labels = None
+depends_on = None
+
+
+def _index_exists(conn, index_name: str) -> bool:
+    result = conn.execute(sa.text(
+        "SELECT 1 FROM pg_indexes WHERE indexname = :i"
+    ), {"i": index_name})
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    if not _index_exists(conn, "ix_media_assets_brand_stats"):
+        op.create_index(
+            "ix_media_assets_brand_stats",
+            "media_assets",
+            ["brand_id", "media_type", "source", "ai_analyzed"],
+            postgresql_include=["file_size"],
+        )
+
+    if not _index_exists(conn, "ix_voice_notes_brand_id"):
+        op.create_index("ix_voice_notes_brand_id", "voice_notes", ["brand_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_voice_notes_brand_id", table_name="voice_notes")
+    op.drop_index("ix_media_assets_brand_stats", table_name="media_assets")
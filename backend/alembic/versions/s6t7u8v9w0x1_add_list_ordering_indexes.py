@@ -0,0 +1,61 @@
+"""Index knowledge item and media list orderings
+
+Revision ID: s6t7u8v9w0x1
+Revises: r5s6t7u8v9w0
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "s6t7u8v9w0x1"
+down_revision = "r5s6t7u8v9w0"
+branch_labels = None
+depends_on = None
+
+
+def _index_exists(conn, index_name: str) -> bool:
+    result = conn.execute(sa.text(
+        "SELECT 1 FROM pg_indexes WHERE indexname = :i"
+    ), {"i": index_name})
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    if not _index_exists(conn, "ix_knowledge_items_brand_active_title"):
+        op.create_index(
+            "ix_knowledge_items_brand_active_title",
+            "knowledge_items",
+            ["brand_id", "is_active", "title"],
+        )
+
+    if not _index_exists(conn, "ix_media_assets_brand_archived_created"):
+        op.create_index(
+            "ix_media_assets_brand_archived_created",
+            "media_assets",
+            ["brand_id", "is_archived", "created_at"],
+        )
+
+    # Supersedes the brand_id-only index, which is its leading column
+    if not _index_exists(conn, "ix_voice_notes_brand_created"):
+        op.create_index(
+            "ix_voice_notes_brand_created",
+            "voice_notes",
+            ["brand_id", "created_at"],
+        )
+    if _index_exists(conn, "ix_voice_notes_brand_id"):
+        op.drop_index("ix_voice_notes_brand_id", table_name="voice_notes")
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+
+    if not _index_exists(conn, "ix_voice_notes_brand_id"):
+        op.create_index("ix_voice_notes_brand_id", "voice_notes", ["brand_id"])
+    op.drop_index("ix_voice_notes_brand_created", table_name="voice_notes")
+    op.drop_index("ix_media_assets_brand_archived_created", table_name="media_assets")
+    op.drop_index("ix_knowledge_items_brand_active_title", table_name="knowledge_items")
@@ -0,0 +1,38 @@
+"""Index scheduled posts by brand, status and publish time
+
+Revision ID: t7u8v9w0x1y2
+Revises: s6t7u8v9w0x1
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "t7u8v9w0x1y2"
+down_revision = "s6t7u8v9w0x1"
+branch_labels = None
+depends_on = None
+
+
+def _index_exists(conn, index_name: str) -> bool:
+    result = conn.execute(sa.text(
+        "SELECT 1 FROM pg_indexes WHERE indexname = :i"
+    ), {"i": index_name})
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    if not _index_exists(conn, "ix_scheduled_posts_brand_status_published"):
+        op.create_index(
+            "ix_scheduled_posts_brand_status_published",
+            "scheduled_posts",
+            ["brand_id", "status", "published_at"],
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_scheduled_posts_brand_status_published", table_name="scheduled_posts")
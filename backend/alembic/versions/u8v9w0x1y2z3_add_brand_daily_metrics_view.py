@@ -0,0 +1,47 @@
+"""Add mv_brand_daily_metrics materialized view
+
+Revision ID: u8v9w0x1y2z3
+Revises: t7u8v9w0x1y2
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "u8v9w0x1y2z3"
+down_revision = "t7u8v9w0x1y2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_brand_daily_metrics AS
+        SELECT
+            sc.brand_id,
+            sc.platform,
+            (ms.snapshot_date AT TIME ZONE 'UTC')::date AS day,
+            count(*) AS snapshots_count,
+            sum(ms.impressions) AS impressions,
+            sum(ms.likes) AS likes,
+            sum(ms.comments) AS comments,
+            sum(ms.shares) AS shares,
+            sum(ms.saves) AS saves,
+            sum(ms.likes + ms.comments + ms.shares) AS engagement,
+            sum(ms.engagement_rate) AS engagement_rate_sum,
+            count(ms.engagement_rate) AS engagement_rate_count
+        FROM metrics_snapshots ms
+        JOIN social_connectors sc ON sc.id = ms.connector_id
+        WHERE ms.post_id IS NOT NULL
+        GROUP BY 1, 2, 3
+    """)
+    # Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_mv_brand_daily_metrics
+        ON mv_brand_daily_metrics (brand_id, platform, day)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_brand_daily_metrics")
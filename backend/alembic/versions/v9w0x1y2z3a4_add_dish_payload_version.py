@@ -0,0 +1,38 @@
+"""Add payload schema version to dishes
+
+Revision ID: v9w0x1y2z3a4
+Revises: u8v9w0x1y2z3
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "v9w0x1y2z3a4"
+down_revision = "u8v9w0x1y2z3"
+branch_labels = None
+depends_on = None
+
+
+def _column_exists(conn, table_name: str, column_name: str) -> bool:
+    result = conn.execute(sa.text(
+        "SELECT 1 FROM information_schema.columns WHERE table_name = :t AND column_name = :c"
+    ), {"t": table_name, "c": column_name})
+    return result.fetchone() is not None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    # Existing snapshots have no version, so they are re-encoded on first list
+    if not _column_exists(conn, "dishes", "payload_version"):
+        op.add_column(
+            "dishes",
+            sa.Column("payload_version", sa.String(16), nullable=True),
+        )
+
+
+def downgrade() -> None:
+    op.drop_column("dishes", "payload_version")
@@ -13,7 +13,7 @@ from uuid import UUID
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
+from sqlalchemy import Select, and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -22,6 +22,8 @@ from app.core.config import settings
 from app.core.security import verify_token
 from app.models.user import User, Workspace, WorkspaceMember, UserRole
 from app.models.brand import Brand
+from app.services.competitor_intel import CompetitorIntelService
+from app.services.conversation_engine import ConversationEngine
 
 logger = logging.getLogger(__name__)
 
@@ -198,7 +200,17 @@ async def get_brand(
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> Brand:
-    """Get and validate brand access for current user."""
+    """Get and validate brand access for current user.
+
+    Successful checks are memoized on the session (one per request), so
+    repeated calls within a request skip both queries.
+    """
+    cache = db.info.setdefault("brand_access", {})
+    key = (current_user.id, brand_id)
+    brand = cache.get(key)
+    if brand is not None and brand in db:
+        return brand
+
     result = await db.execute(
         select(Brand)
         .options(selectinload(Brand.voice))
@@ -225,12 +237,49 @@ async def get_brand(
             detail="You don't have access to this brand",
         )
 
+    cache[key] = brand
     return brand
 
 
+def with_brand_access(stmt: Select, brand_id_column, user_id: UUID) -> Select:
+    """Restrict ``stmt`` to rows whose brand the user can access.
+
+    Joins the brand and the user's workspace membership so authorization is
+    enforced by the same query that loads the rows, instead of a separate
+    ``get_brand`` round-trip.
+    """
+    return stmt.join(Brand, Brand.id == brand_id_column).join(
+        WorkspaceMember,
+        and_(
+            WorkspaceMember.workspace_id == Brand.workspace_id,
+            WorkspaceMember.user_id == user_id,
+        ),
+    )
+
+
+# ── App-wide Services ───────────────────────────────────────────
+# Built once in the application lifespan and stored on app.state. The
+# fallback covers apps served without lifespan events (e.g. ASGITransport).
+
+async def get_conversation_engine(request: Request) -> ConversationEngine:
+    engine = getattr(request.app.state, "conversation_engine", None)
+    if engine is None:
+        engine = request.app.state.conversation_engine = ConversationEngine()
+    return engine
+
+
+async def get_competitor_service(request: Request) -> CompetitorIntelService:
+    service = getattr(request.app.state, "competitor_service", None)
+    if service is None:
+        service = request.app.state.competitor_service = CompetitorIntelService()
+    return service
+
+
 # Type aliases for cleaner endpoint signatures
 CurrentUser = Annotated[User, Depends(get_current_user)]
 CurrentWorkspace = Annotated[Workspace, Depends(get_current_workspace)]
 AdminWorkspace = Annotated[Workspace, Depends(get_workspace_admin)]
 CurrentBrand = Annotated[Brand, Depends(get_brand)]
 DBSession = Annotated[AsyncSession, Depends(get_db)]
+ConversationEngineDep = Annotated[ConversationEngine, Depends(get_conversation_engine)]
+CompetitorService = Annotated[CompetitorIntelService, Depends(get_competitor_service)]
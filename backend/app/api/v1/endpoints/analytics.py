@@ -3,6 +3,8 @@ PresenceOS — Analytics Dashboard API (Feature 9)
 
 Unified cross-platform analytics endpoints.
 """
+from functools import lru_cache
+
 import structlog
 from fastapi import APIRouter, Query
 
@@ -11,14 +13,10 @@ from app.services.analytics_engine import AnalyticsEngineService
 logger = structlog.get_logger()
 router = APIRouter()
 
-_service: AnalyticsEngineService | None = None
-
 
+@lru_cache(maxsize=1)
 def _get_service() -> AnalyticsEngineService:
-    global _service
-    if _service is None:
-        _service = AnalyticsEngineService()
-    return _service
+    return AnalyticsEngineService()
 
 
 @router.get("/overview/{brand_id}")
@@ -3,10 +3,11 @@ PresenceOS - Autopilot API Endpoints (Sprint 9)
 """
 import structlog
 from datetime import datetime, timezone, timedelta
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import APIRouter, HTTPException, Query, status
-from sqlalchemy import select
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.orm import selectinload
 
 from app.api.v1.deps import CurrentUser, CurrentBrand, DBSession
@@ -54,7 +55,7 @@ async def get_autopilot_config(
 ):
     """Get autopilot configuration for a brand."""
     result = await db.execute(
-        select(AutopilotConfig).where(AutopilotConfig.brand_id == brand.id)
+        _config_for_brand(brand.id)
     )
     config = result.scalar_one_or_none()
 
@@ -81,7 +82,7 @@ async def create_autopilot_config(
     """Create autopilot configuration for a brand."""
     # Check if config already exists
     existing = await db.execute(
-        select(AutopilotConfig).where(AutopilotConfig.brand_id == brand.id)
+        _config_for_brand(brand.id)
     )
     if existing.scalar_one_or_none():
         raise HTTPException(
@@ -90,6 +91,7 @@ async def create_autopilot_config(
         )
 
     frequency = FREQUENCY_MAP.get(data.frequency, AutopilotFrequency.DAILY)
+    posting_hour, posting_minute = _parse_posting_time(data.preferred_posting_time)
 
     config = AutopilotConfig(
         brand_id=brand.id,
@@ -102,6 +104,8 @@ async def create_autopilot_config(
         whatsapp_enabled=data.whatsapp_enabled,
         whatsapp_phone=data.whatsapp_phone,
         preferred_posting_time=data.preferred_posting_time,
+        preferred_posting_hour=posting_hour,
+        preferred_posting_minute=posting_minute,
         topics=data.topics,
     )
     db.add(config)
@@ -120,7 +124,7 @@ async def update_autopilot_config(
 ):
     """Update autopilot configuration."""
     result = await db.execute(
-        select(AutopilotConfig).where(AutopilotConfig.brand_id == brand.id)
+        _config_for_brand(brand.id)
     )
     config = result.scalar_one_or_none()
 
@@ -138,6 +142,13 @@ async def update_autopilot_config(
             update_data["frequency"], AutopilotFrequency.DAILY
         )
 
+    # Keep the parsed posting hour/minute in sync with the "HH:MM" string
+    if "preferred_posting_time" in update_data:
+        (
+            update_data["preferred_posting_hour"],
+            update_data["preferred_posting_minute"],
+        ) = _parse_posting_time(update_data["preferred_posting_time"])
+
     for field, value in update_data.items():
         setattr(config, field, value)
 
@@ -155,7 +166,7 @@ async def toggle_autopilot(
 ):
     """Toggle autopilot on/off."""
     result = await db.execute(
-        select(AutopilotConfig).where(AutopilotConfig.brand_id == brand.id)
+        _config_for_brand(brand.id)
     )
     config = result.scalar_one_or_none()
 
@@ -175,9 +186,32 @@ async def toggle_autopilot(
 # ── Pending Posts ────────────────────────────────────────────────────
 
 
+# Columns matching PendingPostResponse, selected as plain rows so the list
+# endpoint skips ORM instantiation and Pydantic re-validation.
+_PENDING_POST_COLUMNS = (
+    PendingPost.id,
+    PendingPost.config_id,
+    PendingPost.brand_id,
+    PendingPost.platform,
+    PendingPost.caption,
+    PendingPost.hashtags,
+    PendingPost.media_urls,
+    PendingPost.ai_reasoning,
+    PendingPost.virality_score,
+    PendingPost.status,
+    PendingPost.whatsapp_message_id,
+    PendingPost.reviewed_at,
+    PendingPost.expires_at,
+    PendingPost.scheduled_post_id,
+    PendingPost.created_at,
+    PendingPost.updated_at,
+)
+
+
 @router.get(
     "/brands/{brand_id}/autopilot/pending",
-    response_model=list[PendingPostResponse],
+    response_model=None,
+    responses={200: {"model": list[PendingPostResponse]}},
 )
 async def list_pending_posts(
     brand: CurrentBrand,
@@ -188,9 +222,10 @@ async def list_pending_posts(
     offset: int = Query(0, ge=0),
 ):
     """List pending posts for a brand."""
-    query = (
-        select(PendingPost)
-        .where(PendingPost.brand_id == brand.id)
+    brand_id = brand.id
+    query = lambda_stmt(
+        lambda: select(*_PENDING_POST_COLUMNS)
+        .where(PendingPost.brand_id == brand_id)
         .order_by(PendingPost.created_at.desc())
         .limit(limit)
         .offset(offset)
@@ -199,12 +234,12 @@ async def list_pending_posts(
     if status_filter:
         try:
             status_enum = PendingPostStatus(status_filter)
-            query = query.where(PendingPost.status == status_enum)
+            query += lambda q: q.where(PendingPost.status == status_enum)
         except ValueError:
             pass
 
     result = await db.execute(query)
-    return result.scalars().all()
+    return ORJSONResponse(content=[dict(row) for row in result.mappings().all()])
 
 
 @router.get(
@@ -294,16 +329,14 @@ async def action_pending_post(
 
     # Determine posting time
     posting_time = datetime.now(timezone.utc)
-    if pending.config and pending.config.preferred_posting_time:
-        try:
-            h, m = pending.config.preferred_posting_time.split(":")
-            posting_time = posting_time.replace(
-                hour=int(h), minute=int(m), second=0
-            )
-            if posting_time < datetime.now(timezone.utc):
-                posting_time += timedelta(days=1)
-        except ValueError:
-            pass
+    if pending.config and pending.config.preferred_posting_hour is not None:
+        posting_time = posting_time.replace(
+            hour=pending.config.preferred_posting_hour,
+            minute=pending.config.preferred_posting_minute or 0,
+            second=0,
+        )
+        if posting_time < datetime.now(timezone.utc):
+            posting_time += timedelta(days=1)
 
     # Create scheduled post
     scheduled = ScheduledPost(
@@ -347,7 +380,7 @@ async def trigger_generation(
     from app.services.whatsapp import WhatsAppService
 
     result = await db.execute(
-        select(AutopilotConfig).where(AutopilotConfig.brand_id == brand.id)
+        _config_for_brand(brand.id)
     )
     config = result.scalar_one_or_none()
 
@@ -387,6 +420,7 @@ async def trigger_generation(
             )
 
             pending = PendingPost(
+                id=uuid4(),  # known before flush, for the WhatsApp callback
                 config_id=config.id,
                 brand_id=brand.id,
                 platform=platform,
@@ -397,22 +431,6 @@ async def trigger_generation(
                 status=PendingPostStatus.PENDING,
                 expires_at=expires_at,
             )
-            db.add(pending)
-            await db.flush()
-
-            config.total_generated += 1
-
-            # Send WhatsApp
-            if config.whatsapp_enabled and config.whatsapp_phone:
-                wamid = await wa.send_approval_message(
-                    to_phone=config.whatsapp_phone,
-                    pending_post_id=str(pending.id),
-                    platform=platform,
-                    caption_preview=caption,
-                )
-                if wamid:
-                    pending.whatsapp_message_id = wamid
-
             created.append(pending)
 
         except Exception as e:
@@ -423,6 +441,31 @@ async def trigger_generation(
                 error=str(e),
             )
 
+    # Single multi-row INSERT for all generated posts
+    db.add_all(created)
+    await db.flush()
+    config.total_generated += len(created)
+
+    # Send WhatsApp
+    if config.whatsapp_enabled and config.whatsapp_phone:
+        for pending in created:
+            try:
+                wamid = await wa.send_approval_message(
+                    to_phone=config.whatsapp_phone,
+                    pending_post_id=str(pending.id),
+                    platform=pending.platform,
+                    caption_preview=pending.caption,
+                )
+                if wamid:
+                    pending.whatsapp_message_id = wamid
+            except Exception as e:
+                logger.error(
+                    "Approval message failed",
+                    brand_id=str(brand.id),
+                    platform=pending.platform,
+                    error=str(e),
+                )
+
     await db.commit()
 
     # Refresh all
@@ -435,6 +478,27 @@ async def trigger_generation(
 # ── Helpers ──────────────────────────────────────────────────────────
 
 
+def _config_for_brand(brand_id: UUID):
+    """Cached-shape lookup of a brand's AutopilotConfig (only brand_id varies)."""
+    return lambda_stmt(
+        lambda: select(AutopilotConfig).where(AutopilotConfig.brand_id == brand_id)
+    )
+
+
+def _parse_posting_time(value: str | None) -> tuple[int | None, int | None]:
+    """Parse an "HH:MM" posting time into (hour, minute), or (None, None)."""
+    if not value:
+        return None, None
+    try:
+        h, m = value.split(":")
+        hour, minute = int(h), int(m)
+    except ValueError:
+        return None, None
+    if not (0 <= hour <= 23 and 0 <= minute <= 59):
+        return None, None
+    return hour, minute
+
+
 def _str_to_platform(platform_str: str) -> SocialPlatform:
     mapping = {
         "instagram": SocialPlatform.INSTAGRAM,
@@ -8,8 +8,9 @@ from uuid import UUID
 
 import structlog
 from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel, Field
-from sqlalchemy import select
+from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.api.v1.deps import CurrentUser, DBSession, get_brand
 from app.models.daily_brief import DailyBrief, BriefStatus
@@ -22,35 +23,53 @@ router = APIRouter()
 
 
 class BriefResponse(BaseModel):
-    id: str
-    brand_id: str
-    date: str
+    id: UUID
+    brand_id: UUID
+    date: date
     response: str | None
     status: str
-    responded_at: str | None
-    generated_proposal_id: str | None
-    notif_sent_at: str | None
-    created_at: str
-
-    @classmethod
-    def from_orm(cls, obj: DailyBrief) -> "BriefResponse":
-        return cls(
-            id=str(obj.id),
-            brand_id=str(obj.brand_id),
-            date=obj.date.isoformat(),
-            response=obj.response,
-            status=obj.status,
-            responded_at=obj.responded_at.isoformat() if obj.responded_at else None,
-            generated_proposal_id=str(obj.generated_proposal_id) if obj.generated_proposal_id else None,
-            notif_sent_at=obj.notif_sent_at.isoformat() if obj.notif_sent_at else None,
-            created_at=obj.created_at.isoformat(),
-        )
+    responded_at: datetime | None
+    generated_proposal_id: UUID | None
+    notif_sent_at: datetime | None
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BriefRespondRequest(BaseModel):
     response: str = Field(..., min_length=1, max_length=2000)
 
 
+# ── Helpers ──────────────────────────────────────────────────────────────
+
+
+async def _get_or_create_brief(db, brand_id: UUID, day: date) -> DailyBrief:
+    """Return the brand's brief for ``day``, creating it if missing.
+
+    Relies on the (brand_id, date) unique constraint so concurrent callers
+    can't create duplicates: the INSERT is a no-op when the row exists, in
+    which case we fall back to reading it.
+    """
+    stmt = (
+        pg_insert(DailyBrief)
+        .values(brand_id=brand_id, date=day, status=BriefStatus.PENDING.value)
+        .on_conflict_do_nothing(index_elements=["brand_id", "date"])
+        .returning(DailyBrief)
+    )
+    brief = (await db.execute(stmt)).scalar_one_or_none()
+    if brief is None:
+        result = await db.execute(
+            lambda_stmt(
+                lambda: select(DailyBrief).where(
+                    DailyBrief.brand_id == brand_id,
+                    DailyBrief.date == day,
+                )
+            )
+        )
+        brief = result.scalar_one()
+    return brief
+
+
 # ── Endpoints ────────────────────────────────────────────────────────────
 
 
@@ -63,26 +82,11 @@ async def get_today_brief(
     """Get today's brief status for a brand."""
     await get_brand(brand_id, current_user, db)
 
-    today = date.today()
-    stmt = select(DailyBrief).where(
-        DailyBrief.brand_id == brand_id,
-        DailyBrief.date == today,
-    )
-    result = await db.execute(stmt)
-    brief = result.scalar_one_or_none()
-
-    if not brief:
-        # Create one on the fly if not yet created (before 8 AM beat)
-        brief = DailyBrief(
-            brand_id=brand_id,
-            date=today,
-            status=BriefStatus.PENDING.value,
-        )
-        db.add(brief)
-        await db.commit()
-        await db.refresh(brief)
+    # Create one on the fly if not yet created (before 8 AM beat)
+    brief = await _get_or_create_brief(db, brand_id, date.today())
+    await db.commit()
 
-    return BriefResponse.from_orm(brief)
+    return BriefResponse.model_validate(brief)
 
 
 @router.post("/{brand_id}/respond")
@@ -98,22 +102,7 @@ async def respond_to_brief(
     """
     await get_brand(brand_id, current_user, db)
 
-    today = date.today()
-    stmt = select(DailyBrief).where(
-        DailyBrief.brand_id == brand_id,
-        DailyBrief.date == today,
-    )
-    result = await db.execute(stmt)
-    brief = result.scalar_one_or_none()
-
-    if not brief:
-        brief = DailyBrief(
-            brand_id=brand_id,
-            date=today,
-            status=BriefStatus.PENDING.value,
-        )
-        db.add(brief)
-        await db.flush()
+    brief = await _get_or_create_brief(db, brand_id, date.today())
 
     if brief.status == BriefStatus.ANSWERED.value:
         raise HTTPException(
@@ -141,4 +130,4 @@ async def respond_to_brief(
         brand_id=str(brand_id),
         brief_id=str(brief.id),
     )
-    return BriefResponse.from_orm(brief)
+    return BriefResponse.model_validate(brief)
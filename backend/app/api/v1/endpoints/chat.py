@@ -4,9 +4,14 @@ PresenceOS - Content Studio Chat API
 Web-based endpoints that route through ConversationEngine
 using WebChatService to accumulate responses.
 """
+import asyncio
 import os
+import shutil
+import time
 import uuid
-from typing import Optional
+from pathlib import Path
+from types import MappingProxyType
+from typing import BinaryIO, Callable, Optional
 
 import structlog
 from fastapi import APIRouter, File, UploadFile, HTTPException, Depends
@@ -14,30 +19,35 @@ from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.v1.deps import ConversationEngineDep
 from app.core.database import get_db
 from app.models.autopilot import AutopilotConfig
 from app.models.brand import Brand
-from app.services.conversation_engine import ConversationEngine
 from app.services.webchat import WebChatService
 
 logger = structlog.get_logger()
 router = APIRouter()
 
 UPLOAD_DIR = "/tmp/presenceos/uploads"
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+MIME_MAP = MappingProxyType({
+    "jpg": "image/jpeg", "jpeg": "image/jpeg",
+    "png": "image/png", "gif": "image/gif",
+    "webp": "image/webp", "mp4": "video/mp4",
+    "mov": "video/quicktime", "ogg": "audio/ogg",
+    "webm": "video/webm",
+})
+DEFAULT_MIME = "image/jpeg"
 
 # Fallback IDs when DB is not available
 FALLBACK_BRAND_ID = "dev-brand"
 FALLBACK_CONFIG_ID = "dev-config"
 
-# Singleton engine
-_conversation_engine: ConversationEngine | None = None
-
-
-def _get_engine() -> ConversationEngine:
-    global _conversation_engine
-    if _conversation_engine is None:
-        _conversation_engine = ConversationEngine()
-    return _conversation_engine
+# Resolved (brand_id, config_id) memo: the lookup has no parameters, so one
+# entry serves every request until it expires.
+RESOLVED_BRAND_TTL_SECONDS = 60
+_resolved_brand: tuple[float, tuple[str, str]] | None = None
 
 
 class ChatMessageRequest(BaseModel):
@@ -49,6 +59,20 @@ class ChatMessageRequest(BaseModel):
     session_id: str | None = None
 
 
+# Normalized WhatsApp-style message builders, keyed by msg_type
+MESSAGE_BUILDERS: dict[str, Callable[[ChatMessageRequest], dict]] = {
+    "text": lambda r: {"text": {"body": r.text or ""}},
+    "interactive": lambda r: {
+        "interactive": {
+            "type": "button_reply",
+            "button_reply": {"id": r.button_id or ""},
+        }
+    },
+    "image": lambda r: {"image": {"id": r.media_id or "", "caption": r.text or ""}},
+    "video": lambda r: {"video": {"id": r.media_id or "", "caption": r.text or ""}},
+}
+
+
 class ChatResponse(BaseModel):
     messages: list[dict]
     session_id: str
@@ -60,6 +84,13 @@ class UploadResponse(BaseModel):
     mime_type: str
 
 
+def _copy_upload(src: BinaryIO, filepath: str) -> None:
+    """Copy an upload's file object to ``filepath`` in 64 KB chunks."""
+    src.seek(0)
+    with open(filepath, "wb") as out:
+        shutil.copyfileobj(src, out, UPLOAD_CHUNK_SIZE)
+
+
 async def _get_optional_db():
     """Yield a DB session if available, None otherwise."""
     try:
@@ -72,9 +103,15 @@ async def _get_optional_db():
 
 async def _resolve_brand(db: Optional[AsyncSession]) -> tuple[str, str]:
     """Find brand_id and config_id. Falls back to dev IDs if no DB."""
+    global _resolved_brand
     if db is None:
         return FALLBACK_BRAND_ID, FALLBACK_CONFIG_ID
 
+    if _resolved_brand is not None:
+        expires_at, ids = _resolved_brand
+        if time.monotonic() < expires_at:
+            return ids
+
     try:
         result = await db.execute(
             select(Brand).where(Brand.is_active == True).limit(1)
@@ -89,7 +126,9 @@ async def _resolve_brand(db: Optional[AsyncSession]) -> tuple[str, str]:
         )
         config = result.scalar_one_or_none()
         config_id = str(config.id) if config else str(brand.id)
-        return str(brand.id), config_id
+        ids = (str(brand.id), config_id)
+        _resolved_brand = (time.monotonic() + RESOLVED_BRAND_TTL_SECONDS, ids)
+        return ids
     except Exception:
         return FALLBACK_BRAND_ID, FALLBACK_CONFIG_ID
 
@@ -97,6 +136,7 @@ async def _resolve_brand(db: Optional[AsyncSession]) -> tuple[str, str]:
 @router.post("/message", response_model=ChatResponse)
 async def send_message(
     request: ChatMessageRequest,
+    engine: ConversationEngineDep,
     db: Optional[AsyncSession] = Depends(_get_optional_db),
 ):
     """Send a message through ConversationEngine and get AI responses."""
@@ -105,47 +145,23 @@ async def send_message(
     session_id = request.session_id or "web:test-user"
     webchat = WebChatService()
 
-    # Build normalized message based on type
-    if request.msg_type == "text":
-        message = {"text": {"body": request.text or ""}}
-
-    elif request.msg_type == "interactive":
-        message = {
-            "interactive": {
-                "type": "button_reply",
-                "button_reply": {"id": request.button_id or ""},
-            }
-        }
-
-    elif request.msg_type in ("image", "video"):
-        message = {
-            request.msg_type: {
-                "id": request.media_id or "",
-                "caption": request.text or "",
-            }
-        }
-    else:
-        message = {"text": {"body": request.text or ""}}
+    # Build normalized message based on type (unknown types become text)
+    builder = MESSAGE_BUILDERS.get(request.msg_type)
+    if builder is None:
         request.msg_type = "text"
+        builder = MESSAGE_BUILDERS["text"]
+    message = builder(request)
 
     # Create a media downloader for local files
     async def web_media_downloader(media_id: str):
         path = os.path.join(UPLOAD_DIR, media_id)
-        if not os.path.exists(path):
+        try:
+            data = await asyncio.to_thread(Path(path).read_bytes)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Upload not found: {media_id}")
-        with open(path, "rb") as f:
-            data = f.read()
-        ext = media_id.rsplit(".", 1)[-1].lower()
-        mime_map = {
-            "jpg": "image/jpeg", "jpeg": "image/jpeg",
-            "png": "image/png", "gif": "image/gif",
-            "webp": "image/webp", "mp4": "video/mp4",
-            "mov": "video/quicktime", "ogg": "audio/ogg",
-            "webm": "video/webm",
-        }
-        return data, mime_map.get(ext, "image/jpeg")
+        ext = media_id.rpartition(".")[2].lower()
+        return data, MIME_MAP.get(ext, DEFAULT_MIME)
 
-    engine = _get_engine()
     try:
         await engine.handle_message(
             sender_phone=session_id,
@@ -180,9 +196,8 @@ async def upload_media(
     filename = f"{uuid.uuid4()}.{ext}"
     filepath = os.path.join(UPLOAD_DIR, filename)
 
-    content = await file.read()
-    with open(filepath, "wb") as f:
-        f.write(content)
+    # Stream the spooled upload to disk in chunks, off the event loop
+    await asyncio.to_thread(_copy_upload, file.file, filepath)
 
     mime = file.content_type or "image/jpeg"
 
@@ -9,14 +9,15 @@ from typing import Any
 from uuid import UUID
 
 import structlog
-from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel, Field
-from sqlalchemy import func, select, and_
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status
+from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy import and_, func, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.v1.deps import CurrentUser, DBSession, get_brand
+from app.api.v1.deps import CurrentUser, DBSession, get_brand, with_brand_access
 from app.models.brand import Brand
 from app.models.cm_interaction import CMInteraction
+from app.models.user import WorkspaceMember
 from app.workers.cm_tasks import publish_google_reply
 
 logger = structlog.get_logger()
@@ -45,8 +46,8 @@ class GoogleConnectRequest(BaseModel):
 
 
 class InteractionResponse(BaseModel):
-    id: str
-    brand_id: str
+    id: UUID
+    brand_id: UUID
     platform: str
     interaction_type: str
     external_id: str
@@ -61,35 +62,12 @@ class InteractionResponse(BaseModel):
     final_response: str | None
     response_status: str
     human_rating: int | None
-    published_at: str | None
-    created_at: str
-    updated_at: str
+    published_at: datetime | None
+    created_at: datetime
+    updated_at: datetime
     extra_metadata: dict | None
 
-    @classmethod
-    def from_orm(cls, obj: CMInteraction) -> "InteractionResponse":
-        return cls(
-            id=str(obj.id),
-            brand_id=str(obj.brand_id),
-            platform=obj.platform,
-            interaction_type=obj.interaction_type,
-            external_id=obj.external_id,
-            commenter_name=obj.commenter_name,
-            content=obj.content,
-            rating=obj.rating,
-            sentiment_score=obj.sentiment_score,
-            classification=obj.classification,
-            confidence_score=obj.confidence_score,
-            ai_response_draft=obj.ai_response_draft,
-            ai_reasoning=obj.ai_reasoning,
-            final_response=obj.final_response,
-            response_status=obj.response_status,
-            human_rating=obj.human_rating,
-            published_at=obj.published_at.isoformat() if obj.published_at else None,
-            created_at=obj.created_at.isoformat(),
-            updated_at=obj.updated_at.isoformat(),
-            extra_metadata=obj.extra_metadata,
-        )
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
@@ -100,16 +78,50 @@ async def _get_interaction(
     current_user,
     db: AsyncSession,
 ) -> CMInteraction:
-    """Load an interaction and verify the user has access to its brand."""
+    """Load an interaction the user can access through its brand.
+
+    Existence and authorization are checked by one query; an interaction on
+    a brand outside the user's workspaces is reported as not found.
+    """
     result = await db.execute(
-        select(CMInteraction).where(CMInteraction.id == interaction_id)
+        with_brand_access(
+            select(CMInteraction), CMInteraction.brand_id, current_user.id
+        ).where(CMInteraction.id == interaction_id)
     )
     interaction = result.scalar_one_or_none()
     if not interaction:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Interaction not found")
+    return interaction
+
+
+async def _update_interaction(
+    interaction_id: UUID,
+    current_user,
+    db: AsyncSession,
+    **values: Any,
+) -> CMInteraction:
+    """Update an interaction the user can access and return the new row.
 
-    # Verify brand access
-    await get_brand(interaction.brand_id, current_user, db)
+    Authorization, the write and the read-back happen in a single
+    ``UPDATE ... RETURNING`` statement.
+    """
+    accessible_brands = (
+        select(Brand.id)
+        .join(WorkspaceMember, WorkspaceMember.workspace_id == Brand.workspace_id)
+        .where(WorkspaceMember.user_id == current_user.id)
+    )
+    result = await db.execute(
+        update(CMInteraction)
+        .where(
+            CMInteraction.id == interaction_id,
+            CMInteraction.brand_id.in_(accessible_brands),
+        )
+        .values(**values)
+        .returning(CMInteraction)
+    )
+    interaction = result.scalar_one_or_none()
+    if not interaction:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Interaction not found")
     return interaction
 
 
@@ -128,9 +140,6 @@ async def list_interactions(
     offset: int = 0,
 ) -> dict:
     """List interactions with filtering and pagination."""
-    # Verify brand access
-    await get_brand(brand_id, current_user, db)
-
     conditions = [CMInteraction.brand_id == brand_id]
     if platform:
         conditions.append(CMInteraction.platform == platform)
@@ -139,24 +148,45 @@ async def list_interactions(
     if classification:
         conditions.append(CMInteraction.classification == classification)
 
-    # Count total
-    count_result = await db.execute(
-        select(func.count(CMInteraction.id)).where(and_(*conditions))
+    # Brand access, total count and page rows in a single round-trip.
+    # lambda_stmt caches the statement per filter combination so only the
+    # bound values change between requests.
+    user_id = current_user.id
+    page_size = min(limit, 100)
+    stmt = lambda_stmt(
+        lambda: with_brand_access(
+            select(CMInteraction, func.count().over().label("total")),
+            CMInteraction.brand_id,
+            user_id,
+        ).where(CMInteraction.brand_id == brand_id)
     )
-    total = count_result.scalar()
-
-    # Fetch page
-    result = await db.execute(
-        select(CMInteraction)
-        .where(and_(*conditions))
-        .order_by(CMInteraction.created_at.desc())
-        .limit(min(limit, 100))
-        .offset(offset)
+    if platform:
+        stmt += lambda s: s.where(CMInteraction.platform == platform)
+    if response_status:
+        stmt += lambda s: s.where(CMInteraction.response_status == response_status)
+    if classification:
+        stmt += lambda s: s.where(CMInteraction.classification == classification)
+    stmt += lambda s: (
+        s.order_by(CMInteraction.created_at.desc()).limit(page_size).offset(offset)
     )
-    interactions = result.scalars().all()
+
+    result = await db.execute(stmt)
+    rows = result.all()
+
+    if rows:
+        total = rows[0].total
+        interactions = [row.CMInteraction for row in rows]
+    else:
+        # Empty page: tell "no access" apart from "no results"
+        await get_brand(brand_id, current_user, db)
+        count_result = await db.execute(
+            select(func.count(CMInteraction.id)).where(and_(*conditions))
+        )
+        total = count_result.scalar()
+        interactions = []
 
     return {
-        "interactions": [InteractionResponse.from_orm(i) for i in interactions],
+        "interactions": [InteractionResponse.model_validate(i) for i in interactions],
         "total": total,
         "limit": limit,
         "offset": offset,
@@ -171,7 +201,7 @@ async def get_interaction(
 ) -> InteractionResponse:
     """Get detail of a single interaction."""
     interaction = await _get_interaction(interaction_id, current_user, db)
-    return InteractionResponse.from_orm(interaction)
+    return InteractionResponse.model_validate(interaction)
 
 
 @router.post("/interactions/{interaction_id}/approve")
@@ -180,6 +210,7 @@ async def approve_interaction(
     body: ApproveRequest,
     current_user: CurrentUser,
     db: DBSession,
+    background_tasks: BackgroundTasks,
 ) -> InteractionResponse:
     """Approve an interaction's AI response (or provide an edited version).
 
@@ -206,18 +237,19 @@ async def approve_interaction(
     interaction.response_status = status_value
 
     await db.commit()
-    await db.refresh(interaction)
+    await db.close()
 
-    # Dispatch publishing task
+    # Dispatch publishing task once the response is sent; the sync broker
+    # call then runs in the threadpool, off the request's critical path
     if interaction.platform == "google":
-        publish_google_reply.delay(str(interaction.id))
+        background_tasks.add_task(publish_google_reply.delay, str(interaction.id))
 
     logger.info(
         "Interaction approved",
         interaction_id=str(interaction_id),
         status=status_value,
     )
-    return InteractionResponse.from_orm(interaction)
+    return InteractionResponse.model_validate(interaction)
 
 
 @router.post("/interactions/{interaction_id}/reject")
@@ -227,11 +259,11 @@ async def reject_interaction(
     db: DBSession,
 ) -> InteractionResponse:
     """Reject an interaction's AI response."""
-    interaction = await _get_interaction(interaction_id, current_user, db)
-    interaction.response_status = "rejected"
+    interaction = await _update_interaction(
+        interaction_id, current_user, db, response_status="rejected"
+    )
     await db.commit()
-    await db.refresh(interaction)
-    return InteractionResponse.from_orm(interaction)
+    return InteractionResponse.model_validate(interaction)
 
 
 @router.post("/interactions/{interaction_id}/rate")
@@ -242,11 +274,11 @@ async def rate_interaction(
     db: DBSession,
 ) -> InteractionResponse:
     """Submit human feedback (thumbs up/down) on an AI response."""
-    interaction = await _get_interaction(interaction_id, current_user, db)
-    interaction.human_rating = body.rating
+    interaction = await _update_interaction(
+        interaction_id, current_user, db, human_rating=body.rating
+    )
     await db.commit()
-    await db.refresh(interaction)
-    return InteractionResponse.from_orm(interaction)
+    return InteractionResponse.model_validate(interaction)
 
 
 @router.post("/google/connect")
@@ -292,39 +324,32 @@ async def get_cm_stats(
         CMInteraction.created_at >= since,
     ]
 
-    # Total interactions
-    total_result = await db.execute(
-        select(func.count(CMInteraction.id)).where(and_(*base_conditions))
-    )
-    total = total_result.scalar() or 0
-
-    # By status
-    status_result = await db.execute(
+    # One grouped scan yields total, per-status, per-classification and
+    # sentiment sum instead of four sequential queries.
+    result = await db.execute(
         select(
             CMInteraction.response_status,
+            CMInteraction.classification,
             func.count(CMInteraction.id),
+            func.sum(CMInteraction.sentiment_score),
         )
         .where(and_(*base_conditions))
-        .group_by(CMInteraction.response_status)
+        .group_by(CMInteraction.response_status, CMInteraction.classification)
     )
-    status_counts = {row[0]: row[1] for row in status_result.all()}
 
-    # By classification
-    class_result = await db.execute(
-        select(
-            CMInteraction.classification,
-            func.count(CMInteraction.id),
+    total = 0
+    sentiment_sum = 0.0
+    status_counts: dict[str, int] = {}
+    classification_counts: dict[str, int] = {}
+    for response_status, classification, count, sentiment in result.all():
+        total += count
+        sentiment_sum += sentiment or 0.0
+        status_counts[response_status] = status_counts.get(response_status, 0) + count
+        classification_counts[classification] = (
+            classification_counts.get(classification, 0) + count
         )
-        .where(and_(*base_conditions))
-        .group_by(CMInteraction.classification)
-    )
-    classification_counts = {row[0]: row[1] for row in class_result.all()}
 
-    # Average sentiment
-    avg_result = await db.execute(
-        select(func.avg(CMInteraction.sentiment_score)).where(and_(*base_conditions))
-    )
-    avg_sentiment = avg_result.scalar()
+    avg_sentiment = sentiment_sum / total if total else None
 
     # Response rate
     published_count = (
@@ -1,23 +1,20 @@
 """
 PresenceOS — Competitor Intelligence API (Feature 5)
 """
+from typing import Any, Callable
+
 import structlog
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
-from app.services.competitor_intel import CompetitorIntelService
+from app.api.v1.deps import CompetitorService
+from app.utils.http_cache import etag_matches, not_modified
 
 logger = structlog.get_logger()
 router = APIRouter()
 
-_service: CompetitorIntelService | None = None
-
-
-def _get_service() -> CompetitorIntelService:
-    global _service
-    if _service is None:
-        _service = CompetitorIntelService()
-    return _service
+CACHE_CONTROL = "private, max-age=30"
 
 
 class AddCompetitorRequest(BaseModel):
@@ -26,31 +23,52 @@ class AddCompetitorRequest(BaseModel):
     platform: str = "instagram"
 
 
+def _conditional_response(
+    request: Request, etag: str, build: Callable[[], Any]
+) -> Response:
+    """Answer 304 when the client's validator matches, else the built payload."""
+    if etag_matches(request, etag):
+        return not_modified(etag, CACHE_CONTROL)
+    return ORJSONResponse(
+        build(), headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    )
+
+
 @router.get("/list/{brand_id}")
-async def get_competitors(brand_id: str):
+async def get_competitors(
+    brand_id: str, request: Request, service: CompetitorService
+) -> Response:
     """List tracked competitors for a brand."""
-    service = _get_service()
-    return service.get_competitors(brand_id)
+    etag = f'W/"{service.get_version_tag(brand_id)}"'
+    return _conditional_response(
+        request, etag, lambda: service.get_competitors(brand_id)
+    )
 
 
 @router.post("/track/{brand_id}")
-async def add_competitor(brand_id: str, request: AddCompetitorRequest):
+async def add_competitor(
+    brand_id: str, request: AddCompetitorRequest, service: CompetitorService
+):
     """Add a competitor to track."""
-    service = _get_service()
     return service.add_competitor(brand_id, request.name, request.handle, request.platform)
 
 
 @router.delete("/untrack/{brand_id}/{competitor_id}")
-async def remove_competitor(brand_id: str, competitor_id: str):
+async def remove_competitor(
+    brand_id: str, competitor_id: str, service: CompetitorService
+):
     """Stop tracking a competitor."""
-    service = _get_service()
     if not service.remove_competitor(brand_id, competitor_id):
         raise HTTPException(status_code=404, detail="Concurrent non trouve")
     return {"status": "removed", "competitor_id": competitor_id}
 
 
 @router.get("/benchmark/{brand_id}")
-async def get_benchmark(brand_id: str):
+async def get_benchmark(
+    brand_id: str, request: Request, service: CompetitorService
+) -> Response:
     """Compare your brand against tracked competitors."""
-    service = _get_service()
-    return service.get_benchmark(brand_id)
+    etag = f'W/"{service.get_version_tag(brand_id)}"'
+    return _conditional_response(
+        request, etag, lambda: service.get_benchmark(brand_id)
+    )
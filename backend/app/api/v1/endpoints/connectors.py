@@ -1,10 +1,13 @@
 """
 PresenceOS - Social Connectors Endpoints
 """
+from typing import Any
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.deps import CurrentUser, DBSession, get_brand
 from app.models.publishing import SocialConnector, SocialPlatform, ConnectorStatus
@@ -21,6 +24,29 @@ from app.connectors.factory import get_connector_handler
 router = APIRouter()
 
 
+async def _upsert_connector(
+    db: AsyncSession,
+    values: dict[str, Any],
+    on_conflict: dict[str, Any],
+) -> SocialConnector:
+    """Insert a connector, or apply ``on_conflict`` to the existing one.
+
+    Keyed on the (brand_id, platform, account_id) unique constraint, so a
+    reconnect is a single INSERT ... ON CONFLICT DO UPDATE ... RETURNING.
+    """
+    stmt = (
+        pg_insert(SocialConnector)
+        .values(**values)
+        .on_conflict_do_update(
+            constraint="uq_social_connector_brand_platform_account",
+            # ON CONFLICT bypasses Python-side onupdate, so stamp it here
+            set_={**on_conflict, "updated_at": func.now()},
+        )
+        .returning(SocialConnector)
+    )
+    return (await db.execute(stmt)).scalar_one()
+
+
 @router.get("/brands/{brand_id}", response_model=list[ConnectorListResponse])
 async def list_connectors(
     brand_id: UUID,
@@ -67,6 +93,9 @@ async def oauth_callback(
 
     handler = get_connector_handler(data.platform)
 
+    # Release the connection while talking to the platform
+    await db.close()
+
     try:
         # Exchange code for tokens
         token_data = await handler.exchange_code(
@@ -77,52 +106,41 @@ async def oauth_callback(
         # Get account info
         account_info = await handler.get_account_info(token_data["access_token"])
 
-        # Check if connector already exists for this account
-        existing = await db.execute(
-            select(SocialConnector).where(
-                SocialConnector.brand_id == brand_id,
-                SocialConnector.platform == data.platform,
-                SocialConnector.account_id == account_info["account_id"],
-            )
+        access_token_encrypted = handler.encrypt_token(token_data["access_token"])
+        refresh_token_encrypted = (
+            handler.encrypt_token(token_data["refresh_token"])
+            if token_data.get("refresh_token")
+            else None
         )
-        connector = existing.scalar_one_or_none()
 
-        if connector:
-            # Update existing connector
-            connector.access_token_encrypted = handler.encrypt_token(
-                token_data["access_token"]
-            )
-            if token_data.get("refresh_token"):
-                connector.refresh_token_encrypted = handler.encrypt_token(
-                    token_data["refresh_token"]
-                )
-            connector.token_expires_at = token_data.get("expires_at")
-            connector.status = ConnectorStatus.CONNECTED
-            connector.last_error = None
-        else:
-            # Create new connector
-            connector = SocialConnector(
-                brand_id=brand_id,
-                platform=data.platform,
-                account_id=account_info["account_id"],
-                account_name=account_info.get("account_name"),
-                account_username=account_info.get("account_username"),
-                account_avatar_url=account_info.get("account_avatar_url"),
-                access_token_encrypted=handler.encrypt_token(token_data["access_token"]),
-                refresh_token_encrypted=(
-                    handler.encrypt_token(token_data["refresh_token"])
-                    if token_data.get("refresh_token")
-                    else None
+        connector = await _upsert_connector(
+            db,
+            values={
+                "brand_id": brand_id,
+                "platform": data.platform,
+                "account_id": account_info["account_id"],
+                "account_name": account_info.get("account_name"),
+                "account_username": account_info.get("account_username"),
+                "account_avatar_url": account_info.get("account_avatar_url"),
+                "access_token_encrypted": access_token_encrypted,
+                "refresh_token_encrypted": refresh_token_encrypted,
+                "token_expires_at": token_data.get("expires_at"),
+                "platform_data": account_info.get("platform_data"),
+                "scopes": token_data.get("scope"),
+                "status": ConnectorStatus.CONNECTED,
+            },
+            on_conflict={
+                "access_token_encrypted": access_token_encrypted,
+                # Keep the stored refresh token when the platform sends none
+                "refresh_token_encrypted": func.coalesce(
+                    refresh_token_encrypted, SocialConnector.refresh_token_encrypted
                 ),
-                token_expires_at=token_data.get("expires_at"),
-                platform_data=account_info.get("platform_data"),
-                scopes=token_data.get("scope"),
-                status=ConnectorStatus.CONNECTED,
-            )
-            db.add(connector)
-
+                "token_expires_at": token_data.get("expires_at"),
+                "status": ConnectorStatus.CONNECTED,
+                "last_error": None,
+            },
+        )
         await db.commit()
-        await db.refresh(connector)
 
         return ConnectorResponse.model_validate(connector)
 
@@ -160,41 +178,35 @@ async def connect_with_api_key(
             detail=f"Limite atteinte : maximum {platform_limit} compte(s) {data.platform.value}.",
         )
 
+    # Release the connection while talking to the platform
+    await db.close()
+
     # Get account info
     account_info = await handler.get_account_info(
         data.api_key, account_username=data.account_username
     )
-
-    # Check if connector already exists
-    existing = await db.execute(
-        select(SocialConnector).where(
-            SocialConnector.brand_id == data.brand_id,
-            SocialConnector.platform == data.platform,
-            SocialConnector.account_id == account_info["account_id"],
-        )
+    access_token_encrypted = handler.encrypt_token(data.api_key)
+
+    connector = await _upsert_connector(
+        db,
+        values={
+            "brand_id": data.brand_id,
+            "platform": data.platform,
+            "account_id": account_info["account_id"],
+            "account_name": account_info.get("account_name"),
+            "account_username": account_info.get("account_username"),
+            "account_avatar_url": account_info.get("account_avatar_url"),
+            "access_token_encrypted": access_token_encrypted,
+            "platform_data": account_info.get("platform_data"),
+            "status": ConnectorStatus.CONNECTED,
+        },
+        on_conflict={
+            "access_token_encrypted": access_token_encrypted,
+            "status": ConnectorStatus.CONNECTED,
+            "last_error": None,
+        },
     )
-    connector = existing.scalar_one_or_none()
-
-    if connector:
-        connector.access_token_encrypted = handler.encrypt_token(data.api_key)
-        connector.status = ConnectorStatus.CONNECTED
-        connector.last_error = None
-    else:
-        connector = SocialConnector(
-            brand_id=data.brand_id,
-            platform=data.platform,
-            account_id=account_info["account_id"],
-            account_name=account_info.get("account_name"),
-            account_username=account_info.get("account_username"),
-            account_avatar_url=account_info.get("account_avatar_url"),
-            access_token_encrypted=handler.encrypt_token(data.api_key),
-            platform_data=account_info.get("platform_data"),
-            status=ConnectorStatus.CONNECTED,
-        )
-        db.add(connector)
-
     await db.commit()
-    await db.refresh(connector)
 
     return ConnectorResponse.model_validate(connector)
 
@@ -250,10 +262,14 @@ async def refresh_connector_token(
 
     handler = get_connector_handler(connector.platform)
 
+    # Don't hold a pooled connection during the platform's token endpoint call
+    await db.close()
+
     try:
         refresh_token = handler.decrypt_token(connector.refresh_token_encrypted)
         token_data = await handler.refresh_token(refresh_token)
 
+        db.add(connector)
         connector.access_token_encrypted = handler.encrypt_token(
             token_data["access_token"]
         )
@@ -271,6 +287,7 @@ async def refresh_connector_token(
         return ConnectorResponse.model_validate(connector)
 
     except Exception as e:
+        db.add(connector)
         connector.status = ConnectorStatus.ERROR
         connector.last_error = str(e)
         await db.commit()
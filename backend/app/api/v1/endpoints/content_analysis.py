@@ -5,12 +5,15 @@ Analyze Instagram content to extract brand tone and vocabulary.
 Uses free tier LLM (OpenRouter / Llama 3.3 70B).
 """
 import logging
-from uuid import UUID
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status
 from pydantic import BaseModel
 
 from app.api.v1.deps import CurrentUser, DBSession, get_brand, CurrentBrand
+from app.core.database import async_session_maker
+from app.models.brand import Brand
 from app.services.content_analyzer_free import ContentAnalyzerFree
 
 logger = logging.getLogger(__name__)
@@ -58,25 +61,76 @@ class AnalyzeResponse(BaseModel):
     error: str | None = None
 
 
+class AnalysisJobResponse(BaseModel):
+    job_id: str
+    status: str
+
+
+# Latest analysis job per brand (in memory, like the agent task store):
+# {"job_id", "status": pending|running|completed|failed, "created_at", "result"}
+_analysis_jobs: dict[str, dict] = {}
+
+
+def _to_response(result: dict) -> AnalyzeResponse:
+    if not result.get("success"):
+        return AnalyzeResponse(
+            success=False,
+            error=result.get("error", "Erreur inconnue"),
+        )
+
+    return AnalyzeResponse(
+        success=True,
+        posts_found=result["posts_found"],
+        posts_analyzed=result["posts_analyzed"],
+        summary=result["summary"],
+        tone=ToneResult(**result["tone"]),
+        vocabulary=VocabularyResult(**result["vocabulary"]),
+        stored=StoredResult(**result["stored"]),
+        custom_instructions=result.get("custom_instructions", ""),
+    )
+
+
+async def _run_analysis(job: dict, brand: Brand, username: str) -> None:
+    """Fetch, analyze and store outside the request.
+
+    The session only takes a connection for the final store step, so no pool
+    slot is held while the posts are fetched and the LLM runs.
+    """
+    job["status"] = "running"
+    try:
+        async with async_session_maker() as db:
+            result = await ContentAnalyzerFree().analyze_and_store(username, brand, db)
+        response = _to_response(result)
+    except Exception as e:
+        logger.error(f"Content analysis failed for brand {brand.id}: {e}")
+        response = AnalyzeResponse(success=False, error="Erreur lors de l'analyse")
+
+    job["result"] = response.model_dump()
+    job["status"] = "completed" if response.success else "failed"
+
+
 # ── Endpoints ───────────────────────────────────────────────
 
 @router.post(
     "/brands/{brand_id}/analyze",
-    response_model=AnalyzeResponse,
+    response_model=AnalysisJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Analyze Instagram content for brand tone",
 )
 async def analyze_instagram_content(
     brand_id: UUID,
     request: AnalyzeRequest,
+    background_tasks: BackgroundTasks,
     current_user: CurrentUser,
     db: DBSession,
 ):
     """
-    Analyze an Instagram account's content to extract:
+    Start analyzing an Instagram account's content to extract:
     - Tone metrics (formal, playful, bold, emotional, humor)
     - Vocabulary patterns (favorite words, emojis, CTA style)
 
-    Results are stored in BrandVoice and KnowledgeItems.
+    Results are stored in BrandVoice and KnowledgeItems. The analysis runs
+    in the background; poll GET /brands/{brand_id}/status for its result.
     """
     # Validate brand access
     brand = await get_brand(brand_id, current_user, db)
@@ -88,25 +142,20 @@ async def analyze_instagram_content(
             detail="Instagram username is required",
         )
 
-    analyzer = ContentAnalyzerFree()
-    result = await analyzer.analyze_and_store(username, brand, db)
+    job = {
+        "job_id": str(uuid4()),
+        "status": "pending",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "result": None,
+    }
+    _analysis_jobs[str(brand_id)] = job
 
-    if not result.get("success"):
-        return AnalyzeResponse(
-            success=False,
-            error=result.get("error", "Erreur inconnue"),
-        )
+    # Yield dependencies are torn down after background tasks, so release
+    # the request's connection now rather than through the whole analysis
+    await db.close()
+    background_tasks.add_task(_run_analysis, job, brand, username)
 
-    return AnalyzeResponse(
-        success=True,
-        posts_found=result["posts_found"],
-        posts_analyzed=result["posts_analyzed"],
-        summary=result["summary"],
-        tone=ToneResult(**result["tone"]),
-        vocabulary=VocabularyResult(**result["vocabulary"]),
-        stored=StoredResult(**result["stored"]),
-        custom_instructions=result.get("custom_instructions", ""),
-    )
+    return AnalysisJobResponse(job_id=job["job_id"], status=job["status"])
 
 
 @router.get(
@@ -118,7 +167,10 @@ async def get_analysis_status(
     current_user: CurrentUser,
     db: DBSession,
 ):
-    """Check if a brand has been analyzed and return current voice config."""
+    """Check if a brand has been analyzed and return current voice config.
+
+    ``analysis`` reports the latest analysis job started for the brand.
+    """
     brand = await get_brand(brand_id, current_user, db)
 
     has_voice = brand.voice is not None
@@ -139,4 +191,5 @@ async def get_analysis_status(
         "has_voice": has_voice,
         "voice": voice_data,
         "brand_name": brand.name,
+        "analysis": _analysis_jobs.get(str(brand_id)),
     }
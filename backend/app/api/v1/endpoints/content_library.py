@@ -6,11 +6,12 @@ Endpoints for managing dishes (menu items) and generating content from free-text
 from uuid import UUID
 
 import structlog
-from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, HTTPException, Response, status
+from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.deps import CurrentUser, DBSession, get_brand
+from app.schemas.dish import DishResponse
 from app.services.content_library import ContentLibraryService
 
 logger = structlog.get_logger()
@@ -40,40 +41,9 @@ class DishUpdateRequest(BaseModel):
     display_order: int | None = None
 
 
-class DishResponse(BaseModel):
-    id: str
-    brand_id: str
-    name: str
-    category: str
-    description: str | None
-    price: float | None
-    is_available: bool
-    is_featured: bool
-    cover_asset_id: str | None
-    ai_post_count: int
-    last_posted_at: str | None
-    display_order: int
-    created_at: str
-    updated_at: str
-
-    @classmethod
-    def from_orm(cls, obj) -> "DishResponse":
-        return cls(
-            id=str(obj.id),
-            brand_id=str(obj.brand_id),
-            name=obj.name,
-            category=obj.category,
-            description=obj.description,
-            price=float(obj.price) if obj.price else None,
-            is_available=obj.is_available,
-            is_featured=obj.is_featured,
-            cover_asset_id=str(obj.cover_asset_id) if obj.cover_asset_id else None,
-            ai_post_count=obj.ai_post_count,
-            last_posted_at=obj.last_posted_at.isoformat() if obj.last_posted_at else None,
-            display_order=obj.display_order,
-            created_at=obj.created_at.isoformat(),
-            updated_at=obj.updated_at.isoformat(),
-        )
+class DishListResponse(BaseModel):
+    dishes: list[DishResponse]
+    total: int
 
 
 class ContentRequestBody(BaseModel):
@@ -83,18 +53,12 @@ class ContentRequestBody(BaseModel):
 
 
 class ProposalBriefResponse(BaseModel):
-    id: str
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
     status: str
     source: str
 
-    @classmethod
-    def from_orm(cls, obj) -> "ProposalBriefResponse":
-        return cls(
-            id=str(obj.id),
-            status=obj.status,
-            source=obj.source,
-        )
-
 
 # ── Endpoints ────────────────────────────────────────────────────────────
 
@@ -119,10 +83,14 @@ async def create_dish(
         is_featured=body.is_featured,
         cover_asset_id=body.cover_asset_id,
     )
-    return DishResponse.from_orm(dish)
+    return DishResponse.model_validate(dish)
 
 
-@router.get("/{brand_id}/dishes")
+@router.get(
+    "/{brand_id}/dishes",
+    response_model=None,
+    responses={200: {"model": DishListResponse}},
+)
 async def list_dishes(
     brand_id: UUID,
     current_user: CurrentUser,
@@ -130,21 +98,23 @@ async def list_dishes(
     category: str | None = None,
     featured: bool = False,
     available: bool = True,
-) -> dict:
+) -> Response:
     """List dishes for a brand with optional filters."""
     await get_brand(brand_id, current_user, db)
 
     service = ContentLibraryService(db)
-    dishes = await service.list_dishes(
+    # Each dish is stored pre-encoded, so the body is a plain byte join
+    payloads = await service.list_dish_payloads(
         brand_id=str(brand_id),
         category=category,
         featured_only=featured,
         available_only=available,
     )
-    return {
-        "dishes": [DishResponse.from_orm(d) for d in dishes],
-        "total": len(dishes),
-    }
+    return Response(
+        content=b'{"dishes":[' + b",".join(payloads) + b'],"total":'
+        + str(len(payloads)).encode() + b"}",
+        media_type="application/json",
+    )
 
 
 @router.put("/{brand_id}/dishes/{dish_id}")
@@ -171,7 +141,7 @@ async def update_dish(
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
-    return DishResponse.from_orm(dish)
+    return DishResponse.model_validate(dish)
 
 
 @router.delete("/{brand_id}/dishes/{dish_id}")
@@ -215,7 +185,7 @@ async def create_asset_proposal(
         content_type="post",
         platform="instagram",
     )
-    return ProposalBriefResponse.from_orm(proposal)
+    return ProposalBriefResponse.model_validate(proposal)
 
 
 @router.post("/{brand_id}/request", status_code=status.HTTP_201_CREATED)
@@ -235,4 +205,4 @@ async def create_content_request(
         content_type=body.content_type,
         platform=body.platform,
     )
-    return ProposalBriefResponse.from_orm(proposal)
+    return ProposalBriefResponse.model_validate(proposal)
@@ -4,13 +4,19 @@ PresenceOS - Content Drafts Endpoints
 from datetime import datetime, timezone
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, status
-from sqlalchemy import select
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import and_, func, lambda_stmt, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.interfaces import LoaderOption
 
-from app.api.v1.deps import CurrentUser, DBSession, get_brand
+from app.api.v1.deps import CurrentUser, DBSession, get_brand, with_brand_access
 from app.models.content import ContentDraft, ContentVariant, DraftStatus, Platform
 from app.models.publishing import (
+    ACTIVE_POST_WHERE,
     ScheduledPost,
     SocialConnector,
     PostStatus,
@@ -27,8 +33,63 @@ from app.schemas.publishing import DraftScheduleRequest, DraftScheduleResponse
 
 router = APIRouter()
 
+# list_drafts reads only what ContentDraftListResponse serializes
+_DRAFT_LIST_COLUMNS = (
+    ContentDraft.id,
+    ContentDraft.brand_id,
+    ContentDraft.platform,
+    ContentDraft.status,
+    ContentDraft.caption,
+    ContentDraft.media_type,
+    ContentDraft.created_at,
+)
+_DRAFT_LIST_ADAPTER = TypeAdapter(list[ContentDraftListResponse])
+
+# list_variants reads only what ContentVariantResponse serializes
+_VARIANT_COLUMNS = (
+    ContentVariant.id,
+    ContentVariant.draft_id,
+    ContentVariant.style,
+    ContentVariant.caption,
+    ContentVariant.hashtags,
+    ContentVariant.is_selected,
+    ContentVariant.ai_notes,
+    ContentVariant.created_at,
+)
+_VARIANT_LIST_ADAPTER = TypeAdapter(list[ContentVariantResponse])
+
+
+async def _get_draft(
+    draft_id: UUID,
+    current_user,
+    db: AsyncSession,
+    *options: LoaderOption,
+) -> ContentDraft:
+    """Load a draft the user can access through its brand.
+
+    Existence and authorization are checked by one query; a draft on a
+    brand outside the user's workspaces is reported as not found.
+    """
+    result = await db.execute(
+        with_brand_access(select(ContentDraft), ContentDraft.brand_id, current_user.id)
+        .options(*options)
+        .where(ContentDraft.id == draft_id)
+    )
+    draft = result.scalar_one_or_none()
 
-@router.get("/brands/{brand_id}", response_model=list[ContentDraftListResponse])
+    if not draft:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Draft not found",
+        )
+    return draft
+
+
+@router.get(
+    "/brands/{brand_id}",
+    response_model=None,
+    responses={200: {"model": list[ContentDraftListResponse]}},
+)
 async def list_drafts(
     brand_id: UUID,
     current_user: CurrentUser,
@@ -37,23 +98,30 @@ async def list_drafts(
     platform: Platform | None = None,
     limit: int = Query(50, le=200),
     offset: int = 0,
-):
+) -> Response:
     """List content drafts for a brand."""
     await get_brand(brand_id, current_user, db)
 
-    query = select(ContentDraft).where(ContentDraft.brand_id == brand_id)
+    query = lambda_stmt(
+        lambda: select(*_DRAFT_LIST_COLUMNS).where(ContentDraft.brand_id == brand_id)
+    )
 
     if status_filter:
-        query = query.where(ContentDraft.status == status_filter)
+        query += lambda q: q.where(ContentDraft.status == status_filter)
     if platform:
-        query = query.where(ContentDraft.platform == platform)
+        query += lambda q: q.where(ContentDraft.platform == platform)
 
-    query = query.order_by(ContentDraft.created_at.desc()).limit(limit).offset(offset)
+    query += lambda q: (
+        q.order_by(ContentDraft.created_at.desc()).limit(limit).offset(offset)
+    )
 
     result = await db.execute(query)
-    drafts = result.scalars().all()
-
-    return [ContentDraftListResponse.model_validate(draft) for draft in drafts]
+    # Columns come straight from typed DB columns, so skip revalidation and
+    # let pydantic-core serialize the constructed models in one pass
+    rows = [ContentDraftListResponse.model_construct(**row._mapping) for row in result]
+    return Response(
+        content=_DRAFT_LIST_ADAPTER.dump_json(rows), media_type="application/json"
+    )
 
 
 @router.post("/brands/{brand_id}", response_model=ContentDraftResponse)
@@ -66,18 +134,12 @@ async def create_draft(
     """Create a new content draft manually."""
     await get_brand(brand_id, current_user, db)
 
-    draft = ContentDraft(brand_id=brand_id, **data.model_dump())
+    # A new draft has no variants; starting from a loaded empty collection
+    # (and expire_on_commit=False) lets us serialize it without a reload
+    draft = ContentDraft(brand_id=brand_id, variants=[], **data.model_dump())
     db.add(draft)
     await db.commit()
 
-    # Reload with variants
-    result = await db.execute(
-        select(ContentDraft)
-        .options(selectinload(ContentDraft.variants))
-        .where(ContentDraft.id == draft.id)
-    )
-    draft = result.scalar_one()
-
     return ContentDraftResponse.model_validate(draft)
 
 
@@ -88,20 +150,9 @@ async def get_draft(
     db: DBSession,
 ):
     """Get a specific content draft with variants."""
-    result = await db.execute(
-        select(ContentDraft)
-        .options(selectinload(ContentDraft.variants))
-        .where(ContentDraft.id == draft_id)
+    draft = await _get_draft(
+        draft_id, current_user, db, selectinload(ContentDraft.variants)
     )
-    draft = result.scalar_one_or_none()
-
-    if not draft:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Draft not found",
-        )
-
-    await get_brand(draft.brand_id, current_user, db)
 
     return ContentDraftResponse.model_validate(draft)
 
@@ -114,20 +165,9 @@ async def update_draft(
     db: DBSession,
 ):
     """Update a content draft."""
-    result = await db.execute(
-        select(ContentDraft)
-        .options(selectinload(ContentDraft.variants))
-        .where(ContentDraft.id == draft_id)
+    draft = await _get_draft(
+        draft_id, current_user, db, selectinload(ContentDraft.variants)
     )
-    draft = result.scalar_one_or_none()
-
-    if not draft:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Draft not found",
-        )
-
-    await get_brand(draft.brand_id, current_user, db)
 
     if draft.status in [DraftStatus.SCHEDULED, DraftStatus.PUBLISHED]:
         raise HTTPException(
@@ -140,7 +180,6 @@ async def update_draft(
         setattr(draft, field, value)
 
     await db.commit()
-    await db.refresh(draft)
 
     return ContentDraftResponse.model_validate(draft)
 
@@ -152,16 +191,7 @@ async def delete_draft(
     db: DBSession,
 ):
     """Delete a content draft."""
-    result = await db.execute(select(ContentDraft).where(ContentDraft.id == draft_id))
-    draft = result.scalar_one_or_none()
-
-    if not draft:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Draft not found",
-        )
-
-    await get_brand(draft.brand_id, current_user, db)
+    draft = await _get_draft(draft_id, current_user, db)
 
     if draft.status in [DraftStatus.SCHEDULED, DraftStatus.PUBLISHED]:
         raise HTTPException(
@@ -182,52 +212,55 @@ async def approve_draft(
     db: DBSession,
 ):
     """Approve a draft for scheduling."""
-    result = await db.execute(
-        select(ContentDraft)
-        .options(selectinload(ContentDraft.variants))
-        .where(ContentDraft.id == draft_id)
+    draft = await _get_draft(
+        draft_id, current_user, db, selectinload(ContentDraft.variants)
     )
-    draft = result.scalar_one_or_none()
-
-    if not draft:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Draft not found",
-        )
-
-    await get_brand(draft.brand_id, current_user, db)
 
     draft.status = DraftStatus.APPROVED
     await db.commit()
-    await db.refresh(draft)
 
     return ContentDraftResponse.model_validate(draft)
 
 
-@router.get("/{draft_id}/variants", response_model=list[ContentVariantResponse])
+@router.get(
+    "/{draft_id}/variants",
+    response_model=None,
+    responses={200: {"model": list[ContentVariantResponse]}},
+)
 async def list_variants(
     draft_id: UUID,
     current_user: CurrentUser,
     db: DBSession,
-):
+) -> Response:
     """List all variants for a draft."""
-    result = await db.execute(select(ContentDraft).where(ContentDraft.id == draft_id))
-    draft = result.scalar_one_or_none()
+    # The outer join keeps one all-NULL row for an accessible draft without
+    # variants, so "no rows" still means the draft is missing or not ours
+    result = await db.execute(
+        with_brand_access(
+            select(*_VARIANT_COLUMNS).select_from(ContentDraft),
+            ContentDraft.brand_id,
+            current_user.id,
+        )
+        .outerjoin(ContentVariant, ContentVariant.draft_id == ContentDraft.id)
+        .where(ContentDraft.id == draft_id)
+    )
+    rows = result.all()
 
-    if not draft:
+    if not rows:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Draft not found",
         )
 
-    await get_brand(draft.brand_id, current_user, db)
-
-    result = await db.execute(
-        select(ContentVariant).where(ContentVariant.draft_id == draft_id)
+    variants = [
+        ContentVariantResponse.model_construct(**row._mapping)
+        for row in rows
+        if row.id is not None
+    ]
+    return Response(
+        content=_VARIANT_LIST_ADAPTER.dump_json(variants),
+        media_type="application/json",
     )
-    variants = result.scalars().all()
-
-    return [ContentVariantResponse.model_validate(v) for v in variants]
 
 
 @router.post("/{draft_id}/variants/{variant_id}/select", response_model=ContentDraftResponse)
@@ -238,42 +271,33 @@ async def select_variant(
     db: DBSession,
 ):
     """Select a variant to use for the draft."""
-    result = await db.execute(
-        select(ContentDraft)
-        .options(selectinload(ContentDraft.variants))
-        .where(ContentDraft.id == draft_id)
+    draft = await _get_draft(
+        draft_id, current_user, db, selectinload(ContentDraft.variants)
     )
-    draft = result.scalar_one_or_none()
-
-    if not draft:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Draft not found",
-        )
-
-    await get_brand(draft.brand_id, current_user, db)
-
-    # Find the variant
-    variant = None
-    for v in draft.variants:
-        if v.id == variant_id:
-            variant = v
-            v.is_selected = True
-        else:
-            v.is_selected = False
 
+    variant = next((v for v in draft.variants if v.id == variant_id), None)
     if not variant:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Variant not found",
         )
 
+    # Flip every variant's flag in one statement instead of a row per variant,
+    # then mirror the result onto the loaded objects without dirtying them
+    await db.execute(
+        update(ContentVariant)
+        .where(ContentVariant.draft_id == draft_id)
+        .values(is_selected=ContentVariant.id == variant_id)
+        .execution_options(synchronize_session=False)
+    )
+    for v in draft.variants:
+        set_committed_value(v, "is_selected", v is variant)
+
     # Update draft with variant content
     draft.caption = variant.caption
     draft.hashtags = variant.hashtags
 
     await db.commit()
-    await db.refresh(draft)
 
     return ContentDraftResponse.model_validate(draft)
 
@@ -290,27 +314,41 @@ async def schedule_draft(
     This creates a new ScheduledPost entry linked to the draft.
     If the draft is already scheduled, the existing ScheduledPost is updated.
     """
-    # Get the draft
+    # Draft (authorized), requested connector and any pending post's id in
+    # one round-trip; the outer joins leave connector/post as None when absent
     result = await db.execute(
-        select(ContentDraft).where(ContentDraft.id == draft_id)
+        with_brand_access(
+            select(ContentDraft, SocialConnector, ScheduledPost.id),
+            ContentDraft.brand_id,
+            current_user.id,
+        )
+        .outerjoin(
+            SocialConnector,
+            and_(
+                SocialConnector.id == data.connector_id,
+                SocialConnector.brand_id == ContentDraft.brand_id,
+            ),
+        )
+        .outerjoin(
+            ScheduledPost,
+            and_(
+                ScheduledPost.draft_id == ContentDraft.id,
+                ScheduledPost.status.in_([PostStatus.SCHEDULED, PostStatus.QUEUED]),
+            ),
+        )
+        .where(ContentDraft.id == draft_id)
     )
-    draft = result.scalar_one_or_none()
+    row = result.first()
 
-    if not draft:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Draft not found",
         )
-
-    await get_brand(draft.brand_id, current_user, db)
+    draft, connector, existing_post_id = row
 
     # Validate connector
-    connector_result = await db.execute(
-        select(SocialConnector).where(SocialConnector.id == data.connector_id)
-    )
-    connector = connector_result.scalar_one_or_none()
-
-    if not connector or connector.brand_id != draft.brand_id:
+    if not connector:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Connector not found",
@@ -329,50 +367,46 @@ async def schedule_draft(
             detail="Scheduled time must be in the future",
         )
 
-    # Check if draft already has a scheduled post
-    existing_post_result = await db.execute(
-        select(ScheduledPost).where(
-            ScheduledPost.draft_id == draft_id,
-            ScheduledPost.status.in_([PostStatus.SCHEDULED, PostStatus.QUEUED]),
-        )
-    )
-    existing_post = existing_post_result.scalar_one_or_none()
-
-    if existing_post:
-        # Update existing scheduled post
-        existing_post.scheduled_at = data.scheduled_at
-        existing_post.timezone = data.timezone
-        existing_post.connector_id = data.connector_id
-        scheduled_post = existing_post
-        message = "Draft rescheduled successfully"
-    else:
-        # Create content snapshot
-        content_snapshot = {
-            "caption": draft.caption,
-            "hashtags": draft.hashtags,
-            "media_urls": draft.media_urls,
-            "media_type": draft.media_type,
-            "platform_data": draft.platform_data,
-        }
-
-        # Create new scheduled post
-        scheduled_post = ScheduledPost(
+    # One atomic upsert against the partial unique index on a draft's pending
+    # post: a reschedule only moves the slot and keeps the original snapshot
+    stmt = (
+        pg_insert(ScheduledPost)
+        .values(
             brand_id=draft.brand_id,
             draft_id=draft_id,
             connector_id=data.connector_id,
             scheduled_at=data.scheduled_at,
             timezone=data.timezone,
-            content_snapshot=content_snapshot,
+            content_snapshot={
+                "caption": draft.caption,
+                "hashtags": draft.hashtags,
+                "media_urls": draft.media_urls,
+                "media_type": draft.media_type,
+                "platform_data": draft.platform_data,
+            },
             status=PostStatus.SCHEDULED,
         )
-        db.add(scheduled_post)
+        .on_conflict_do_update(
+            index_elements=[ScheduledPost.draft_id],
+            index_where=ACTIVE_POST_WHERE,
+            set_={
+                "scheduled_at": data.scheduled_at,
+                "timezone": data.timezone,
+                "connector_id": data.connector_id,
+                "updated_at": func.now(),
+            },
+        )
+        .returning(ScheduledPost)
+    )
+    scheduled_post = (await db.execute(stmt)).scalar_one()
 
-        # Update draft status
+    if existing_post_id:
+        message = "Draft rescheduled successfully"
+    else:
         draft.status = DraftStatus.SCHEDULED
         message = "Draft scheduled successfully"
 
     await db.commit()
-    await db.refresh(scheduled_post)
 
     return DraftScheduleResponse(
         draft_id=draft_id,
@@ -11,7 +11,6 @@ If True and the request would hit an auth-protected endpoint,
 we intercept it here and return mock data with `degraded: true`.
 """
 from fastapi import APIRouter, Request, Response
-from fastapi.responses import JSONResponse
 
 from app.core.resilience import registry
 from app.core import mock_data
@@ -19,145 +18,138 @@ from app.core import mock_data
 router = APIRouter(tags=["Fallback (Degraded Mode)"])
 
 
+def _json(body: bytes) -> Response:
+    """Wrap a pre-serialized mock body (see mock_data) without re-encoding."""
+    return Response(content=body, media_type="application/json")
+
+
 # ── Brands ───────────────────────────────────────────────────────
 
 @router.get("/brands/{brand_id}")
 async def get_brand_fallback(brand_id: str):
-    return JSONResponse(content=mock_data.MOCK_BRAND)
+    return _json(mock_data.MOCK_BRAND_BYTES)
 
 
 # ── Knowledge ────────────────────────────────────────────────────
 
 @router.get("/knowledge/brands/{brand_id}")
 async def list_knowledge_fallback(brand_id: str):
-    return JSONResponse(content=mock_data.MOCK_KNOWLEDGE_LIST)
+    return _json(mock_data.MOCK_KNOWLEDGE_LIST_BYTES)
 
 
 @router.get("/knowledge/brands/{brand_id}/categories")
 async def knowledge_categories_fallback(brand_id: str):
-    return JSONResponse(content=mock_data.MOCK_KNOWLEDGE_CATEGORIES)
+    return _json(mock_data.MOCK_KNOWLEDGE_CATEGORIES_BYTES)
 
 
 # ── Ideas ────────────────────────────────────────────────────────
 
 @router.get("/ideas/brands/{brand_id}")
 async def list_ideas_fallback(brand_id: str):
-    return JSONResponse(content=mock_data.MOCK_IDEAS_LIST)
+    return _json(mock_data.MOCK_IDEAS_LIST_BYTES)
 
 
 @router.get("/ideas/brands/{brand_id}/daily")
 async def daily_ideas_fallback(brand_id: str):
-    return JSONResponse(content=mock_data.MOCK_IDEAS_LIST[:1])
+    return _json(mock_data.MOCK_DAILY_IDEAS_BYTES)
 
 
 # ── Drafts ───────────────────────────────────────────────────────
 
 @router.get("/drafts/brands/{brand_id}")
 async def list_drafts_fallback(brand_id: str):
-    return JSONResponse(content=mock_data.MOCK_DRAFTS_LIST)
+    return _json(mock_data.MOCK_DRAFTS_LIST_BYTES)
 
 
 # ── Connectors ───────────────────────────────────────────────────
 
 @router.get("/connectors/brands/{brand_id}")
 async def list_connectors_fallback(brand_id: str):
-    return JSONResponse(content=mock_data.MOCK_CONNECTORS_LIST)
+    return _json(mock_data.MOCK_CONNECTORS_LIST_BYTES)
 
 
 # ── Posts ────────────────────────────────────────────────────────
 
 @router.get("/posts/brands/{brand_id}")
 async def list_posts_fallback(brand_id: str):
-    return JSONResponse(content=[])
+    return _json(mock_data.EMPTY_LIST_BYTES)
 
 
 @router.get("/posts/brands/{brand_id}/calendar")
 async def calendar_fallback(brand_id: str):
-    return JSONResponse(content=mock_data.MOCK_CALENDAR)
+    return _json(mock_data.MOCK_CALENDAR_BYTES)
 
 
 # ── Metrics ──────────────────────────────────────────────────────
 
 @router.get("/metrics/brands/{brand_id}/dashboard")
 async def dashboard_metrics_fallback(brand_id: str):
-    return JSONResponse(content=mock_data.MOCK_DASHBOARD_METRICS)
+    return _json(mock_data.MOCK_DASHBOARD_METRICS_BYTES)
 
 
 @router.get("/metrics/brands/{brand_id}/platforms")
 async def platform_breakdown_fallback(brand_id: str):
-    return JSONResponse(content=mock_data.MOCK_PLATFORM_BREAKDOWN)
+    return _json(mock_data.MOCK_PLATFORM_BREAKDOWN_BYTES)
 
 
 @router.get("/metrics/brands/{brand_id}/top-posts")
 async def top_posts_fallback(brand_id: str):
-    return JSONResponse(content=mock_data.MOCK_TOP_POSTS)
+    return _json(mock_data.MOCK_TOP_POSTS_BYTES)
 
 
 @router.get("/metrics/brands/{brand_id}/learning")
 async def learning_insights_fallback(brand_id: str):
-    return JSONResponse(content=mock_data.MOCK_LEARNING_INSIGHTS)
+    return _json(mock_data.MOCK_LEARNING_INSIGHTS_BYTES)
 
 
 # ── Autopilot ────────────────────────────────────────────────────
 
 @router.get("/autopilot/brands/{brand_id}/autopilot")
 async def autopilot_config_fallback(brand_id: str):
-    return JSONResponse(content=mock_data.MOCK_AUTOPILOT_CONFIG)
+    return _json(mock_data.MOCK_AUTOPILOT_CONFIG_BYTES)
 
 
 @router.get("/autopilot/brands/{brand_id}/autopilot/pending")
 async def autopilot_pending_fallback(brand_id: str):
-    return JSONResponse(content=[])
+    return _json(mock_data.EMPTY_LIST_BYTES)
 
 
 # ── Media Library ────────────────────────────────────────────────
 
 @router.get("/media-library/brands/{brand_id}/assets")
 async def media_assets_fallback(brand_id: str):
-    return JSONResponse(content=[])
+    return _json(mock_data.EMPTY_LIST_BYTES)
 
 
 @router.get("/media-library/brands/{brand_id}/voice-notes")
 async def voice_notes_fallback(brand_id: str):
-    return JSONResponse(content=[])
+    return _json(mock_data.EMPTY_LIST_BYTES)
 
 
 @router.get("/media-library/brands/{brand_id}/stats")
 async def media_stats_fallback(brand_id: str):
-    return JSONResponse(content=mock_data.MOCK_MEDIA_STATS)
+    return _json(mock_data.MOCK_MEDIA_STATS_BYTES)
 
 
 # ── Users / Workspaces ──────────────────────────────────────────
 
 @router.get("/users/me")
 async def get_me_fallback():
-    return JSONResponse(content={
-        "id": "demo-user-001",
-        "email": "dev@presenceos.local",
-        "full_name": "Dev User",
-        "is_active": True,
-        "degraded": True,
-    })
+    return _json(mock_data.MOCK_USER_BYTES)
 
 
 @router.get("/users/me/workspaces")
 async def my_workspaces_fallback():
-    return JSONResponse(content=[mock_data.MOCK_WORKSPACE])
+    return _json(mock_data.MOCK_WORKSPACES_LIST_BYTES)
 
 
 @router.get("/workspaces/{workspace_id}/brands")
 async def workspace_brands_fallback(workspace_id: str):
-    return JSONResponse(content=mock_data.MOCK_BRANDS_LIST)
+    return _json(mock_data.MOCK_BRANDS_LIST_BYTES)
 
 
 # ── Auth (degraded mode just returns a stub) ─────────────────────
 
 @router.get("/auth/me")
 async def auth_me_fallback():
-    return JSONResponse(content={
-        "id": "demo-user-001",
-        "email": "dev@presenceos.local",
-        "full_name": "Dev User",
-        "is_active": True,
-        "degraded": True,
-    })
+    return _json(mock_data.MOCK_USER_BYTES)
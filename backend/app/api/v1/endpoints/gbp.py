@@ -3,25 +3,36 @@ PresenceOS — Google Business Profile API (Feature 7)
 
 Endpoints for GBP autopublish configuration and post management.
 """
+import hashlib
+import time
+from functools import lru_cache
 from typing import Optional
 
+import orjson
 import structlog
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Response
 from pydantic import BaseModel
 
+from app.core.redis_client import get_redis
 from app.services.gbp_publisher import GBPPublisherService
 
 logger = structlog.get_logger()
 router = APIRouter()
 
-_service: GBPPublisherService | None = None
+# A retried publish within this window returns the first response instead
+# of publishing the post a second time
+PUBLISH_IDEMPOTENCY_TTL_SECONDS = 60
+PUBLISH_KEY_PREFIX = "presenceos:gbp:publish:"
+# Stored under the key while the first request is still publishing
+PUBLISH_PENDING = b"pending"
 
+# In-process fallback when Redis is unavailable: key -> (expires_at, response)
+_recent_publishes: dict[str, tuple[float, bytes]] = {}
 
+
+@lru_cache(maxsize=1)
 def _get_service() -> GBPPublisherService:
-    global _service
-    if _service is None:
-        _service = GBPPublisherService()
-    return _service
+    return GBPPublisherService()
 
 
 # ── Request/Response Models ────────────────────────────────
@@ -37,6 +48,9 @@ class GBPConfigUpdate(BaseModel):
     publish_frequency: Optional[str] = None
 
 
+_CONFIG_FIELDS = tuple(GBPConfigUpdate.model_fields)
+
+
 class GBPPublishRequest(BaseModel):
     brand_id: str
     caption: str
@@ -51,6 +65,73 @@ class GBPPublishRequest(BaseModel):
     offer_terms: Optional[str] = None
 
 
+def _publish_key(request: GBPPublishRequest, idempotency_key: str | None) -> str:
+    if idempotency_key:
+        raw = f"{request.brand_id}:{idempotency_key}".encode()
+    else:
+        raw = orjson.dumps(request.model_dump(), option=orjson.OPT_SORT_KEYS)
+    return PUBLISH_KEY_PREFIX + hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _local_entry(key: str) -> bytes | None:
+    entry = _recent_publishes.get(key)
+    if entry and time.monotonic() < entry[0]:
+        return entry[1]
+    return None
+
+
+def _local_store(key: str, body: bytes) -> None:
+    now = time.monotonic()
+    for stale in [k for k, (expires_at, _) in _recent_publishes.items() if expires_at <= now]:
+        del _recent_publishes[stale]
+    _recent_publishes[key] = (now + PUBLISH_IDEMPOTENCY_TTL_SECONDS, body)
+
+
+async def _claim_publish(key: str) -> bytes | None:
+    """Claim the key for this request; returns None when claimed, else what's
+    already stored under it (PUBLISH_PENDING or the original response)."""
+    r = await get_redis()
+    if r:
+        try:
+            # SET NX is the claim, so two concurrent retries can't both publish
+            if await r.set(key, PUBLISH_PENDING, nx=True, ex=PUBLISH_IDEMPOTENCY_TTL_SECONDS):
+                return None
+            # The holder's key may expire between the two calls; treat that
+            # as still in flight rather than racing to publish
+            return await r.get(key) or PUBLISH_PENDING
+        except Exception as exc:
+            logger.warning("gbp_publish_dedup_claim_failed", error=str(exc))
+    # No await between the check and the store, so this is atomic per process
+    existing = _local_entry(key)
+    if existing is not None:
+        return existing
+    _local_store(key, PUBLISH_PENDING)
+    return None
+
+
+async def _remember_publish(key: str, body: bytes) -> None:
+    r = await get_redis()
+    if r:
+        try:
+            await r.set(key, body, ex=PUBLISH_IDEMPOTENCY_TTL_SECONDS)
+            _recent_publishes.pop(key, None)
+            return
+        except Exception as exc:
+            logger.warning("gbp_publish_dedup_store_failed", error=str(exc))
+    _local_store(key, body)
+
+
+async def _release_publish(key: str) -> None:
+    """Drop a claim whose publish failed so the client can retry it."""
+    _recent_publishes.pop(key, None)
+    r = await get_redis()
+    if r:
+        try:
+            await r.delete(key)
+        except Exception as exc:
+            logger.warning("gbp_publish_dedup_release_failed", error=str(exc))
+
+
 # ── Endpoints ──────────────────────────────────────────────
 
 @router.get("/config/{brand_id}")
@@ -64,7 +145,11 @@ async def get_config(brand_id: str):
 async def update_config(brand_id: str, request: GBPConfigUpdate):
     """Update GBP autopublish configuration."""
     service = _get_service()
-    updates = request.model_dump(exclude_none=True)
+    updates = {
+        field: value
+        for field in _CONFIG_FIELDS
+        if (value := getattr(request, field)) is not None
+    }
     return service.update_config(brand_id, updates)
 
 
@@ -76,22 +161,44 @@ async def toggle_config(brand_id: str):
 
 
 @router.post("/publish")
-async def publish_post(request: GBPPublishRequest):
-    """Publish a post to Google Business Profile."""
+async def publish_post(
+    request: GBPPublishRequest,
+    idempotency_key: Optional[str] = Header(default=None),
+):
+    """Publish a post to Google Business Profile.
+
+    Identical requests (or requests sharing an ``Idempotency-Key`` header)
+    within a minute get the original response back without publishing again,
+    or a 409 while the original is still being published.
+    """
+    key = _publish_key(request, idempotency_key)
+    existing = await _claim_publish(key)
+    if existing == PUBLISH_PENDING:
+        raise HTTPException(status_code=409, detail="Publication identique deja en cours")
+    if existing is not None:
+        logger.info("gbp_publish_deduplicated", brand_id=request.brand_id)
+        return Response(content=existing, media_type="application/json")
+
     service = _get_service()
-    return service.publish_post(
-        brand_id=request.brand_id,
-        caption=request.caption,
-        media_urls=request.media_urls,
-        post_type=request.post_type,
-        cta_type=request.cta_type,
-        cta_url=request.cta_url,
-        event_title=request.event_title,
-        event_start=request.event_start,
-        event_end=request.event_end,
-        offer_coupon=request.offer_coupon,
-        offer_terms=request.offer_terms,
-    )
+    try:
+        result = service.publish_post(
+            brand_id=request.brand_id,
+            caption=request.caption,
+            media_urls=request.media_urls,
+            post_type=request.post_type,
+            cta_type=request.cta_type,
+            cta_url=request.cta_url,
+            event_title=request.event_title,
+            event_start=request.event_start,
+            event_end=request.event_end,
+            offer_coupon=request.offer_coupon,
+            offer_terms=request.offer_terms,
+        )
+    except Exception:
+        await _release_publish(key)
+        raise
+    await _remember_publish(key, orjson.dumps(result))
+    return result
 
 
 @router.get("/posts/{brand_id}")
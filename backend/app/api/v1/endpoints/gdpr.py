@@ -1,36 +1,40 @@
 """RGPD (GDPR) compliance endpoints — data export & deletion."""
 from __future__ import annotations
 
-import base64
+import asyncio
 import io
 import json
 import zipfile
 from datetime import datetime, timedelta, timezone
 
-from fastapi import APIRouter, BackgroundTasks
+from fastapi import APIRouter, BackgroundTasks, Response
 from pydantic import BaseModel
 
 from app.api.v1.deps import CurrentUser, DBSession
+from app.core.config import settings
 
 router = APIRouter()
 
+# Accepted (case-insensitive) answers to the account deletion prompt
+_CONFIRMATION_PHRASES: frozenset[str] = frozenset({"SUPPRIMER MON COMPTE", "DELETE MY ACCOUNT"})
+
+# Static parts of the export README, encoded once; only the date and user id vary
+_README_PREFIX = "PresenceOS — Export de données RGPD\n".encode()
+_README_SUFFIX = (
+    "\n\n"
+    "Ce fichier contient toutes les données personnelles que nous détenons,\n"
+    "conformément à l'Article 15 du RGPD (droit d'accès).\n\n"
+    "Contact : privacy@presenceos.com\n"
+).encode()
+
 
 class DeleteAccountRequest(BaseModel):
     confirmation: str
 
 
-@router.post("/export-data")
-async def request_data_export(
-    background_tasks: BackgroundTasks,
-    current_user: CurrentUser,
-    db: DBSession,
-):
-    """
-    Export all user data as JSON (RGPD Article 15 — droit d'accès).
-    Returns a download URL or the data directly for small datasets.
-    """
-    # Collect user data
-    export_data = {
+def _collect_export_data(current_user) -> dict:
+    """Gather the user's personal data for an RGPD export."""
+    return {
         "export_date": datetime.now(timezone.utc).isoformat(),
         "user_id": str(current_user.id),
         "export_format": "JSON",
@@ -45,32 +49,61 @@ async def request_data_export(
         },
     }
 
-    # Create ZIP in memory
+
+def _build_export_zip(export_data: dict, user_id) -> bytes:
+    """Build the export ZIP in memory."""
     zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(
+        zip_buffer,
+        "w",
+        zipfile.ZIP_DEFLATED,
+        compresslevel=settings.gdpr_export_zip_level,
+    ) as zf:
         zf.writestr(
             "data.json",
             json.dumps(export_data, indent=2, ensure_ascii=False),
         )
-        zf.writestr(
-            "README.txt",
-            f"PresenceOS — Export de données RGPD\n"
+        middle = (
             f"Date : {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
-            f"User ID : {current_user.id}\n\n"
-            f"Ce fichier contient toutes les données personnelles que nous détenons,\n"
-            f"conformément à l'Article 15 du RGPD (droit d'accès).\n\n"
-            f"Contact : privacy@presenceos.com\n",
-        )
+            f"User ID : {user_id}"
+        ).encode()
+        zf.writestr("README.txt", _README_PREFIX + middle + _README_SUFFIX)
+
+    return zip_buffer.getvalue()
 
-    zip_buffer.seek(0)
-    zip_bytes = zip_buffer.getvalue()
 
-    # For now, return the data directly (for small datasets)
+@router.post("/export-data")
+async def request_data_export(
+    background_tasks: BackgroundTasks,
+    current_user: CurrentUser,
+    db: DBSession,
+) -> Response:
+    """
+    Export all user data as a ZIP download (RGPD Article 15 — droit d'accès).
+    The archive is sent as raw application/zip; GET /export-metadata returns
+    the same data as JSON.
+    """
+    export_data = _collect_export_data(current_user)
+
+    # zlib is CPU-bound: keep it off the event loop
+    zip_bytes = await asyncio.to_thread(_build_export_zip, export_data, current_user.id)
+
+    # For now, return the archive directly (for small datasets)
     # In production with large datasets, upload to MinIO and return a presigned URL
+    filename = f"presenceos_export_{str(current_user.id)[:8]}.zip"
+    return Response(
+        content=zip_bytes,
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/export-metadata")
+async def get_export_metadata(current_user: CurrentUser):
+    """Return the data included in the RGPD export as JSON."""
     return {
         "message": "Votre export de données est prêt.",
-        "data": export_data,
-        "zip_base64": base64.b64encode(zip_bytes).decode(),
+        "data": _collect_export_data(current_user),
         "filename": f"presenceos_export_{str(current_user.id)[:8]}.zip",
     }
 
@@ -87,7 +120,7 @@ async def request_account_deletion(
     """
     from fastapi import HTTPException
 
-    if body.confirmation not in ("SUPPRIMER MON COMPTE", "DELETE MY ACCOUNT"):
+    if body.confirmation.strip().upper() not in _CONFIRMATION_PHRASES:
         raise HTTPException(
             status_code=400,
             detail="Tapez 'SUPPRIMER MON COMPTE' pour confirmer la suppression",
@@ -5,10 +5,13 @@ Three probes following the Kubernetes health check pattern:
 - /health/live   : Is the process alive?
 - /health/ready  : Can we accept traffic? (checks DB + Redis)
 - /health/status : Detailed status of all services
+- /health/pool   : Database connection pool usage (DEBUG only)
 """
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy import text
 
+from app.core.config import settings
+from app.core.database import engine
 from app.core.resilience import registry, ServiceStatus
 
 router = APIRouter(tags=["Health"])
@@ -46,3 +49,25 @@ async def detailed_status():
         "mode": "degraded" if degraded else "full",
         "services": services,
     }
+
+
+def _require_debug() -> None:
+    """Hide debug-only endpoints (as a 404) unless DEBUG is enabled."""
+    if not settings.debug:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+
+@router.get("/health/pool", dependencies=[Depends(_require_debug)], include_in_schema=False)
+async def pool_status():
+    """Connection pool usage, for sizing DB_POOL_SIZE / DB_MAX_OVERFLOW."""
+    pool = engine.pool
+    if not hasattr(pool, "checkedout"):
+        # NullPool (PgBouncer mode) keeps no connections of its own
+        return {"pool": pool.status()}
+    return {
+        "pool": pool.status(),
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+    }
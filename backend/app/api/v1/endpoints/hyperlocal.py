@@ -1,42 +1,94 @@
 """
 PresenceOS — Hyperlocal Intelligence API (Feature 10)
 """
-from typing import Optional
+import hashlib
+import time
+from functools import lru_cache
+from typing import Any, Callable, Optional
 
+import orjson
 import structlog
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request, Response
 
 from app.services.hyperlocal_intel import HyperlocalIntelService
+from app.utils.http_cache import etag_matches, not_modified
 
 logger = structlog.get_logger()
 router = APIRouter()
 
-_service: HyperlocalIntelService | None = None
+CACHE_TTL_SECONDS = 300
+CACHE_CONTROL = f"public, max-age={CACHE_TTL_SECONDS}"
+_CACHE_MAX_ENTRIES = 1024
 
+# key -> (expires_at, etag, encoded payload)
+_payload_cache: dict[tuple, tuple[float, str, bytes]] = {}
 
+
+@lru_cache(maxsize=1)
 def _get_service() -> HyperlocalIntelService:
-    global _service
-    if _service is None:
-        _service = HyperlocalIntelService()
-    return _service
+    return HyperlocalIntelService()
+
+
+def _cached_payload(key: tuple, build: Callable[[], Any]) -> tuple[str, bytes]:
+    """Return the (etag, body) for ``key``, rebuilding it once the TTL lapses."""
+    now = time.monotonic()
+    entry = _payload_cache.get(key)
+    if entry is not None and now < entry[0]:
+        return entry[1], entry[2]
+
+    if len(_payload_cache) >= _CACHE_MAX_ENTRIES:
+        for stale in [k for k, (expires_at, _, _) in _payload_cache.items() if expires_at <= now]:
+            del _payload_cache[stale]
+        if len(_payload_cache) >= _CACHE_MAX_ENTRIES:
+            _payload_cache.clear()
+
+    body = orjson.dumps(build())
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    _payload_cache[key] = (now + CACHE_TTL_SECONDS, etag, body)
+    return etag, body
+
+
+def _conditional_response(
+    request: Request, key: tuple, build: Callable[[], Any]
+) -> Response:
+    """Serve the cached payload, or a 304 when the client's validator matches."""
+    etag, body = _cached_payload(key, build)
+    if etag_matches(request, etag):
+        return not_modified(etag, CACHE_CONTROL)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
 
 
 @router.get("/context/{brand_id}")
 async def get_context(
     brand_id: str,
+    request: Request,
     lat: Optional[float] = Query(default=None),
     lon: Optional[float] = Query(default=None),
-):
+) -> Response:
     """Get full hyperlocal context (weather, events, seasonal, suggestions)."""
     service = _get_service()
-    return service.get_context(brand_id, lat, lon)
+    key = (
+        "context",
+        brand_id,
+        round(lat, 2) if lat is not None else None,
+        round(lon, 2) if lon is not None else None,
+    )
+    return _conditional_response(
+        request, key, lambda: service.get_context(brand_id, lat, lon)
+    )
 
 
 @router.get("/weather/{brand_id}")
-async def get_weather(brand_id: str):
+async def get_weather(brand_id: str, request: Request) -> Response:
     """Get current weather context."""
     service = _get_service()
-    return service.get_weather(brand_id)
+    return _conditional_response(
+        request, ("weather", brand_id), lambda: service.get_weather(brand_id)
+    )
 
 
 @router.get("/events/{brand_id}")
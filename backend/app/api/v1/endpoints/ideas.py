@@ -1,14 +1,21 @@
 """
 PresenceOS - Content Ideas Endpoints
 """
-from datetime import datetime, timezone
+import base64
+import binascii
+from datetime import datetime, time, timezone
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, status
-from sqlalchemy import select
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import lambda_stmt, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
-from app.api.v1.deps import CurrentUser, DBSession, get_brand
+from app.api.v1.deps import CurrentUser, DBSession, get_brand, with_brand_access
+from app.models.brand import Brand
 from app.models.content import ContentIdea, IdeaStatus
+from app.models.user import WorkspaceMember
 from app.schemas.content import (
     ContentIdeaCreate,
     ContentIdeaUpdate,
@@ -18,8 +25,91 @@ from app.schemas.content import (
 
 router = APIRouter()
 
+# List endpoints load only the columns ContentIdeaListResponse serializes,
+# skipping description/ai_reasoning/hooks and other long text
+_LIST_COLUMNS = load_only(
+    *(getattr(ContentIdea, name) for name in ContentIdeaListResponse.model_fields)
+)
+# Validates ORM rows and encodes them to JSON bytes in one pydantic-core pass,
+# leaving None fields out of the payload like the single-idea routes
+_LIST_ADAPTER = TypeAdapter(list[ContentIdeaListResponse])
+
+
+def _list_response(ideas) -> Response:
+    rows = _LIST_ADAPTER.validate_python(ideas, from_attributes=True)
+    return Response(content=_LIST_ADAPTER.dump_json(rows, exclude_none=True), media_type="application/json")
+
+
+def _encode_cursor(idea: ContentIdea) -> str:
+    raw = f"{idea.created_at.isoformat()}|{idea.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a list cursor back to the (created_at, id) of the last row seen."""
+    try:
+        created_at, idea_id = base64.urlsafe_b64decode(cursor).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(idea_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+async def _get_idea(idea_id: UUID, current_user, db: AsyncSession) -> ContentIdea:
+    """Load an idea the user can access through its brand, in one query."""
+    result = await db.execute(
+        with_brand_access(select(ContentIdea), ContentIdea.brand_id, current_user.id)
+        .where(ContentIdea.id == idea_id)
+    )
+    idea = result.scalar_one_or_none()
+
+    if not idea:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Idea not found",
+        )
+    return idea
 
-@router.get("/brands/{brand_id}", response_model=list[ContentIdeaListResponse])
+
+async def _set_idea_status(
+    idea_id: UUID, current_user, db: AsyncSession, new_status: IdeaStatus
+) -> ContentIdea:
+    """Move an idea the user can access to ``new_status`` and return the new row.
+
+    Authorization, the write and the read-back happen in a single
+    ``UPDATE ... RETURNING`` statement.
+    """
+    accessible_brands = (
+        select(Brand.id)
+        .join(WorkspaceMember, WorkspaceMember.workspace_id == Brand.workspace_id)
+        .where(WorkspaceMember.user_id == current_user.id)
+    )
+    result = await db.execute(
+        update(ContentIdea)
+        .where(
+            ContentIdea.id == idea_id,
+            ContentIdea.brand_id.in_(accessible_brands),
+        )
+        .values(status=new_status)
+        .returning(ContentIdea)
+    )
+    idea = result.scalar_one_or_none()
+    if not idea:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Idea not found",
+        )
+    await db.commit()
+    return idea
+
+
+@router.get(
+    "/brands/{brand_id}",
+    response_model=None,
+    responses={200: {"model": list[ContentIdeaListResponse]}},
+)
 async def list_ideas(
     brand_id: UUID,
     current_user: CurrentUser,
@@ -29,31 +119,55 @@ async def list_ideas(
     date_from: datetime | None = None,
     date_to: datetime | None = None,
     limit: int = Query(50, le=200),
-    offset: int = 0,
-):
-    """List content ideas for a brand."""
+    cursor: str | None = None,
+) -> Response:
+    """List content ideas for a brand, newest first.
+
+    Pages are keyset-paginated on ``(created_at, id)``: when a full page is
+    returned, the ``X-Next-Cursor`` header holds the cursor for the next one.
+    """
     await get_brand(brand_id, current_user, db)
 
-    query = select(ContentIdea).where(ContentIdea.brand_id == brand_id)
+    # lambda_stmt caches the statement per filter combination so only the
+    # bound values change between requests
+    query = lambda_stmt(
+        lambda: select(ContentIdea)
+        .options(_LIST_COLUMNS)
+        .where(ContentIdea.brand_id == brand_id)
+    )
 
     if status_filter:
-        query = query.where(ContentIdea.status == status_filter)
+        query += lambda q: q.where(ContentIdea.status == status_filter)
     if content_pillar:
-        query = query.where(ContentIdea.content_pillar == content_pillar)
+        query += lambda q: q.where(ContentIdea.content_pillar == content_pillar)
     if date_from:
-        query = query.where(ContentIdea.suggested_date >= date_from)
+        query += lambda q: q.where(ContentIdea.suggested_date >= date_from)
     if date_to:
-        query = query.where(ContentIdea.suggested_date <= date_to)
+        query += lambda q: q.where(ContentIdea.suggested_date <= date_to)
+
+    if cursor:
+        cursor_at, cursor_id = _decode_cursor(cursor)
+        query += lambda q: q.where(
+            tuple_(ContentIdea.created_at, ContentIdea.id) < tuple_(cursor_at, cursor_id)
+        )
 
-    query = query.order_by(ContentIdea.created_at.desc()).limit(limit).offset(offset)
+    query += lambda q: (
+        q.order_by(ContentIdea.created_at.desc(), ContentIdea.id.desc()).limit(limit)
+    )
 
     result = await db.execute(query)
     ideas = result.scalars().all()
-
-    return [ContentIdeaListResponse.model_validate(idea) for idea in ideas]
+    response = _list_response(ideas)
+    if len(ideas) == limit:
+        response.headers["X-Next-Cursor"] = _encode_cursor(ideas[-1])
+    return response
 
 
-@router.post("/brands/{brand_id}", response_model=ContentIdeaResponse)
+@router.post(
+    "/brands/{brand_id}",
+    response_model=ContentIdeaResponse,
+    response_model_exclude_none=True,
+)
 async def create_idea(
     brand_id: UUID,
     data: ContentIdeaCreate,
@@ -71,28 +185,27 @@ async def create_idea(
     return ContentIdeaResponse.model_validate(idea)
 
 
-@router.get("/{idea_id}", response_model=ContentIdeaResponse)
+@router.get(
+    "/{idea_id}",
+    response_model=ContentIdeaResponse,
+    response_model_exclude_none=True,
+)
 async def get_idea(
     idea_id: UUID,
     current_user: CurrentUser,
     db: DBSession,
 ):
     """Get a specific content idea."""
-    result = await db.execute(select(ContentIdea).where(ContentIdea.id == idea_id))
-    idea = result.scalar_one_or_none()
-
-    if not idea:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Idea not found",
-        )
-
-    await get_brand(idea.brand_id, current_user, db)
+    idea = await _get_idea(idea_id, current_user, db)
 
     return ContentIdeaResponse.model_validate(idea)
 
 
-@router.patch("/{idea_id}", response_model=ContentIdeaResponse)
+@router.patch(
+    "/{idea_id}",
+    response_model=ContentIdeaResponse,
+    response_model_exclude_none=True,
+)
 async def update_idea(
     idea_id: UUID,
     data: ContentIdeaUpdate,
@@ -100,16 +213,7 @@ async def update_idea(
     db: DBSession,
 ):
     """Update a content idea."""
-    result = await db.execute(select(ContentIdea).where(ContentIdea.id == idea_id))
-    idea = result.scalar_one_or_none()
-
-    if not idea:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Idea not found",
-        )
-
-    await get_brand(idea.brand_id, current_user, db)
+    idea = await _get_idea(idea_id, current_user, db)
 
     update_data = data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
@@ -128,87 +232,62 @@ async def delete_idea(
     db: DBSession,
 ):
     """Delete a content idea."""
-    result = await db.execute(select(ContentIdea).where(ContentIdea.id == idea_id))
-    idea = result.scalar_one_or_none()
-
-    if not idea:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Idea not found",
-        )
-
-    await get_brand(idea.brand_id, current_user, db)
-
-    idea.status = IdeaStatus.ARCHIVED
-    await db.commit()
+    await _set_idea_status(idea_id, current_user, db, IdeaStatus.ARCHIVED)
 
     return {"message": "Idea archived"}
 
 
-@router.post("/{idea_id}/approve", response_model=ContentIdeaResponse)
+@router.post(
+    "/{idea_id}/approve",
+    response_model=ContentIdeaResponse,
+    response_model_exclude_none=True,
+)
 async def approve_idea(
     idea_id: UUID,
     current_user: CurrentUser,
     db: DBSession,
 ):
     """Approve a content idea for production."""
-    result = await db.execute(select(ContentIdea).where(ContentIdea.id == idea_id))
-    idea = result.scalar_one_or_none()
-
-    if not idea:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Idea not found",
-        )
-
-    await get_brand(idea.brand_id, current_user, db)
-
-    idea.status = IdeaStatus.APPROVED
-    await db.commit()
-    await db.refresh(idea)
+    idea = await _set_idea_status(idea_id, current_user, db, IdeaStatus.APPROVED)
 
     return ContentIdeaResponse.model_validate(idea)
 
 
-@router.post("/{idea_id}/reject", response_model=ContentIdeaResponse)
+@router.post(
+    "/{idea_id}/reject",
+    response_model=ContentIdeaResponse,
+    response_model_exclude_none=True,
+)
 async def reject_idea(
     idea_id: UUID,
     current_user: CurrentUser,
     db: DBSession,
 ):
     """Reject a content idea."""
-    result = await db.execute(select(ContentIdea).where(ContentIdea.id == idea_id))
-    idea = result.scalar_one_or_none()
-
-    if not idea:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Idea not found",
-        )
-
-    await get_brand(idea.brand_id, current_user, db)
-
-    idea.status = IdeaStatus.REJECTED
-    await db.commit()
-    await db.refresh(idea)
+    idea = await _set_idea_status(idea_id, current_user, db, IdeaStatus.REJECTED)
 
     return ContentIdeaResponse.model_validate(idea)
 
 
-@router.get("/brands/{brand_id}/daily", response_model=list[ContentIdeaListResponse])
+@router.get(
+    "/brands/{brand_id}/daily",
+    response_model=None,
+    responses={200: {"model": list[ContentIdeaListResponse]}},
+)
 async def get_daily_ideas(
     brand_id: UUID,
     current_user: CurrentUser,
     db: DBSession,
     count: int = Query(3, le=10),
-):
+) -> Response:
     """Get today's AI-generated content ideas (morning digest)."""
     await get_brand(brand_id, current_user, db)
 
-    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    today = datetime.combine(datetime.now(timezone.utc).date(), time.min, timezone.utc)
 
     result = await db.execute(
         select(ContentIdea)
+        .options(_LIST_COLUMNS)
         .where(
             ContentIdea.brand_id == brand_id,
             ContentIdea.status == IdeaStatus.NEW,
@@ -217,6 +296,4 @@ async def get_daily_ideas(
         .order_by(ContentIdea.created_at.desc())
         .limit(count)
     )
-    ideas = result.scalars().all()
-
-    return [ContentIdeaListResponse.model_validate(idea) for idea in ideas]
+    return _list_response(result.scalars().all())
@@ -3,16 +3,21 @@ PresenceOS - Brand Interview Endpoints
 
 AI-powered conversational interview to learn about a brand.
 """
+from functools import lru_cache
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Response, status
+from pydantic import BaseModel, TypeAdapter
 
 from app.api.v1.deps import CurrentUser, DBSession, get_brand
 from app.services.brand_interview import BrandInterviewService
 
 router = APIRouter()
-interview_service = BrandInterviewService()
+
+
+@lru_cache(maxsize=1)
+def _get_interview_service() -> BrandInterviewService:
+    return BrandInterviewService()
 
 
 # ── Schemas ─────────────────────────────────────────────────────────
@@ -40,33 +45,53 @@ class InterviewStatusResponse(BaseModel):
     has_active_session: bool
 
 
+# Built once so each response is validated and encoded to JSON bytes in a
+# single pydantic-core pass, without FastAPI's response_model round trip
+_START_ADAPTER = TypeAdapter(InterviewStartResponse)
+_MESSAGE_ADAPTER = TypeAdapter(InterviewMessageResponse)
+_STATUS_ADAPTER = TypeAdapter(InterviewStatusResponse)
+
+
+def _json_response(adapter: TypeAdapter, result: dict) -> Response:
+    body = adapter.dump_json(adapter.validate_python(result))
+    return Response(content=body, media_type="application/json")
+
+
 # ── Endpoints ───────────────────────────────────────────────────────
 
-@router.post("/brands/{brand_id}/start", response_model=InterviewStartResponse)
+@router.post(
+    "/brands/{brand_id}/start",
+    response_model=None,
+    responses={200: {"model": InterviewStartResponse}},
+)
 async def start_interview(
     brand_id: UUID,
     current_user: CurrentUser,
     db: DBSession,
-):
+) -> Response:
     """Start or resume a brand interview session."""
     await get_brand(brand_id, current_user, db)
 
     try:
-        result = await interview_service.start_or_resume(str(brand_id), db)
-        return InterviewStartResponse(**result)
+        result = await _get_interview_service().start_or_resume(str(brand_id), db)
+        return _json_response(_START_ADAPTER, result)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Erreur interview: {str(e)}")
 
 
-@router.post("/brands/{brand_id}/message", response_model=InterviewMessageResponse)
+@router.post(
+    "/brands/{brand_id}/message",
+    response_model=None,
+    responses={200: {"model": InterviewMessageResponse}},
+)
 async def send_message(
     brand_id: UUID,
     body: InterviewMessageRequest,
     current_user: CurrentUser,
     db: DBSession,
-):
+) -> Response:
     """Send a message in the interview and get AI response."""
     await get_brand(brand_id, current_user, db)
 
@@ -74,23 +99,27 @@ async def send_message(
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Message vide")
 
     try:
-        result = await interview_service.process_message(str(brand_id), body.message, db)
-        return InterviewMessageResponse(**result)
+        result = await _get_interview_service().process_message(str(brand_id), body.message, db)
+        return _json_response(_MESSAGE_ADAPTER, result)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Erreur interview: {str(e)}")
 
 
-@router.get("/brands/{brand_id}/status", response_model=InterviewStatusResponse)
+@router.get(
+    "/brands/{brand_id}/status",
+    response_model=None,
+    responses={200: {"model": InterviewStatusResponse}},
+)
 async def get_interview_status(
     brand_id: UUID,
     current_user: CurrentUser,
     db: DBSession,
-):
+) -> Response:
     """Get interview completeness status for a brand."""
     await get_brand(brand_id, current_user, db)
 
     try:
-        result = await interview_service.get_status(str(brand_id), db)
-        return InterviewStatusResponse(**result)
+        result = await _get_interview_service().get_status(str(brand_id), db)
+        return _json_response(_STATUS_ADAPTER, result)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Erreur status: {str(e)}")
@@ -4,11 +4,13 @@ PresenceOS - Knowledge Base API
 Endpoints for reading, rebuilding, and checking completeness of
 the compiled Knowledge Base.
 """
+from datetime import datetime
 from uuid import UUID
 
 import structlog
-from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 
 from app.api.v1.deps import CurrentUser, DBSession, get_brand
 from app.services.knowledge_base_service import KnowledgeBaseService
@@ -21,7 +23,9 @@ router = APIRouter()
 
 
 class KBResponse(BaseModel):
-    brand_id: str
+    model_config = ConfigDict(from_attributes=True)
+
+    brand_id: UUID
     kb_version: int
     identity: dict | None
     menu: dict | None
@@ -30,38 +34,27 @@ class KBResponse(BaseModel):
     posting_history: dict | None
     performance: dict | None
     completeness_score: int
-    compiled_at: str | None
-
-    @classmethod
-    def from_orm(cls, obj) -> "KBResponse":
-        return cls(
-            brand_id=str(obj.brand_id),
-            kb_version=obj.kb_version,
-            identity=obj.identity,
-            menu=obj.menu,
-            media=obj.media,
-            today=obj.today,
-            posting_history=obj.posting_history,
-            performance=obj.performance,
-            completeness_score=obj.completeness_score,
-            compiled_at=obj.compiled_at.isoformat() if obj.compiled_at else None,
-        )
+    compiled_at: datetime | None
 
 
 class CompletenessResponse(BaseModel):
-    brand_id: str
+    brand_id: UUID
     score: int
 
 
 # ── Endpoints ────────────────────────────────────────────────────────────
 
 
-@router.get("/{brand_id}")
+@router.get(
+    "/{brand_id}",
+    response_model=None,
+    responses={200: {"model": KBResponse}},
+)
 async def get_kb(
     brand_id: UUID,
     current_user: CurrentUser,
     db: DBSession,
-) -> KBResponse | dict:
+) -> Response:
     """Read the compiled Knowledge Base for a brand."""
     await get_brand(brand_id, current_user, db)
 
@@ -69,15 +62,18 @@ async def get_kb(
     kb = await service.get_kb(str(brand_id))
 
     if not kb:
-        return {
-            "brand_id": str(brand_id),
+        return ORJSONResponse(content={
+            "brand_id": brand_id,
             "kb_version": 0,
             "completeness_score": 0,
             "compiled_at": None,
             "message": "Knowledge Base not yet compiled. Add dishes and assets, then rebuild.",
-        }
+        })
 
-    return KBResponse.from_orm(kb)
+    return Response(
+        content=KBResponse.model_validate(kb).model_dump_json(),
+        media_type="application/json",
+    )
 
 
 @router.post("/{brand_id}/rebuild")
@@ -105,7 +101,7 @@ async def rebuild_kb(
         )
 
     logger.info("KB rebuilt via API", brand_id=str(brand_id), version=kb.kb_version)
-    return KBResponse.from_orm(kb)
+    return KBResponse.model_validate(kb)
 
 
 @router.get("/{brand_id}/completeness")
@@ -124,4 +120,4 @@ async def get_completeness(
         logger.error("KB completeness calculation failed", brand_id=str(brand_id), error=str(e))
         score = 0
 
-    return CompletenessResponse(brand_id=str(brand_id), score=score)
+    return CompletenessResponse(brand_id=brand_id, score=score)
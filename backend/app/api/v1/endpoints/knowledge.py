@@ -1,12 +1,19 @@
 """
 PresenceOS - Knowledge Base Endpoints
 """
-from uuid import UUID
-
-from fastapi import APIRouter, HTTPException, Query, status
-from sqlalchemy import select, func
-
-from app.api.v1.deps import CurrentUser, DBSession, get_brand
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+import orjson
+import structlog
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import String, any_, bindparam, func, insert, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.deps import CurrentUser, DBSession, get_brand, with_brand_access
+from app.core.redis_client import get_redis
 from app.models.brand import KnowledgeItem, KnowledgeType
 from app.schemas.brand import (
     KnowledgeItemCreate,
@@ -15,14 +22,51 @@ from app.schemas.brand import (
     KnowledgeImport,
     KnowledgeImportResult,
 )
-from app.services.embeddings import EmbeddingService
+from app.utils.http_cache import PRIVATE_REVALIDATE, collection_etag, etag_matches, not_modified
 
+logger = structlog.get_logger()
 router = APIRouter()
 
+CATEGORIES_CACHE_TTL_SECONDS = 60
+CATEGORIES_KEY_PREFIX = "presenceos:knowledge:categories:"
+
+# Validates ORM rows and encodes them to JSON bytes in one pydantic-core pass
+_LIST_ADAPTER = TypeAdapter(list[KnowledgeItemResponse])
+
+
+async def _get_knowledge_item(item_id: UUID, current_user, db: AsyncSession) -> KnowledgeItem:
+    """Load a knowledge item the user can access through its brand, in one query."""
+    result = await db.execute(
+        with_brand_access(select(KnowledgeItem), KnowledgeItem.brand_id, current_user.id)
+        .where(KnowledgeItem.id == item_id)
+    )
+    item = result.scalar_one_or_none()
+
+    if not item:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Knowledge item not found",
+        )
+    return item
+
+
+async def _invalidate_categories(brand_id: UUID) -> None:
+    r = await get_redis()
+    if r:
+        try:
+            await r.delete(f"{CATEGORIES_KEY_PREFIX}{brand_id}")
+        except Exception as exc:
+            logger.warning("Knowledge category cache invalidation failed", error=str(exc))
+
 
-@router.get("/brands/{brand_id}", response_model=list[KnowledgeItemResponse])
+@router.get(
+    "/brands/{brand_id}",
+    response_model=None,
+    responses={200: {"model": list[KnowledgeItemResponse]}},
+)
 async def list_knowledge_items(
     brand_id: UUID,
+    request: Request,
     current_user: CurrentUser,
     db: DBSession,
     knowledge_type: KnowledgeType | None = None,
@@ -31,28 +75,44 @@ async def list_knowledge_items(
     is_featured: bool | None = None,
     limit: int = Query(50, le=200),
     offset: int = 0,
-):
-    """List knowledge items for a brand with filtering."""
+) -> Response:
+    """List knowledge items for a brand with filtering.
+
+    Responses carry an ETag; a matching If-None-Match gets a 304 without the
+    rows being loaded.
+    """
     await get_brand(brand_id, current_user, db)
 
-    query = select(KnowledgeItem).where(
+    conditions = [
         KnowledgeItem.brand_id == brand_id,
         KnowledgeItem.is_active == is_active,
-    )
-
+    ]
     if knowledge_type:
-        query = query.where(KnowledgeItem.knowledge_type == knowledge_type)
+        conditions.append(KnowledgeItem.knowledge_type == knowledge_type)
     if category:
-        query = query.where(KnowledgeItem.category == category)
+        conditions.append(KnowledgeItem.category == category)
     if is_featured is not None:
-        query = query.where(KnowledgeItem.is_featured == is_featured)
+        conditions.append(KnowledgeItem.is_featured == is_featured)
 
-    query = query.order_by(KnowledgeItem.title).limit(limit).offset(offset)
+    etag = await collection_etag(db, KnowledgeItem, conditions, limit, offset)
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
-    result = await db.execute(query)
+    result = await db.execute(
+        select(KnowledgeItem)
+        .where(*conditions)
+        .order_by(KnowledgeItem.title)
+        .limit(limit)
+        .offset(offset)
+    )
     items = result.scalars().all()
 
-    return [KnowledgeItemResponse.model_validate(item) for item in items]
+    rows = _LIST_ADAPTER.validate_python(items, from_attributes=True)
+    return Response(
+        content=_LIST_ADAPTER.dump_json(rows),
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": PRIVATE_REVALIDATE},
+    )
 
 
 @router.post("/brands/{brand_id}", response_model=KnowledgeItemResponse)
@@ -69,18 +129,11 @@ async def create_knowledge_item(
     db.add(item)
     await db.commit()
     await db.refresh(item)
+    await _invalidate_categories(brand_id)
 
-    # Generate embedding asynchronously (fire and forget for now)
-    # In production, this would be a background task
-    try:
-        embedding_service = EmbeddingService()
-        embedding = await embedding_service.generate_embedding(
-            f"{item.title}\n{item.content}"
-        )
-        item.embedding = embedding
-        await db.commit()
-    except Exception:
-        pass  # Log error but don't fail the request
+    # The embedding is computed by a worker so the response doesn't wait on it
+    from app.workers.content_tasks import generate_embeddings_task
+    generate_embeddings_task.delay([str(item.id)])
 
     return KnowledgeItemResponse.model_validate(item)
 
@@ -92,19 +145,7 @@ async def get_knowledge_item(
     db: DBSession,
 ):
     """Get a specific knowledge item."""
-    result = await db.execute(
-        select(KnowledgeItem).where(KnowledgeItem.id == item_id)
-    )
-    item = result.scalar_one_or_none()
-
-    if not item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Knowledge item not found",
-        )
-
-    # Verify access
-    await get_brand(item.brand_id, current_user, db)
+    item = await _get_knowledge_item(item_id, current_user, db)
 
     return KnowledgeItemResponse.model_validate(item)
 
@@ -117,18 +158,7 @@ async def update_knowledge_item(
     db: DBSession,
 ):
     """Update a knowledge item."""
-    result = await db.execute(
-        select(KnowledgeItem).where(KnowledgeItem.id == item_id)
-    )
-    item = result.scalar_one_or_none()
-
-    if not item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Knowledge item not found",
-        )
-
-    await get_brand(item.brand_id, current_user, db)
+    item = await _get_knowledge_item(item_id, current_user, db)
 
     update_data = data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
@@ -136,18 +166,13 @@ async def update_knowledge_item(
 
     await db.commit()
     await db.refresh(item)
+    if "category" in update_data or "is_active" in update_data:
+        await _invalidate_categories(item.brand_id)
 
     # Re-generate embedding if content changed
     if "content" in update_data or "title" in update_data:
-        try:
-            embedding_service = EmbeddingService()
-            embedding = await embedding_service.generate_embedding(
-                f"{item.title}\n{item.content}"
-            )
-            item.embedding = embedding
-            await db.commit()
-        except Exception:
-            pass
+        from app.workers.content_tasks import generate_embeddings_task
+        generate_embeddings_task.delay([str(item.id)])
 
     return KnowledgeItemResponse.model_validate(item)
 
@@ -159,21 +184,11 @@ async def delete_knowledge_item(
     db: DBSession,
 ):
     """Delete a knowledge item (soft delete)."""
-    result = await db.execute(
-        select(KnowledgeItem).where(KnowledgeItem.id == item_id)
-    )
-    item = result.scalar_one_or_none()
-
-    if not item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Knowledge item not found",
-        )
-
-    await get_brand(item.brand_id, current_user, db)
+    item = await _get_knowledge_item(item_id, current_user, db)
 
     item.is_active = False
     await db.commit()
+    await _invalidate_categories(item.brand_id)
 
     return {"message": "Knowledge item deleted"}
 
@@ -188,55 +203,62 @@ async def import_knowledge_items(
     """Bulk import knowledge items from CSV/JSON."""
     await get_brand(brand_id, current_user, db)
 
-    created = 0
-    updated = 0
-    errors = []
-
-    for idx, item_data in enumerate(data.items):
-        try:
-            # Check if item with same title exists
-            existing = None
-            if data.overwrite_existing:
-                result = await db.execute(
-                    select(KnowledgeItem).where(
-                        KnowledgeItem.brand_id == brand_id,
-                        KnowledgeItem.title == item_data.title,
-                        KnowledgeItem.knowledge_type == item_data.knowledge_type,
-                    )
-                )
-                existing = result.scalar_one_or_none()
-
-            if existing:
-                # Update existing
-                existing.content = item_data.content
-                existing.category = item_data.category
-                existing.metadata = item_data.metadata
-                existing.image_urls = item_data.image_urls
-                updated += 1
-            else:
-                # Create new
-                item = KnowledgeItem(
-                    brand_id=brand_id,
-                    knowledge_type=item_data.knowledge_type,
-                    title=item_data.title,
-                    content=item_data.content,
-                    category=item_data.category,
-                    metadata=item_data.metadata,
-                    image_urls=item_data.image_urls,
-                )
-                db.add(item)
-                created += 1
-
-        except Exception as e:
-            errors.append({"index": idx, "title": item_data.title, "error": str(e)})
-
+    # One lookup for every item instead of a SELECT per item. The titles go
+    # in as a single array parameter, so the statement stays the same size
+    # (and within the driver's bind limit) however large the import is; rows
+    # whose type doesn't match simply never get looked up below
+    existing: dict[tuple[str, KnowledgeType], UUID] = {}
+    if data.overwrite_existing and data.items:
+        titles = list({item.title for item in data.items})
+        result = await db.execute(
+            select(KnowledgeItem.id, KnowledgeItem.title, KnowledgeItem.knowledge_type)
+            .where(
+                KnowledgeItem.brand_id == brand_id,
+                KnowledgeItem.title == any_(bindparam("titles", titles, type_=ARRAY(String))),
+            )
+        )
+        existing = {(row.title, row.knowledge_type): row.id for row in result}
+
+    now = datetime.now(timezone.utc)
+    new_rows = []
+    updates = []
+    for item_data in data.items:
+        values = {
+            "content": item_data.content,
+            "category": item_data.category,
+            "item_metadata": item_data.metadata,
+            "image_urls": item_data.image_urls,
+        }
+        item_id = existing.get((item_data.title, item_data.knowledge_type))
+        if item_id:
+            updates.append({"id": item_id, "updated_at": now, **values})
+        else:
+            new_rows.append({
+                "id": uuid4(),
+                "brand_id": brand_id,
+                "knowledge_type": item_data.knowledge_type,
+                "title": item_data.title,
+                **values,
+            })
+
+    if new_rows:
+        await db.execute(insert(KnowledgeItem), new_rows)
+    if updates:
+        await db.execute(update(KnowledgeItem), updates)
     await db.commit()
+    await _invalidate_categories(brand_id)
+
+    # Every imported item gets its embedding from a single batched task
+    item_ids = [str(row["id"]) for row in new_rows + updates]
+    if item_ids:
+        from app.workers.content_tasks import generate_embeddings_task
+        generate_embeddings_task.delay(item_ids)
 
     return KnowledgeImportResult(
         total=len(data.items),
-        created=created,
-        updated=updated,
-        errors=errors,
+        created=len(new_rows),
+        updated=len(updates),
+        errors=[],
     )
 
 
@@ -245,19 +267,38 @@ async def get_knowledge_categories(
     brand_id: UUID,
     current_user: CurrentUser,
     db: DBSession,
-):
-    """Get all unique categories for a brand."""
+) -> Response:
+    """Get all unique categories for a brand (cached briefly in Redis)."""
     await get_brand(brand_id, current_user, db)
 
+    key = f"{CATEGORIES_KEY_PREFIX}{brand_id}"
+    r = await get_redis()
+    if r:
+        try:
+            cached = await r.get(key)
+        except Exception as exc:
+            logger.warning("Knowledge category cache lookup failed", error=str(exc))
+            cached = None
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
     result = await db.execute(
         select(KnowledgeItem.category)
         .where(
             KnowledgeItem.brand_id == brand_id,
             KnowledgeItem.category.isnot(None),
+            KnowledgeItem.category != "",
             KnowledgeItem.is_active == True,
         )
         .distinct()
+        .order_by(KnowledgeItem.category)
     )
-    categories = [row[0] for row in result.all() if row[0]]
+    body = orjson.dumps({"categories": result.scalars().all()})
+
+    if r:
+        try:
+            await r.set(key, body, ex=CATEGORIES_CACHE_TTL_SECONDS)
+        except Exception as exc:
+            logger.warning("Knowledge category cache store failed", error=str(exc))
 
-    return {"categories": sorted(categories)}
+    return Response(content=body, media_type="application/json")
@@ -5,14 +5,15 @@ from typing import Optional
 from uuid import UUID
 
 import structlog
-from fastapi import APIRouter, Depends, File, Form, UploadFile, HTTPException, Query
+from fastapi import APIRouter, Depends, File, Form, Request, UploadFile, HTTPException, Query
 from pydantic import BaseModel
 
 from app.api.v1.deps import CurrentUser, DBSession
 from app.models.media import MediaAsset, MediaType, MediaSource
 from app.models.user import User
-from app.services.storage import get_storage_service, StorageService, LocalStorageService
-from app.utils.file_validation import validate_image_upload, ALLOWED_IMAGE_EXTENSIONS
+from app.services.media_stats_cache import invalidate_media_stats
+from app.services.storage import get_storage_service_async, StorageService, LocalStorageService
+from app.utils.file_validation import check_upload_size, validate_image_upload, ALLOWED_IMAGE_EXTENSIONS
 
 logger = structlog.get_logger()
 
@@ -42,7 +43,7 @@ class PresignedUrlResponse(BaseModel):
 
 
 # Allowed content types for media uploads
-ALLOWED_IMAGE_TYPES = {
+ALLOWED_IMAGE_TYPES = frozenset({
     "image/jpeg",
     "image/jpg",
     "image/png",
@@ -50,38 +51,38 @@ ALLOWED_IMAGE_TYPES = {
     "image/webp",
     "image/heic",
     "image/heif",
-}
+})
 
-ALLOWED_VIDEO_TYPES = {
+ALLOWED_VIDEO_TYPES = frozenset({
     "video/mp4",
     "video/quicktime",
     "video/webm",
     "video/x-msvideo",
-}
+})
 
 ALLOWED_TYPES = ALLOWED_IMAGE_TYPES | ALLOWED_VIDEO_TYPES
+_ALLOWED_TYPES_LABEL = ", ".join(sorted(ALLOWED_TYPES))
 
 # Max file sizes (in bytes)
 MAX_IMAGE_SIZE = 20 * 1024 * 1024  # 20 MB
 MAX_VIDEO_SIZE = 500 * 1024 * 1024  # 500 MB
 
-
-def get_max_size(content_type: str) -> int:
-    """Get max file size based on content type."""
-    if content_type in ALLOWED_VIDEO_TYPES:
-        return MAX_VIDEO_SIZE
-    return MAX_IMAGE_SIZE
+MAX_SIZE_BY_TYPE = {
+    **{t: MAX_IMAGE_SIZE for t in ALLOWED_IMAGE_TYPES},
+    **{t: MAX_VIDEO_SIZE for t in ALLOWED_VIDEO_TYPES},
+}
 
 
 @router.post("/brands/{brand_id}/upload", response_model=UploadResponse)
 async def upload_media(
     brand_id: UUID,
+    request: Request,
     current_user: CurrentUser,
     db: DBSession,
     file: UploadFile = File(...),
     label: str | None = Form(None),
     linked_dish_id: str | None = Form(None),
-    storage: StorageService | LocalStorageService = Depends(get_storage_service),
+    storage: StorageService | LocalStorageService = Depends(get_storage_service_async),
 ):
     """
     Upload a media file (image or video) for a brand.
@@ -94,29 +95,37 @@ async def upload_media(
     """
     # Validate content type
     content_type = file.content_type
-    if content_type not in ALLOWED_TYPES:
+    max_size = MAX_SIZE_BY_TYPE.get(content_type)
+    if max_size is None:
         raise HTTPException(
             status_code=400,
             detail=f"Type de fichier non supporte: {content_type}. "
-                   f"Types acceptes: {', '.join(ALLOWED_TYPES)}",
+                   f"Types acceptes: {_ALLOWED_TYPES_LABEL}",
         )
 
-    # Check file size (approximate, from content-length header)
-    max_size = get_max_size(content_type)
+    check_upload_size(request, file, max_size)
 
-    # Read and validate file content
     if content_type in ALLOWED_IMAGE_TYPES:
         # validate_image_upload reads the file, checks extension, size, magic bytes, and dimensions
         content, _file_hash = await validate_image_upload(file)
+        file_size = len(content)
+        # Only the size was needed; the upload re-reads the spooled file
+        del content
+    elif file.size is not None:
+        file_size = file.size
     else:
-        content = await file.read()
+        file.file.seek(0, 2)
+        file_size = file.file.tell()
 
-    file_size = len(content)
+    # Every upload is streamed to storage straight from the spooled temporary
+    # file Starlette already wrote, never held in memory as one bytes object
+    body = file.file
+    body.seek(0)
 
     if file_size > max_size:
         max_mb = max_size // (1024 * 1024)
         raise HTTPException(
-            status_code=400,
+            status_code=413,
             detail=f"Fichier trop volumineux. Taille maximale: {max_mb} MB",
         )
 
@@ -128,10 +137,9 @@ async def upload_media(
     )
 
     # Upload file
-    from io import BytesIO
     try:
         result = await storage.upload_file(
-            file=BytesIO(content),
+            file=body,
             key=key,
             content_type=content_type,
             metadata={
@@ -170,6 +178,7 @@ async def upload_media(
     )
     db.add(asset)
     await db.commit()
+    await invalidate_media_stats(brand_id)
 
     logger.info(
         "Media uploaded and saved",
@@ -192,7 +201,7 @@ async def get_presigned_upload_url(
     brand_id: UUID,
     request: PresignedUrlRequest,
     current_user: CurrentUser,
-    storage: StorageService | LocalStorageService = Depends(get_storage_service),
+    storage: StorageService | LocalStorageService = Depends(get_storage_service_async),
 ):
     """
     Get a presigned URL for direct upload to S3/MinIO.
@@ -236,7 +245,7 @@ async def delete_media(
     brand_id: UUID,
     key: str,
     current_user: CurrentUser,
-    storage: StorageService | LocalStorageService = Depends(get_storage_service),
+    storage: StorageService | LocalStorageService = Depends(get_storage_service_async),
 ):
     """Delete a media file."""
     # Verify the key belongs to this brand
@@ -261,7 +270,7 @@ async def get_media_info(
     brand_id: UUID,
     key: str,
     current_user: CurrentUser,
-    storage: StorageService | LocalStorageService = Depends(get_storage_service),
+    storage: StorageService | LocalStorageService = Depends(get_storage_service_async),
 ):
     """Get information about a media file."""
     # Verify the key belongs to this brand
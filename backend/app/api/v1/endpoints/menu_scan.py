@@ -3,15 +3,19 @@ PresenceOS - Menu Scan API
 
 Endpoints for OCR scanning paper menu photos and importing extracted dishes.
 """
+import asyncio
+from typing import Literal
 from uuid import UUID
 
 import structlog
-from fastapi import APIRouter, HTTPException, UploadFile, File, status
+from fastapi import APIRouter, HTTPException, Request, UploadFile, File, status
 from pydantic import BaseModel, Field
 
 from app.api.v1.deps import CurrentUser, DBSession, get_brand
-from app.services.ocr_service import OCRService
+from app.core.config import settings
+from app.services.ocr_service import enqueue_scan_job, get_scan_job
 from app.services.content_library import ContentLibraryService
+from app.utils.file_validation import check_upload_size
 
 logger = structlog.get_logger()
 router = APIRouter()
@@ -30,9 +34,18 @@ class DishScanItem(BaseModel):
     description: str | None
 
 
-class ScanResultResponse(BaseModel):
-    dishes: list[DishScanItem]
-    total: int
+class ScanJobAccepted(BaseModel):
+    job_id: str
+    status: Literal["pending"]
+    status_url: str
+
+
+class ScanJobResponse(BaseModel):
+    job_id: str
+    status: Literal["pending", "done", "failed"]
+    dishes: list[DishScanItem] = []
+    total: int = 0
+    error: str | None = None
 
 
 class ImportRequest(BaseModel):
@@ -47,19 +60,26 @@ class ImportResponse(BaseModel):
 # ── Endpoints ────────────────────────────────────────────────────────────
 
 
-@router.post("/{brand_id}/scan")
+def _scan_unavailable() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Menu scanning is temporarily unavailable. Please try again shortly.",
+    )
+
+
+@router.post("/{brand_id}/scan", status_code=status.HTTP_202_ACCEPTED)
 async def scan_menu(
     brand_id: UUID,
+    request: Request,
     current_user: CurrentUser,
     db: DBSession,
     file: UploadFile = File(...),
-) -> ScanResultResponse:
-    """Upload a menu photo and extract dishes via OCR.
+) -> ScanJobAccepted:
+    """Upload a menu photo and queue dish extraction via OCR.
 
-    Returns a list of extracted dishes for user validation before import.
+    The OCR runs in a worker; poll ``status_url`` for the extracted dishes,
+    which are returned for user validation before import.
     """
-    await get_brand(brand_id, current_user, db)
-
     # Validate file
     if file.content_type not in ALLOWED_MIME_TYPES:
         raise HTTPException(
@@ -67,25 +87,63 @@ async def scan_menu(
             detail=f"Unsupported file type: {file.content_type}. Allowed: JPEG, PNG, WebP, HEIC.",
         )
 
-    contents = await file.read()
+    check_upload_size(request, file, MAX_SCAN_SIZE)
+
+    # The brand check and the read of the spooled upload are independent
+    _, contents = await asyncio.gather(
+        get_brand(brand_id, current_user, db),
+        file.read(),
+    )
     if len(contents) > MAX_SCAN_SIZE:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
             detail=f"File too large. Max size: {MAX_SCAN_SIZE // (1024*1024)} MB.",
         )
 
-    ocr = OCRService()
     try:
-        raw_dishes = await ocr.scan_menu_image(contents, file.content_type or "image/jpeg")
+        job_id = await enqueue_scan_job(
+            str(brand_id), contents, file.content_type or "image/jpeg"
+        )
     except Exception as exc:
-        logger.error("Menu scan failed", error=str(exc))
+        logger.error("Menu scan enqueue failed", error=str(exc))
+        raise _scan_unavailable()
+
+    return ScanJobAccepted(
+        job_id=job_id,
+        status="pending",
+        status_url=f"{settings.api_v1_prefix}/menu/{brand_id}/scan/jobs/{job_id}",
+    )
+
+
+@router.get("/{brand_id}/scan/jobs/{job_id}")
+async def get_scan_job_status(
+    brand_id: UUID,
+    job_id: str,
+    current_user: CurrentUser,
+    db: DBSession,
+) -> ScanJobResponse:
+    """Poll a menu scan job; ``dishes`` is filled once ``status`` is "done"."""
+    await get_brand(brand_id, current_user, db)
+
+    try:
+        job = await get_scan_job(job_id)
+    except Exception as exc:
+        logger.error("Menu scan job lookup failed", job_id=job_id, error=str(exc))
+        raise _scan_unavailable()
+    if job is None or job.get("brand_id") != str(brand_id):
         raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail="Could not extract menu items from this image. Please try a clearer photo.",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Scan job not found",
         )
 
-    dishes = [DishScanItem(**d) for d in raw_dishes]
-    return ScanResultResponse(dishes=dishes, total=len(dishes))
+    dishes = [DishScanItem(**d) for d in job.get("dishes", [])]
+    return ScanJobResponse(
+        job_id=job_id,
+        status=job["status"],
+        dishes=dishes,
+        total=len(dishes),
+        error=job.get("error"),
+    )
 
 
 @router.post("/{brand_id}/scan/import", status_code=status.HTTP_201_CREATED)
@@ -5,15 +5,14 @@ from datetime import datetime, timezone, timedelta
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, true
 
 from app.api.v1.deps import CurrentUser, DBSession, get_brand
 from app.models.publishing import (
     MetricsSnapshot,
     ScheduledPost,
-    SocialConnector,
     PostStatus,
+    brand_daily_metrics,
 )
 from app.schemas.publishing import MetricsResponse, MetricsSummary
 from pydantic import BaseModel
@@ -54,72 +53,72 @@ async def get_dashboard_metrics(
 
     start_date = datetime.now(timezone.utc) - timedelta(days=days)
 
-    # Get published posts count
-    published_result = await db.execute(
-        select(func.count(ScheduledPost.id)).where(
-            ScheduledPost.brand_id == brand_id,
-            ScheduledPost.status == PostStatus.PUBLISHED,
-            ScheduledPost.published_at >= start_date,
-        )
-    )
-    total_published = published_result.scalar() or 0
-
-    # Get scheduled posts count
-    scheduled_result = await db.execute(
-        select(func.count(ScheduledPost.id)).where(
-            ScheduledPost.brand_id == brand_id,
-            ScheduledPost.status == PostStatus.SCHEDULED,
-        )
-    )
-    total_scheduled = scheduled_result.scalar() or 0
-
-    # Get metrics aggregates
-    metrics_result = await db.execute(
+    # Every KPI comes back from one statement: post counts via FILTER
+    # aggregates, snapshot totals, and the top platform as a scalar subquery.
+    # Each part aggregates to exactly one row, so they cross-join into one.
+    # Snapshot figures come from the daily rollup (refreshed every few
+    # minutes), whole UTC days from the window's first day onwards
+    posts = (
         select(
-            func.sum(MetricsSnapshot.impressions),
-            func.sum(MetricsSnapshot.likes),
-            func.sum(MetricsSnapshot.comments),
-            func.sum(MetricsSnapshot.shares),
-            func.sum(MetricsSnapshot.saves),
-            func.avg(MetricsSnapshot.engagement_rate),
-        )
-        .join(SocialConnector)
-        .where(
-            SocialConnector.brand_id == brand_id,
-            MetricsSnapshot.snapshot_date >= start_date,
-            MetricsSnapshot.post_id.isnot(None),
+            func.count(ScheduledPost.id)
+            .filter(
+                ScheduledPost.status == PostStatus.PUBLISHED,
+                ScheduledPost.published_at >= start_date,
+            )
+            .label("published"),
+            func.count(ScheduledPost.id)
+            .filter(ScheduledPost.status == PostStatus.SCHEDULED)
+            .label("scheduled"),
         )
+        .where(ScheduledPost.brand_id == brand_id)
+        .subquery()
     )
-    metrics = metrics_result.one()
-
-    total_impressions = metrics[0] or 0
-    total_likes = metrics[1] or 0
-    total_comments = metrics[2] or 0
-    total_shares = metrics[3] or 0
-    total_saves = metrics[4] or 0
-    avg_engagement_rate = float(metrics[5] or 0)
-
-    total_engagement = total_likes + total_comments + total_shares + total_saves
-
-    # Find top platform
-    platform_result = await db.execute(
+    daily = brand_daily_metrics.c
+    in_window = (daily.brand_id == brand_id, daily.day >= start_date.date())
+    totals = (
         select(
-            SocialConnector.platform,
-            func.sum(MetricsSnapshot.impressions + MetricsSnapshot.likes).label(
-                "score"
-            ),
+            func.sum(daily.impressions).label("impressions"),
+            func.sum(daily.likes).label("likes"),
+            func.sum(daily.comments).label("comments"),
+            func.sum(daily.shares).label("shares"),
+            func.sum(daily.saves).label("saves"),
+            (
+                func.sum(daily.engagement_rate_sum)
+                / func.nullif(func.sum(daily.engagement_rate_count), 0)
+            ).label("engagement_rate"),
         )
-        .join(SocialConnector)
-        .where(
-            SocialConnector.brand_id == brand_id,
-            MetricsSnapshot.snapshot_date >= start_date,
+        .where(*in_window)
+        .subquery()
+    )
+    top_platform_query = (
+        select(daily.platform)
+        .where(*in_window)
+        .group_by(daily.platform)
+        .order_by(
+            (
+                func.coalesce(func.sum(daily.impressions), 0)
+                + func.coalesce(func.sum(daily.likes), 0)
+            ).desc()
         )
-        .group_by(SocialConnector.platform)
-        .order_by(func.sum(MetricsSnapshot.impressions + MetricsSnapshot.likes).desc())
         .limit(1)
+        .scalar_subquery()
+    )
+
+    result = await db.execute(
+        select(posts, totals, top_platform_query.label("top_platform"))
+        .select_from(posts.join(totals, true()))
     )
-    top_platform_row = platform_result.first()
-    top_platform = top_platform_row[0].value if top_platform_row else None
+    row = result.one()
+
+    # Sums over the view's bigint columns come back as numeric
+    total_published = row.published or 0
+    total_scheduled = row.scheduled or 0
+    total_impressions = int(row.impressions or 0)
+    avg_engagement_rate = float(row.engagement_rate or 0)
+    total_engagement = int(
+        (row.likes or 0) + (row.comments or 0) + (row.shares or 0) + (row.saves or 0)
+    )
+    top_platform = row.top_platform.value if row.top_platform else None
 
     # Generate AI insight
     ai_insight = None
@@ -155,25 +154,20 @@ async def get_platform_breakdown(
 
     start_date = datetime.now(timezone.utc) - timedelta(days=days)
 
+    daily = brand_daily_metrics.c
     result = await db.execute(
         select(
-            SocialConnector.platform,
-            func.count(MetricsSnapshot.id).label("posts_count"),
-            func.sum(MetricsSnapshot.impressions).label("total_impressions"),
-            func.sum(
-                MetricsSnapshot.likes
-                + MetricsSnapshot.comments
-                + MetricsSnapshot.shares
-            ).label("total_engagement"),
-            func.avg(MetricsSnapshot.engagement_rate).label("avg_engagement"),
-        )
-        .join(SocialConnector)
-        .where(
-            SocialConnector.brand_id == brand_id,
-            MetricsSnapshot.snapshot_date >= start_date,
-            MetricsSnapshot.post_id.isnot(None),
+            daily.platform,
+            func.sum(daily.snapshots_count).label("posts_count"),
+            func.sum(daily.impressions).label("total_impressions"),
+            func.sum(daily.engagement).label("total_engagement"),
+            (
+                func.sum(daily.engagement_rate_sum)
+                / func.nullif(func.sum(daily.engagement_rate_count), 0)
+            ).label("avg_engagement"),
         )
-        .group_by(SocialConnector.platform)
+        .where(daily.brand_id == brand_id, daily.day >= start_date.date())
+        .group_by(daily.platform)
     )
 
     platforms = []
@@ -181,9 +175,9 @@ async def get_platform_breakdown(
         platforms.append(
             PlatformBreakdown(
                 platform=row.platform.value,
-                posts_count=row.posts_count or 0,
-                total_impressions=row.total_impressions or 0,
-                total_engagement=row.total_engagement or 0,
+                posts_count=int(row.posts_count or 0),
+                total_impressions=int(row.total_impressions or 0),
+                total_engagement=int(row.total_engagement or 0),
                 average_engagement_rate=float(row.avg_engagement or 0),
             )
         )
@@ -256,34 +250,47 @@ async def get_top_posts(
         "reach": MetricsSnapshot.reach,
     }[metric]
 
+    # Only the columns the response needs, with the caption preview cut in
+    # SQL, so neither the full content snapshot nor ORM objects are loaded
     result = await db.execute(
-        select(ScheduledPost, MetricsSnapshot)
+        select(
+            ScheduledPost.id,
+            ScheduledPost.platform_post_url,
+            ScheduledPost.published_at,
+            func.substring(
+                func.coalesce(ScheduledPost.content_snapshot["caption"].astext, ""), 1, 100
+            ).label("caption_preview"),
+            MetricsSnapshot.impressions,
+            MetricsSnapshot.reach,
+            MetricsSnapshot.likes,
+            MetricsSnapshot.comments,
+            MetricsSnapshot.shares,
+            MetricsSnapshot.engagement_rate,
+        )
         .join(MetricsSnapshot, ScheduledPost.id == MetricsSnapshot.post_id)
-        .join(SocialConnector)
         .where(
-            SocialConnector.brand_id == brand_id,
+            ScheduledPost.brand_id == brand_id,
             ScheduledPost.status == PostStatus.PUBLISHED,
         )
         .order_by(order_column.desc())
         .limit(limit)
     )
 
-    top_posts = []
-    for post, metrics in result.all():
-        top_posts.append(
-            {
-                "post_id": str(post.id),
-                "platform_post_url": post.platform_post_url,
-                "published_at": post.published_at.isoformat() if post.published_at else None,
-                "caption_preview": post.content_snapshot.get("caption", "")[:100],
-                "impressions": metrics.impressions,
-                "reach": metrics.reach,
-                "likes": metrics.likes,
-                "comments": metrics.comments,
-                "shares": metrics.shares,
-                "engagement_rate": metrics.engagement_rate,
-            }
-        )
+    top_posts = [
+        {
+            "post_id": str(row.id),
+            "platform_post_url": row.platform_post_url,
+            "published_at": row.published_at.isoformat() if row.published_at else None,
+            "caption_preview": row.caption_preview,
+            "impressions": row.impressions,
+            "reach": row.reach,
+            "likes": row.likes,
+            "comments": row.comments,
+            "shares": row.shares,
+            "engagement_rate": row.engagement_rate,
+        }
+        for row in result.all()
+    ]
 
     return {"posts": top_posts}
 
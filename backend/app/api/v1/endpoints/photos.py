@@ -4,8 +4,10 @@ PresenceOS - Photo Enhancement API (Feature 2)
 Endpoints for AI-powered photo enhancement optimized for food marketing.
 """
 import os
+from functools import lru_cache
 from typing import Optional
 
+import orjson
 import structlog
 from fastapi import APIRouter, File, UploadFile, HTTPException, Query
 from pydantic import BaseModel
@@ -15,19 +17,26 @@ from app.services.photo_enhancer import (
     PhotoStyle,
     PhotoQuality,
     ENHANCED_DIR,
+    scores_path,
 )
 
 logger = structlog.get_logger()
 router = APIRouter()
 
-_service: PhotoEnhancerService | None = None
-
 
+@lru_cache(maxsize=1)
 def _get_service() -> PhotoEnhancerService:
-    global _service
-    if _service is None:
-        _service = PhotoEnhancerService()
-    return _service
+    return PhotoEnhancerService()
+
+
+@lru_cache(maxsize=1024)
+def _load_scores(enhance_id: str) -> dict:
+    """Read an enhancement's score sidecar; scores never change once written.
+
+    A missing sidecar raises FileNotFoundError, which lru_cache doesn't keep.
+    """
+    with open(scores_path(enhance_id), "rb") as f:
+        return orjson.loads(f.read())
 
 
 # ── Response Models ────────────────────────────────────────
@@ -165,23 +174,26 @@ async def get_comparison(enhance_id: str):
         original = os.path.join(ENHANCED_DIR, f"{enhance_id}_original.{ext}")
         enhanced = os.path.join(ENHANCED_DIR, f"{enhance_id}_enhanced.{ext}")
         if os.path.exists(original) and os.path.exists(enhanced):
-            # Re-compute quality scores
-            service = _get_service()
-            with open(original, "rb") as f:
-                original_data = f.read()
-            with open(enhanced, "rb") as f:
-                enhanced_data = f.read()
-
-            quality_before = service.get_quality_score(original_data)
-            quality_after = service.get_quality_score(enhanced_data)
+            try:
+                scores = _load_scores(enhance_id)
+            except FileNotFoundError:
+                # Enhanced before scores were recorded: compute them from the files
+                service = _get_service()
+                with open(original, "rb") as f:
+                    quality_before = service.get_quality_score(f.read())
+                with open(enhanced, "rb") as f:
+                    quality_after = service.get_quality_score(f.read())
+                scores = {
+                    "quality_before": quality_before,
+                    "quality_after": quality_after,
+                    "improvement": quality_after["score"] - quality_before["score"],
+                }
 
             return {
                 "id": enhance_id,
                 "original_url": f"/uploads/enhanced/{enhance_id}_original.{ext}",
                 "enhanced_url": f"/uploads/enhanced/{enhance_id}_enhanced.{ext}",
-                "quality_before": quality_before,
-                "quality_after": quality_after,
-                "improvement": quality_after["score"] - quality_before["score"],
+                **scores,
             }
 
     raise HTTPException(status_code=404, detail="Enhancement non trouve")
@@ -13,7 +13,7 @@ from uuid import UUID
 
 import structlog
 from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import func, select, and_
 
 from app.api.v1.deps import CurrentUser, DBSession, get_brand
@@ -28,8 +28,10 @@ router = APIRouter()
 
 
 class ProposalResponse(BaseModel):
-    id: str
-    brand_id: str
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    brand_id: UUID
     proposal_type: str
     platform: str
     caption: str | None
@@ -40,37 +42,13 @@ class ProposalResponse(BaseModel):
     source: str
     source_id: str | None
     status: str
-    scheduled_at: str | None
-    published_at: str | None
+    scheduled_at: datetime | None
+    published_at: datetime | None
     rejection_reason: str | None
     kb_version: int
     confidence_score: float
-    created_at: str
-    updated_at: str
-
-    @classmethod
-    def from_orm(cls, obj: AIProposal) -> "ProposalResponse":
-        return cls(
-            id=str(obj.id),
-            brand_id=str(obj.brand_id),
-            proposal_type=obj.proposal_type,
-            platform=obj.platform,
-            caption=obj.caption,
-            hashtags=obj.hashtags,
-            image_url=obj.image_url,
-            video_url=obj.video_url,
-            improved_image_url=obj.improved_image_url,
-            source=obj.source,
-            source_id=obj.source_id,
-            status=obj.status,
-            scheduled_at=obj.scheduled_at.isoformat() if obj.scheduled_at else None,
-            published_at=obj.published_at.isoformat() if obj.published_at else None,
-            rejection_reason=obj.rejection_reason,
-            kb_version=obj.kb_version,
-            confidence_score=obj.confidence_score,
-            created_at=obj.created_at.isoformat(),
-            updated_at=obj.updated_at.isoformat(),
-        )
+    created_at: datetime
+    updated_at: datetime
 
 
 class ApproveProposalRequest(BaseModel):
@@ -158,7 +136,7 @@ async def list_proposals(
     proposals = result.scalars().all()
 
     return {
-        "proposals": [ProposalResponse.from_orm(p) for p in proposals],
+        "proposals": [ProposalResponse.model_validate(p) for p in proposals],
         "total": total,
         "limit": limit,
         "offset": offset,
@@ -241,7 +219,7 @@ async def approve_proposal(
             )
 
     logger.info("Proposal approved", proposal_id=str(proposal_id), status=proposal.status)
-    return ProposalResponse.from_orm(proposal)
+    return ProposalResponse.model_validate(proposal)
 
 
 @router.post("/{brand_id}/{proposal_id}/reject")
@@ -267,7 +245,7 @@ async def reject_proposal(
     await db.refresh(proposal)
 
     logger.info("Proposal rejected", proposal_id=str(proposal_id))
-    return ProposalResponse.from_orm(proposal)
+    return ProposalResponse.model_validate(proposal)
 
 
 @router.put("/{brand_id}/{proposal_id}/caption")
@@ -289,7 +267,7 @@ async def edit_caption(
     await db.refresh(proposal)
 
     logger.info("Proposal caption edited", proposal_id=str(proposal_id))
-    return ProposalResponse.from_orm(proposal)
+    return ProposalResponse.model_validate(proposal)
 
 
 @router.post("/{brand_id}/{proposal_id}/regenerate", status_code=status.HTTP_201_CREATED)
@@ -314,4 +292,4 @@ async def regenerate_proposal(
             detail="Failed to regenerate proposal",
         )
 
-    return ProposalResponse.from_orm(new_proposal)
+    return ProposalResponse.model_validate(new_proposal)
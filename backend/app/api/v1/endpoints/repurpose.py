@@ -3,6 +3,7 @@ PresenceOS — Content Repurposing API (Feature 4)
 
 Endpoints for transforming one piece of content into multiple platform-adapted formats.
 """
+from functools import lru_cache
 from typing import Optional
 
 import structlog
@@ -14,14 +15,10 @@ from app.services.content_repurposer import ContentRepurposerService
 logger = structlog.get_logger()
 router = APIRouter()
 
-_service: ContentRepurposerService | None = None
-
 
+@lru_cache(maxsize=1)
 def _get_service() -> ContentRepurposerService:
-    global _service
-    if _service is None:
-        _service = ContentRepurposerService()
-    return _service
+    return ContentRepurposerService()
 
 
 # ── Request/Response Models ────────────────────────────────
@@ -1,6 +1,7 @@
 """
 PresenceOS — Reputation Manager API (Feature 3)
 """
+from functools import lru_cache
 from typing import Optional
 
 import structlog
@@ -12,14 +13,10 @@ from app.services.reputation_manager import ReputationManagerService
 logger = structlog.get_logger()
 router = APIRouter()
 
-_service: ReputationManagerService | None = None
-
 
+@lru_cache(maxsize=1)
 def _get_service() -> ReputationManagerService:
-    global _service
-    if _service is None:
-        _service = ReputationManagerService()
-    return _service
+    return ReputationManagerService()
 
 
 class RespondRequest(BaseModel):
@@ -3,6 +3,7 @@ PresenceOS - Smart Scheduling API (Feature 1)
 
 Endpoints for intelligent post scheduling based on optimal engagement times.
 """
+from functools import lru_cache
 from typing import Optional
 
 import structlog
@@ -14,14 +15,10 @@ from app.services.smart_scheduler import SmartSchedulerService
 logger = structlog.get_logger()
 router = APIRouter()
 
-_service: SmartSchedulerService | None = None
-
 
+@lru_cache(maxsize=1)
 def _get_service() -> SmartSchedulerService:
-    global _service
-    if _service is None:
-        _service = SmartSchedulerService()
-    return _service
+    return SmartSchedulerService()
 
 
 # ── Request/Response Models ────────────────────────────────
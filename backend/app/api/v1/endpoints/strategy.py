@@ -9,6 +9,7 @@ When a brand_id is provided, the analysis is hyper-personalized
 using the Brand's name, type, description, audience, locations,
 constraints, content pillars, and BrandVoice settings.
 """
+from functools import lru_cache
 from typing import Any
 from uuid import UUID
 
@@ -28,14 +29,9 @@ from app.models.brand import Brand
 logger = structlog.get_logger()
 router = APIRouter()
 
-_analyzer: MarketAnalyzer | None = None
-
-
+@lru_cache(maxsize=1)
 def _get_analyzer() -> MarketAnalyzer:
-    global _analyzer
-    if _analyzer is None:
-        _analyzer = MarketAnalyzer()
-    return _analyzer
+    return MarketAnalyzer()
 
 
 # ── Helpers ─────────────────────────────────────────────────────────────────
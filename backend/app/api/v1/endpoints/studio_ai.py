@@ -7,6 +7,7 @@ Named studio_ai to avoid conflict with any existing studio.py.
 When a brand_id is provided, the brand name is injected into DALL-E
 prompts so the visual aesthetic matches the brand identity.
 """
+from functools import lru_cache
 from uuid import UUID
 
 import structlog
@@ -24,14 +25,9 @@ from app.models.brand import Brand
 logger = structlog.get_logger()
 router = APIRouter()
 
-_photo_service: PhotoStudio | None = None
-
-
+@lru_cache(maxsize=1)
 def _get_photo_service() -> PhotoStudio:
-    global _photo_service
-    if _photo_service is None:
-        _photo_service = PhotoStudio()
-    return _photo_service
+    return PhotoStudio()
 
 
 # ── Helpers ─────────────────────────────────────────────────────────────────
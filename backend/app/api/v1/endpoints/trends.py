@@ -1,6 +1,7 @@
 """
 PresenceOS — Trend Radar API (Feature 8)
 """
+from functools import lru_cache
 from typing import Optional
 
 import structlog
@@ -11,14 +12,10 @@ from app.services.trend_radar import TrendRadarService
 logger = structlog.get_logger()
 router = APIRouter()
 
-_service: TrendRadarService | None = None
-
 
+@lru_cache(maxsize=1)
 def _get_service() -> TrendRadarService:
-    global _service
-    if _service is None:
-        _service = TrendRadarService()
-    return _service
+    return TrendRadarService()
 
 
 @router.get("/trends/{brand_id}")
@@ -27,6 +27,7 @@ from app.models.publishing import (
     ConnectorStatus,
     SocialPlatform,
 )
+from app.services.media_stats_cache import invalidate_media_stats
 from app.services.whatsapp import WhatsAppService
 from app.services.storage import get_storage_service
 from app.services.vision import VisionService
@@ -235,6 +236,7 @@ async def _handle_image_message(message: dict, sender_phone: str):
             await db.commit()
             await db.refresh(asset)
             asset_id = str(asset.id)
+        await invalidate_media_stats(brand_id)
 
         # Analyze with Vision AI (fire and forget, update DB after)
         try:
@@ -242,15 +244,13 @@ async def _handle_image_message(message: dict, sender_phone: str):
             analysis = await vision.analyze_image(file_bytes, mime_type)
 
             async with async_session_maker() as db:
-                result = await db.execute(
-                    select(MediaAsset).where(MediaAsset.id == asset_id)
-                )
-                asset = result.scalar_one_or_none()
+                asset = await db.get(MediaAsset, asset.id)
                 if asset:
                     asset.ai_description = analysis.get("description", "")
                     asset.ai_tags = analysis.get("tags", [])
                     asset.ai_analyzed = True
                     await db.commit()
+                    await invalidate_media_stats(brand_id)
         except Exception as vision_err:
             logger.warning("Vision analysis failed", error=str(vision_err))
 
@@ -354,6 +354,7 @@ async def _handle_video_message(message: dict, sender_phone: str):
             )
             db.add(asset)
             await db.commit()
+        await invalidate_media_stats(brand_id)
 
         # Create PendingPost if caption present
         if caption_text and config_id:
@@ -454,6 +455,7 @@ async def _handle_audio_message(message: dict, sender_phone: str):
             )
             db.add(voice_note)
             await db.commit()
+        await invalidate_media_stats(brand_id)
 
         # Send back the transcription
         msg = "Message vocal recu !"
@@ -604,18 +606,16 @@ async def _handle_approve(pending_post_id: str, sender_phone: str):
 
         # Determine posting time
         posting_time = datetime.now(timezone.utc)
-        if pending.config and pending.config.preferred_posting_time:
-            try:
-                h, m = pending.config.preferred_posting_time.split(":")
-                posting_time = posting_time.replace(
-                    hour=int(h), minute=int(m), second=0
-                )
-                # If the time already passed today, schedule for tomorrow
-                if posting_time < datetime.now(timezone.utc):
-                    from datetime import timedelta
-                    posting_time += timedelta(days=1)
-            except ValueError:
-                pass
+        if pending.config and pending.config.preferred_posting_hour is not None:
+            posting_time = posting_time.replace(
+                hour=pending.config.preferred_posting_hour,
+                minute=pending.config.preferred_posting_minute or 0,
+                second=0,
+            )
+            # If the time already passed today, schedule for tomorrow
+            if posting_time < datetime.now(timezone.utc):
+                from datetime import timedelta
+                posting_time += timedelta(days=1)
 
         # Create ScheduledPost
         scheduled = ScheduledPost(
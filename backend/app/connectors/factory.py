@@ -5,14 +5,21 @@ Routing:
   - linkedin → LinkedInConnector (native OAuth)
   - instagram, facebook, tiktok → UploadPostConnector (Upload-Post API)
 """
+from functools import lru_cache
+
 from app.connectors.base import BaseConnector
 from app.connectors.upload_post import UploadPostConnector
 from app.connectors.linkedin import LinkedInConnector
 from app.models.publishing import SocialPlatform
 
 
+@lru_cache(maxsize=32)
 def get_connector_handler(platform: SocialPlatform) -> BaseConnector:
-    """Get the appropriate connector handler for a platform."""
+    """Get the appropriate connector handler for a platform.
+
+    Handlers hold only settings and the shared token encryption, so one
+    instance per platform is reused across requests and tasks.
+    """
 
     # LinkedIn → native OAuth connector
     if platform == SocialPlatform.LINKEDIN:
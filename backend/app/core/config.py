@@ -27,6 +27,16 @@ class Settings(BaseSettings):
     # Database
     database_url: str
     database_url_sync: str | None = None
+    # Per API process, up to pool_size + max_overflow connections. Budget:
+    # API processes x 35 + Celery worker children x 5 (their per-task
+    # engines) must stay under Postgres max_connections (100 by default)
+    db_pool_size: int = 20
+    db_max_overflow: int = 15
+    db_pool_timeout: int = 30  # seconds to wait for a free connection
+    db_pool_recycle: int = 1800  # seconds before a connection is recycled
+    db_pgbouncer: bool = False  # PgBouncer transaction mode: no app-side pool
+    db_query_cache_size: int = 1200  # compiled SQL LRU entries (SQLAlchemy default: 500)
+    db_prepared_statement_cache_size: int = 250  # asyncpg prepared statements per connection
 
     @field_validator("database_url", mode="after")
     @classmethod
@@ -123,6 +133,9 @@ class Settings(BaseSettings):
     fal_key: str = ""
     fal_webhook_url: str = ""
 
+    # RGPD data export
+    gdpr_export_zip_level: int = 1  # zlib level; exports are small JSON, 1 ~= 6 in size
+
     # Public API URL (for generating file URLs)
     api_base_url: str = "http://localhost:8000"
 
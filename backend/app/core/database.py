@@ -3,19 +3,39 @@ PresenceOS - Database configuration
 """
 from collections.abc import AsyncGenerator
 
-from sqlalchemy import text
+import asyncpg
+from sqlalchemy import make_url, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
 # Create async engine
+if settings.db_pgbouncer:
+    # PgBouncer (transaction mode) owns pooling; asyncpg's prepared statement
+    # cache must be disabled since statements can't survive across backends.
+    _engine_kwargs = {
+        "poolclass": NullPool,
+        "connect_args": {"statement_cache_size": 0},
+    }
+else:
+    _engine_kwargs = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "connect_args": {
+            "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+        },
+    }
+
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    query_cache_size=settings.db_query_cache_size,
+    **_engine_kwargs,
 )
 
 # Session factory
@@ -54,3 +74,43 @@ async def init_db() -> None:
     # Create tables in a clean connection
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+
+# ── Liveness probe ────────────────────────────────────────────────
+# The health monitor pings PostgreSQL through a one-connection asyncpg pool
+# of its own: probes skip the ORM/greenlet layer and never wait behind
+# requests for an engine pool slot.
+
+_probe_pool: asyncpg.Pool | None = None
+
+
+async def ping_database(timeout: float = 5.0) -> None:
+    """Run ``SELECT 1`` on the probe connection; raises if PostgreSQL is down."""
+    global _probe_pool
+
+    if _probe_pool is None:
+        dsn = make_url(settings.database_url).set(drivername="postgresql")
+        _probe_pool = await asyncpg.create_pool(
+            dsn.render_as_string(hide_password=False),
+            min_size=1,
+            max_size=1,
+            timeout=timeout,
+            statement_cache_size=0 if settings.db_pgbouncer else 100,
+        )
+
+    try:
+        await _probe_pool.fetchval("SELECT 1", timeout=timeout)
+    except Exception:
+        # Drop the pool so the next probe reconnects from scratch
+        pool, _probe_pool = _probe_pool, None
+        pool.terminate()
+        raise
+
+
+async def close_probe_pool() -> None:
+    """Close the probe pool on shutdown."""
+    global _probe_pool
+
+    if _probe_pool is not None:
+        pool, _probe_pool = _probe_pool, None
+        await pool.close()
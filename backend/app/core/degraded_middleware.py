@@ -12,9 +12,9 @@ Endpoints that don't require auth (chat, upload, health) are passed through.
 """
 import logging
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import JSONResponse
+import orjson
+from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.core import mock_data
 
@@ -43,55 +43,43 @@ PASSTHROUGH_PREFIXES = (
     "/webhook/",
 )
 
-# GET fallback map: path pattern -> mock data
+# GET fallback map: path pattern -> pre-serialized mock body
 # Uses simple prefix matching with {brand_id} wildcard handling
 _FALLBACK_MAP = {
     # Brands
-    ("GET", "/api/v1/brands/"): mock_data.MOCK_BRAND,
+    ("GET", "/api/v1/brands/"): mock_data.MOCK_BRAND_BYTES,
     # Knowledge
-    ("GET", "/api/v1/knowledge/brands/", "/categories"): mock_data.MOCK_KNOWLEDGE_CATEGORIES,
-    ("GET", "/api/v1/knowledge/brands/"): mock_data.MOCK_KNOWLEDGE_LIST,
+    ("GET", "/api/v1/knowledge/brands/", "/categories"): mock_data.MOCK_KNOWLEDGE_CATEGORIES_BYTES,
+    ("GET", "/api/v1/knowledge/brands/"): mock_data.MOCK_KNOWLEDGE_LIST_BYTES,
     # Ideas
-    ("GET", "/api/v1/ideas/brands/", "/daily"): mock_data.MOCK_IDEAS_LIST[:1],
-    ("GET", "/api/v1/ideas/brands/"): mock_data.MOCK_IDEAS_LIST,
+    ("GET", "/api/v1/ideas/brands/", "/daily"): mock_data.MOCK_DAILY_IDEAS_BYTES,
+    ("GET", "/api/v1/ideas/brands/"): mock_data.MOCK_IDEAS_LIST_BYTES,
     # Drafts
-    ("GET", "/api/v1/drafts/brands/"): mock_data.MOCK_DRAFTS_LIST,
+    ("GET", "/api/v1/drafts/brands/"): mock_data.MOCK_DRAFTS_LIST_BYTES,
     # Connectors
-    ("GET", "/api/v1/connectors/brands/"): mock_data.MOCK_CONNECTORS_LIST,
+    ("GET", "/api/v1/connectors/brands/"): mock_data.MOCK_CONNECTORS_LIST_BYTES,
     # Posts
-    ("GET", "/api/v1/posts/brands/", "/calendar"): mock_data.MOCK_CALENDAR,
-    ("GET", "/api/v1/posts/brands/"): [],
+    ("GET", "/api/v1/posts/brands/", "/calendar"): mock_data.MOCK_CALENDAR_BYTES,
+    ("GET", "/api/v1/posts/brands/"): mock_data.EMPTY_LIST_BYTES,
     # Metrics
-    ("GET", "/api/v1/metrics/brands/", "/dashboard"): mock_data.MOCK_DASHBOARD_METRICS,
-    ("GET", "/api/v1/metrics/brands/", "/platforms"): mock_data.MOCK_PLATFORM_BREAKDOWN,
-    ("GET", "/api/v1/metrics/brands/", "/top-posts"): mock_data.MOCK_TOP_POSTS,
-    ("GET", "/api/v1/metrics/brands/", "/learning"): mock_data.MOCK_LEARNING_INSIGHTS,
+    ("GET", "/api/v1/metrics/brands/", "/dashboard"): mock_data.MOCK_DASHBOARD_METRICS_BYTES,
+    ("GET", "/api/v1/metrics/brands/", "/platforms"): mock_data.MOCK_PLATFORM_BREAKDOWN_BYTES,
+    ("GET", "/api/v1/metrics/brands/", "/top-posts"): mock_data.MOCK_TOP_POSTS_BYTES,
+    ("GET", "/api/v1/metrics/brands/", "/learning"): mock_data.MOCK_LEARNING_INSIGHTS_BYTES,
     # Autopilot
-    ("GET", "/api/v1/autopilot/brands/", "/autopilot/pending"): [],
-    ("GET", "/api/v1/autopilot/brands/", "/autopilot"): mock_data.MOCK_AUTOPILOT_CONFIG,
+    ("GET", "/api/v1/autopilot/brands/", "/autopilot/pending"): mock_data.EMPTY_LIST_BYTES,
+    ("GET", "/api/v1/autopilot/brands/", "/autopilot"): mock_data.MOCK_AUTOPILOT_CONFIG_BYTES,
     # Media Library
-    ("GET", "/api/v1/media-library/brands/", "/stats"): mock_data.MOCK_MEDIA_STATS,
-    ("GET", "/api/v1/media-library/brands/", "/assets"): [],
-    ("GET", "/api/v1/media-library/brands/", "/voice-notes"): [],
+    ("GET", "/api/v1/media-library/brands/", "/stats"): mock_data.MOCK_MEDIA_STATS_BYTES,
+    ("GET", "/api/v1/media-library/brands/", "/assets"): mock_data.EMPTY_LIST_BYTES,
+    ("GET", "/api/v1/media-library/brands/", "/voice-notes"): mock_data.EMPTY_LIST_BYTES,
     # Users
-    ("GET", "/api/v1/users/me/workspaces"): [mock_data.MOCK_WORKSPACE],
-    ("GET", "/api/v1/users/me"): {
-        "id": "demo-user-001",
-        "email": "dev@presenceos.local",
-        "full_name": "Dev User",
-        "is_active": True,
-        "degraded": True,
-    },
+    ("GET", "/api/v1/users/me/workspaces"): mock_data.MOCK_WORKSPACES_LIST_BYTES,
+    ("GET", "/api/v1/users/me"): mock_data.MOCK_USER_BYTES,
     # Auth
-    ("GET", "/api/v1/auth/me"): {
-        "id": "demo-user-001",
-        "email": "dev@presenceos.local",
-        "full_name": "Dev User",
-        "is_active": True,
-        "degraded": True,
-    },
+    ("GET", "/api/v1/auth/me"): mock_data.MOCK_USER_BYTES,
     # Workspaces
-    ("GET", "/api/v1/workspaces/", "/brands"): mock_data.MOCK_BRANDS_LIST,
+    ("GET", "/api/v1/workspaces/", "/brands"): mock_data.MOCK_BRANDS_LIST_BYTES,
 }
 
 
@@ -114,37 +102,58 @@ def _match_fallback(method: str, path: str):
     return None
 
 
-class DegradedModeMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        path = request.url.path
-        method = request.method
+# Body for write operations that need the database
+_DB_UNAVAILABLE_BODY = orjson.dumps({
+    "detail": "Base de donnees indisponible. Cette operation necessite la DB.",
+    "degraded": True,
+})
 
-        # Always pass through non-degraded mode
-        if not getattr(request.app.state, "degraded", False):
-            return await call_next(request)
+
+class DegradedModeMiddleware:
+    """Pure ASGI middleware: in degraded mode, mock responses are written
+    straight to ``send`` from pre-serialized bytes, without routing,
+    dependency injection or the BaseHTTPMiddleware request/stream wrapping
+    (which every request used to pay, degraded or not).
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Always pass through non-HTTP traffic and non-degraded mode
+        if scope["type"] != "http" or not getattr(
+            scope["app"].state, "degraded", False
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        method = scope["method"]
 
         # Always pass through certain paths (chat, health, uploads, etc.)
-        for prefix in PASSTHROUGH_PREFIXES:
-            if path.startswith(prefix):
-                return await call_next(request)
+        if path.startswith(PASSTHROUGH_PREFIXES):
+            await self.app(scope, receive, send)
+            return
 
         # In degraded mode, try to serve mock data for GET requests
         if method == "GET":
             fallback = _match_fallback(method, path)
             if fallback is not None:
-                return JSONResponse(content=fallback)
+                response = Response(content=fallback, media_type="application/json")
+                await response(scope, receive, send)
+                return
 
         # For write operations in degraded mode, return a clear error
         if method in ("POST", "PATCH", "PUT", "DELETE") and path.startswith("/api/v1/"):
             # But allow chat and upload to pass through
             if "/chat/" not in path and "/upload" not in path and "/onboarding/" not in path:
-                return JSONResponse(
+                response = Response(
+                    content=_DB_UNAVAILABLE_BODY,
                     status_code=503,
-                    content={
-                        "detail": "Base de donnees indisponible. Cette operation necessite la DB.",
-                        "degraded": True,
-                    },
+                    media_type="application/json",
                 )
+                await response(scope, receive, send)
+                return
 
         # Fall through to normal processing
-        return await call_next(request)
+        await self.app(scope, receive, send)
@@ -5,8 +5,31 @@ Provides realistic demo data for the restaurant "Family's" when
 the database is unavailable. Each response includes `degraded: true`
 so the frontend can display an appropriate banner.
 """
+from types import MappingProxyType
+from typing import Any
 
-MOCK_BRAND = {
+import orjson
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively make mock data read-only (dicts -> mappingproxy, lists -> tuples).
+
+    The constants are shared by every degraded-mode request, so nothing may
+    mutate them in place.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _dumps(value: Any) -> bytes:
+    # orjson encodes tuples natively but needs mappingproxies unwrapped
+    return orjson.dumps(value, default=dict)
+
+
+MOCK_BRAND = _freeze({
     "id": "demo-brand-001",
     "name": "Family's",
     "slug": "familys",
@@ -22,11 +45,11 @@ MOCK_BRAND = {
         "hashtag_strategy": "mixed",
     },
     "degraded": True,
-}
+})
 
-MOCK_BRANDS_LIST = [MOCK_BRAND]
+MOCK_BRANDS_LIST = (MOCK_BRAND,)
 
-MOCK_POSTS_LIST = {
+MOCK_POSTS_LIST = _freeze({
     "items": [
         {
             "id": "demo-post-001",
@@ -49,9 +72,9 @@ MOCK_POSTS_LIST = {
     ],
     "total": 2,
     "degraded": True,
-}
+})
 
-MOCK_CALENDAR = {
+MOCK_CALENDAR = _freeze({
     "brand_id": "demo-brand-001",
     "start_date": "2026-02-01T00:00:00Z",
     "end_date": "2026-02-28T23:59:59Z",
@@ -75,9 +98,9 @@ MOCK_CALENDAR = {
         },
     ],
     "degraded": True,
-}
+})
 
-MOCK_DASHBOARD_METRICS = {
+MOCK_DASHBOARD_METRICS = _freeze({
     "total_posts_published": 12,
     "total_posts_scheduled": 3,
     "total_impressions": 4820,
@@ -87,9 +110,9 @@ MOCK_DASHBOARD_METRICS = {
     "best_posting_time": "12:00-14:00",
     "ai_insight": "Vos posts avec des photos de plats obtiennent 2.3x plus d'engagement. Continuez !",
     "degraded": True,
-}
+})
 
-MOCK_PLATFORM_BREAKDOWN = [
+MOCK_PLATFORM_BREAKDOWN = _freeze([
     {
         "platform": "instagram",
         "posts_count": 8,
@@ -104,9 +127,9 @@ MOCK_PLATFORM_BREAKDOWN = [
         "total_engagement": 107,
         "average_engagement_rate": 3.2,
     },
-]
+])
 
-MOCK_TOP_POSTS = {
+MOCK_TOP_POSTS = _freeze({
     "posts": [
         {
             "post_id": "demo-post-top-1",
@@ -122,9 +145,9 @@ MOCK_TOP_POSTS = {
         }
     ],
     "degraded": True,
-}
+})
 
-MOCK_LEARNING_INSIGHTS = {
+MOCK_LEARNING_INSIGHTS = _freeze({
     "summary": "Basee sur vos 30 derniers jours de contenu, voici ce qui fonctionne :",
     "what_works": [
         "Les photos de plats en gros plan obtiennent 2.3x plus d'engagement",
@@ -144,9 +167,9 @@ MOCK_LEARNING_INSIGHTS = {
         "behind_scenes": 20,
     },
     "degraded": True,
-}
+})
 
-MOCK_KNOWLEDGE_LIST = [
+MOCK_KNOWLEDGE_LIST = _freeze([
     {
         "id": "demo-knowledge-001",
         "brand_id": "demo-brand-001",
@@ -169,14 +192,14 @@ MOCK_KNOWLEDGE_LIST = [
         "is_featured": False,
         "created_at": "2026-01-10T10:00:00Z",
     },
-]
+])
 
-MOCK_KNOWLEDGE_CATEGORIES = {
+MOCK_KNOWLEDGE_CATEGORIES = _freeze({
     "categories": ["A propos", "Plats principaux", "Desserts", "Valeurs"],
     "degraded": True,
-}
+})
 
-MOCK_IDEAS_LIST = [
+MOCK_IDEAS_LIST = _freeze([
     {
         "id": "demo-idea-001",
         "brand_id": "demo-brand-001",
@@ -197,9 +220,9 @@ MOCK_IDEAS_LIST = [
         "platforms": ["instagram"],
         "created_at": "2026-02-09T10:00:00Z",
     },
-]
+])
 
-MOCK_DRAFTS_LIST = [
+MOCK_DRAFTS_LIST = _freeze([
     {
         "id": "demo-draft-001",
         "brand_id": "demo-brand-001",
@@ -210,9 +233,9 @@ MOCK_DRAFTS_LIST = [
         "hashtags": ["#familys", "#saintvalentin", "#restaurant"],
         "created_at": "2026-02-09T14:00:00Z",
     },
-]
+])
 
-MOCK_CONNECTORS_LIST = [
+MOCK_CONNECTORS_LIST = _freeze([
     {
         "id": "demo-connector-001",
         "brand_id": "demo-brand-001",
@@ -229,9 +252,9 @@ MOCK_CONNECTORS_LIST = [
         "status": "connected",
         "created_at": "2026-01-20T10:05:00Z",
     },
-]
+])
 
-MOCK_AUTOPILOT_CONFIG = {
+MOCK_AUTOPILOT_CONFIG = _freeze({
     "id": "demo-autopilot-001",
     "brand_id": "demo-brand-001",
     "is_active": False,
@@ -241,35 +264,66 @@ MOCK_AUTOPILOT_CONFIG = {
     "approval_required": True,
     "created_at": "2026-02-01T10:00:00Z",
     "degraded": True,
-}
+})
 
-MOCK_MEDIA_ASSETS = {
+MOCK_MEDIA_ASSETS = _freeze({
     "items": [],
     "total": 0,
     "degraded": True,
-}
+})
 
-MOCK_MEDIA_STATS = {
+MOCK_MEDIA_STATS = _freeze({
     "total_assets": 0,
     "total_size_bytes": 0,
     "by_type": {},
     "by_source": {},
     "degraded": True,
-}
+})
 
-MOCK_SETTINGS = {
+MOCK_SETTINGS = _freeze({
     "brand": MOCK_BRAND,
     "notifications": {"email": True, "push": False},
     "timezone": "Europe/Paris",
     "language": "fr",
     "degraded": True,
-}
+})
 
-MOCK_WORKSPACE = {
+MOCK_WORKSPACE = _freeze({
     "id": "demo-workspace-001",
     "name": "Family's Workspace",
     "slug": "familys-workspace",
     "owner_id": "demo-user-001",
     "brands": MOCK_BRANDS_LIST,
     "degraded": True,
-}
+})
+
+MOCK_USER = _freeze({
+    "id": "demo-user-001",
+    "email": "dev@presenceos.local",
+    "full_name": "Dev User",
+    "is_active": True,
+    "degraded": True,
+})
+
+
+# ── Pre-serialized bodies ────────────────────────────────────────
+# Degraded-mode GETs return these constants verbatim, so encode them once.
+
+EMPTY_LIST_BYTES = b"[]"
+MOCK_BRAND_BYTES = _dumps(MOCK_BRAND)
+MOCK_BRANDS_LIST_BYTES = _dumps(MOCK_BRANDS_LIST)
+MOCK_CALENDAR_BYTES = _dumps(MOCK_CALENDAR)
+MOCK_DASHBOARD_METRICS_BYTES = _dumps(MOCK_DASHBOARD_METRICS)
+MOCK_PLATFORM_BREAKDOWN_BYTES = _dumps(MOCK_PLATFORM_BREAKDOWN)
+MOCK_TOP_POSTS_BYTES = _dumps(MOCK_TOP_POSTS)
+MOCK_LEARNING_INSIGHTS_BYTES = _dumps(MOCK_LEARNING_INSIGHTS)
+MOCK_KNOWLEDGE_LIST_BYTES = _dumps(MOCK_KNOWLEDGE_LIST)
+MOCK_KNOWLEDGE_CATEGORIES_BYTES = _dumps(MOCK_KNOWLEDGE_CATEGORIES)
+MOCK_IDEAS_LIST_BYTES = _dumps(MOCK_IDEAS_LIST)
+MOCK_DAILY_IDEAS_BYTES = _dumps(MOCK_IDEAS_LIST[:1])
+MOCK_DRAFTS_LIST_BYTES = _dumps(MOCK_DRAFTS_LIST)
+MOCK_CONNECTORS_LIST_BYTES = _dumps(MOCK_CONNECTORS_LIST)
+MOCK_AUTOPILOT_CONFIG_BYTES = _dumps(MOCK_AUTOPILOT_CONFIG)
+MOCK_MEDIA_STATS_BYTES = _dumps(MOCK_MEDIA_STATS)
+MOCK_WORKSPACES_LIST_BYTES = _dumps((MOCK_WORKSPACE,))
+MOCK_USER_BYTES = _dumps(MOCK_USER)
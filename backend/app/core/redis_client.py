@@ -0,0 +1,47 @@
+"""
+PresenceOS - Shared Redis client for request-path caches
+
+One connection pool per process for the API's caches and dedup keys. When
+Redis can't be reached, callers get None and fall back; the connection is
+retried after a short backoff rather than given up on for the life of the
+process, so a blip at startup doesn't silently disable cache invalidation.
+"""
+import time
+
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger()
+
+REDIS_RETRY_SECONDS = 10
+
+_client = None
+_retry_at = 0.0
+
+
+async def get_redis():
+    """Return the process's Redis client, or None while Redis is unreachable."""
+    global _client, _retry_at
+    if _client is not None:
+        return _client
+
+    now = time.monotonic()
+    if now < _retry_at:
+        return None
+
+    try:
+        import redis.asyncio as aioredis
+        r = aioredis.from_url(settings.redis_url)
+        await r.ping()
+    except Exception as exc:
+        _retry_at = now + REDIS_RETRY_SECONDS
+        logger.warning(
+            "Redis not available, retrying later",
+            retry_in=REDIS_RETRY_SECONDS,
+            error=str(exc),
+        )
+        return None
+
+    _client = r
+    return r
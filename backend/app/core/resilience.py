@@ -33,17 +33,20 @@ class ServiceRegistry:
             cls._instance._services: Dict[str, ServiceStatus] = {}
             cls._instance._last_check: Dict[str, datetime] = {}
             cls._instance._check_interval = timedelta(seconds=30)
+            cls._instance._status_cache: Dict[str, Any] | None = None
         return cls._instance
 
     def register(self, name: str, status: ServiceStatus = ServiceStatus.UNAVAILABLE):
         self._services[name] = status
         self._last_check[name] = datetime.utcnow()
+        self._status_cache = None
         logger.info(f"Service '{name}' registered as {status.value}")
 
     def update(self, name: str, status: ServiceStatus):
         old = self._services.get(name)
         self._services[name] = status
         self._last_check[name] = datetime.utcnow()
+        self._status_cache = None
         if old != status:
             logger.info(f"Service '{name}' status: {old.value if old else 'unregistered'} -> {status.value}")
 
@@ -51,6 +54,13 @@ class ServiceRegistry:
         return self._services.get(name) == ServiceStatus.HEALTHY
 
     def get_status(self) -> Dict[str, Any]:
+        # Statuses only change when the health monitor probes (every 30s), so
+        # /health/status polls reuse the last snapshot until then
+        if self._status_cache is None:
+            self._status_cache = self._build_status()
+        return self._status_cache
+
+    def _build_status(self) -> Dict[str, Any]:
         return {
             name: {
                 "status": status.value,
@@ -10,14 +10,17 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from starlette.staticfiles import StaticFiles
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
 from app.core.config import settings
-from app.core.database import engine, init_db
+from app.core.database import close_probe_pool, init_db, ping_database
 from app.core.resilience import registry, ServiceStatus
+from app.core.security import get_token_encryption
+from app.services.competitor_intel import CompetitorIntelService
+from app.services.conversation_engine import ConversationEngine
 
 try:
     import sentry_sdk
@@ -74,11 +77,8 @@ logger = structlog.get_logger()
 
 async def _probe_postgresql():
     """Check PostgreSQL connectivity and update registry."""
-    from sqlalchemy import text as sa_text
-
     try:
-        async with engine.connect() as conn:
-            await conn.execute(sa_text("SELECT 1"))
+        await ping_database()
         registry.update("postgresql", ServiceStatus.HEALTHY)
         return True
     except Exception as e:
@@ -156,6 +156,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Set app-level degraded flag
     app.state.degraded = not pg_ok
 
+    # App-wide services (injected via app.api.v1.deps)
+    app.state.conversation_engine = ConversationEngine()
+    app.state.competitor_service = CompetitorIntelService()
+
+    # Derive the token-encryption key (100k PBKDF2 rounds) off the event
+    # loop now rather than inside the first connector request
+    await asyncio.to_thread(get_token_encryption)
+
     mode = "FULL" if pg_ok else "DEGRADED"
     logger.info(f"PresenceOS starting in {mode} mode", postgresql=pg_ok, redis=redis_ok)
 
@@ -170,6 +178,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         await monitor_task
     except asyncio.CancelledError:
         pass
+    await close_probe_pool()
     logger.info("Shutting down PresenceOS API")
 
 
@@ -183,6 +192,7 @@ def create_application() -> FastAPI:
         docs_url=f"{settings.api_v1_prefix}/docs",
         redoc_url=f"{settings.api_v1_prefix}/redoc",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Rate limiter
@@ -202,6 +212,7 @@ def create_application() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
     # Include API router
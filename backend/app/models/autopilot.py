@@ -5,7 +5,9 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Enum, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Boolean, DateTime, Enum, Float, ForeignKey, Integer, SmallInteger, String, Text,
+)
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -71,6 +73,13 @@ class AutopilotConfig(BaseModel):
         String(5), nullable=True
     )
     # Format "HH:MM", e.g. "10:30"
+    preferred_posting_hour: Mapped[int | None] = mapped_column(
+        SmallInteger, nullable=True
+    )
+    preferred_posting_minute: Mapped[int | None] = mapped_column(
+        SmallInteger, nullable=True
+    )
+    # Parsed from preferred_posting_time at write time (read on approval)
 
     # Content topics/themes (optional)
     topics: Mapped[list[str] | None] = mapped_column(ARRAY(String), nullable=True)
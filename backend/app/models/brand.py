@@ -5,7 +5,7 @@ import enum
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, Enum, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Enum, Float, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -181,6 +181,17 @@ class KnowledgeItem(BaseModel):
     """A piece of business knowledge (menu item, offer, FAQ, etc.)."""
 
     __tablename__ = "knowledge_items"
+    __table_args__ = (
+        # Serves the title-ordered item list, so LIMIT stops without a sort
+        Index("ix_knowledge_items_brand_active_title", "brand_id", "is_active", "title"),
+        # Serves the sorted DISTINCT behind the brand's category list
+        Index(
+            "ix_knowledge_items_brand_category",
+            "brand_id",
+            "category",
+            postgresql_where=text("is_active AND category IS NOT NULL"),
+        ),
+    )
 
     brand_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -9,7 +9,7 @@ import enum
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Float, ForeignKey, Integer, SmallInteger, String, Text
+from sqlalchemy import Float, ForeignKey, Index, Integer, SmallInteger, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -126,3 +126,24 @@ class CMInteraction(BaseModel):
     extra_metadata: Mapped[dict | None] = mapped_column(
         JSONB, nullable=True, default=dict,
     )
+
+    # Relationships -- never lazy-loaded: list endpoints serialize many rows,
+    # so any access must be eager-loaded explicitly instead of one SELECT per row
+    brand: Mapped["Brand"] = relationship("Brand", lazy="raise")
+
+
+# Matches list_interactions' filters and its ORDER BY created_at DESC
+Index(
+    "ix_cm_brand_status_class_created",
+    CMInteraction.brand_id,
+    CMInteraction.response_status,
+    CMInteraction.classification,
+    CMInteraction.created_at.desc(),
+)
+
+
+# TYPE_CHECKING import to avoid circular
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.models.brand import Brand
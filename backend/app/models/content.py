@@ -6,7 +6,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -67,6 +67,10 @@ class ContentIdea(BaseModel):
     """A content idea that can be developed into drafts."""
 
     __tablename__ = "content_ideas"
+    __table_args__ = (
+        # Serves the keyset-paginated idea list (scanned backwards for DESC)
+        Index("ix_content_ideas_brand_created_id", "brand_id", "created_at", "id"),
+    )
 
     brand_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
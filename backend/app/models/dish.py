@@ -12,6 +12,7 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     Integer,
+    LargeBinary,
     Numeric,
     String,
     Text,
@@ -69,6 +70,15 @@ class Dish(BaseModel):
     # Ordering
     display_order: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
+    # DishResponse JSON encoded at write time (see ContentLibraryService);
+    # deferred so regular loads don't carry it
+    payload_json: Mapped[bytes | None] = mapped_column(
+        LargeBinary, nullable=True, deferred=True
+    )
+    # DISH_PAYLOAD_VERSION the snapshot was encoded with; a mismatch means
+    # DishResponse changed since and the snapshot is re-encoded on read
+    payload_version: Mapped[str | None] = mapped_column(String(16), nullable=True)
+
     # Relationships
     brand: Mapped["Brand"] = relationship("Brand", backref="dishes")
     cover_asset: Mapped["MediaAsset | None"] = relationship(
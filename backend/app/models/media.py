@@ -8,7 +8,7 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Enum, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Enum, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -38,6 +38,19 @@ class MediaAsset(BaseModel):
     """An image or video received via WhatsApp or uploaded."""
 
     __tablename__ = "media_assets"
+    __table_args__ = (
+        # Covers the library stats aggregates as an index-only scan
+        Index(
+            "ix_media_assets_brand_stats",
+            "brand_id",
+            "media_type",
+            "source",
+            "ai_analyzed",
+            postgresql_include=["file_size"],
+        ),
+        # Serves the newest-first asset list (scanned backwards for DESC)
+        Index("ix_media_assets_brand_archived_created", "brand_id", "is_archived", "created_at"),
+    )
 
     brand_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -106,6 +119,10 @@ class VoiceNote(BaseModel):
     """A voice note received via WhatsApp and transcribed."""
 
     __tablename__ = "voice_notes"
+    __table_args__ = (
+        # Serves the newest-first voice-note list and the stats count
+        Index("ix_voice_notes_brand_created", "brand_id", "created_at"),
+    )
 
     brand_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
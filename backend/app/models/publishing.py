@@ -6,7 +6,24 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, Enum, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Date,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    column,
+    event,
+    table,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -52,6 +69,14 @@ class SocialConnector(BaseModel):
     """OAuth connection to a social platform for a brand."""
 
     __tablename__ = "social_connectors"
+    __table_args__ = (
+        UniqueConstraint(
+            "brand_id",
+            "platform",
+            "account_id",
+            name="uq_social_connector_brand_platform_account",
+        ),
+    )
 
     brand_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -119,10 +144,25 @@ class SocialConnector(BaseModel):
         return f"<SocialConnector {self.platform} - {self.account_username}>"
 
 
+# A draft has at most one pending post; this predicate (literal, so Postgres
+# can match it for ON CONFLICT inference) defines the partial unique index
+ACTIVE_POST_WHERE = text("status IN ('SCHEDULED', 'QUEUED')")
+
+
 class ScheduledPost(BaseModel):
     """A post scheduled for publishing."""
 
     __tablename__ = "scheduled_posts"
+    __table_args__ = (
+        Index(
+            "uq_scheduled_posts_active_draft",
+            "draft_id",
+            unique=True,
+            postgresql_where=ACTIVE_POST_WHERE,
+        ),
+        # Brand post listings and the dashboard's published-in-window count
+        Index("ix_scheduled_posts_brand_status_published", "brand_id", "status", "published_at"),
+    )
 
     brand_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -284,3 +324,72 @@ class MetricsSnapshot(BaseModel):
 
     def __repr__(self) -> str:
         return f"<MetricsSnapshot {self.snapshot_date}>"
+
+
+# Per brand, platform and UTC day rollup of post-level snapshots, so the
+# dashboard reads O(days x platforms) rows instead of every snapshot in the
+# window. It is refreshed by the refresh_brand_daily_metrics beat task; the
+# unique index is what allows REFRESH ... CONCURRENTLY
+BRAND_DAILY_METRICS_VIEW = "mv_brand_daily_metrics"
+
+CREATE_BRAND_DAILY_METRICS_SQL = f"""
+CREATE MATERIALIZED VIEW IF NOT EXISTS {BRAND_DAILY_METRICS_VIEW} AS
+SELECT
+    sc.brand_id,
+    sc.platform,
+    (ms.snapshot_date AT TIME ZONE 'UTC')::date AS day,
+    count(*) AS snapshots_count,
+    sum(ms.impressions) AS impressions,
+    sum(ms.likes) AS likes,
+    sum(ms.comments) AS comments,
+    sum(ms.shares) AS shares,
+    sum(ms.saves) AS saves,
+    sum(ms.likes + ms.comments + ms.shares) AS engagement,
+    sum(ms.engagement_rate) AS engagement_rate_sum,
+    count(ms.engagement_rate) AS engagement_rate_count
+FROM metrics_snapshots ms
+JOIN social_connectors sc ON sc.id = ms.connector_id
+WHERE ms.post_id IS NOT NULL
+GROUP BY 1, 2, 3
+"""
+
+CREATE_BRAND_DAILY_METRICS_INDEX_SQL = f"""
+CREATE UNIQUE INDEX IF NOT EXISTS uq_{BRAND_DAILY_METRICS_VIEW}
+ON {BRAND_DAILY_METRICS_VIEW} (brand_id, platform, day)
+"""
+
+brand_daily_metrics = table(
+    BRAND_DAILY_METRICS_VIEW,
+    column("brand_id", UUID(as_uuid=True)),
+    column("platform", Enum(SocialPlatform)),
+    column("day", Date),
+    column("snapshots_count", Integer),
+    column("impressions", Integer),
+    column("likes", Integer),
+    column("comments", Integer),
+    column("shares", Integer),
+    column("saves", Integer),
+    column("engagement", Integer),
+    column("engagement_rate_sum", Float),
+    column("engagement_rate_count", Integer),
+)
+
+# Migrations own the view in deployed databases; these hooks keep
+# metadata.create_all()/drop_all() (tests, fresh dev databases) in step
+event.listen(
+    MetricsSnapshot.__table__,
+    "after_create",
+    DDL(CREATE_BRAND_DAILY_METRICS_SQL).execute_if(dialect="postgresql"),
+)
+event.listen(
+    MetricsSnapshot.__table__,
+    "after_create",
+    DDL(CREATE_BRAND_DAILY_METRICS_INDEX_SQL).execute_if(dialect="postgresql"),
+)
+event.listen(
+    MetricsSnapshot.__table__,
+    "before_drop",
+    DDL(f"DROP MATERIALIZED VIEW IF EXISTS {BRAND_DAILY_METRICS_VIEW}").execute_if(
+        dialect="postgresql"
+    ),
+)
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ── AutopilotConfig ─────────────────────────────────────────────────
@@ -54,7 +54,7 @@ class AutopilotConfigResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
 
 
 # ── PendingPost ─────────────────────────────────────────────────────
@@ -78,7 +78,7 @@ class PendingPostResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
 
 
 class PendingPostAction(BaseModel):
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 
 from app.models.brand import BrandType, KnowledgeType
 
@@ -202,6 +202,10 @@ class KnowledgeItemUpdate(BaseModel):
 class KnowledgeItemResponse(KnowledgeItemBase):
     model_config = ConfigDict(from_attributes=True)
 
+    # The ORM column is item_metadata; KnowledgeItem.metadata is the table MetaData
+    metadata: KnowledgeMetadata | None = Field(
+        None, validation_alias=AliasChoices("item_metadata", "metadata")
+    )
     id: UUID
     brand_id: UUID
     created_at: datetime
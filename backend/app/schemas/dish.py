@@ -0,0 +1,64 @@
+"""
+PresenceOS - Dish Schemas
+"""
+import hashlib
+from datetime import datetime
+from uuid import UUID
+
+import orjson
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+
+class DishResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    brand_id: UUID
+    name: str
+    category: str
+    description: str | None
+    price: float | None
+    is_available: bool
+    is_featured: bool
+    cover_asset_id: UUID | None
+    ai_post_count: int
+    last_posted_at: datetime | None
+    display_order: int
+    created_at: datetime
+    updated_at: datetime
+
+
+_DISH_ADAPTER = TypeAdapter(DishResponse)
+
+# Fields that can change without a dish write (cover_asset_id is SET NULL by
+# the database when its media asset is deleted): kept out of the stored
+# snapshot and appended from the live row by with_live_fields()
+_LIVE_FIELDS = {"cover_asset_id"}
+
+# Changes whenever DishResponse's shape does, so snapshots stored under an
+# older shape are re-encoded instead of served
+DISH_PAYLOAD_VERSION = hashlib.blake2b(
+    orjson.dumps(
+        [DishResponse.model_json_schema(), sorted(_LIVE_FIELDS)],
+        option=orjson.OPT_SORT_KEYS,
+    ),
+    digest_size=8,
+).hexdigest()
+
+
+def dish_payload(dish) -> bytes:
+    """Encode a dish as the API returns it, minus the live fields.
+
+    Stored in ``Dish.payload_json`` (tagged with DISH_PAYLOAD_VERSION) on
+    every write so list reads can return the snapshots without touching
+    pydantic.
+    """
+    return _DISH_ADAPTER.dump_json(
+        DishResponse.model_validate(dish), exclude=_LIVE_FIELDS
+    )
+
+
+def with_live_fields(payload: bytes, cover_asset_id: UUID | None) -> bytes:
+    """Complete a stored snapshot with the dish's current cover_asset_id."""
+    cover = b'"%s"' % str(cover_asset_id).encode() if cover_asset_id else b"null"
+    return payload[:-1] + b',"cover_asset_id":' + cover + b"}"
@@ -3,24 +3,28 @@ PresenceOS - Media Library Schemas (Sprint 9B)
 """
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.models.media import MediaSource, MediaType
 
 
 class MediaAssetResponse(BaseModel):
     """Response for a single media asset."""
-    id: str
-    brand_id: str
+    id: UUID
+    brand_id: UUID
     storage_key: str
     public_url: str
     thumbnail_url: Optional[str] = None
-    media_type: str  # "image" or "video"
+    media_type: MediaType
     mime_type: str
     file_size: int
     original_filename: Optional[str] = None
     width: Optional[int] = None
     height: Optional[int] = None
     duration_seconds: Optional[float] = None
-    source: str  # "whatsapp", "upload", "ai_generated"
+    source: MediaSource
     ai_description: Optional[str] = None
     ai_tags: Optional[list[str]] = None
     ai_analyzed: bool = False
@@ -29,7 +33,7 @@ class MediaAssetResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MediaAssetUpdate(BaseModel):
@@ -41,8 +45,8 @@ class MediaAssetUpdate(BaseModel):
 
 class VoiceNoteResponse(BaseModel):
     """Response for a single voice note."""
-    id: str
-    brand_id: str
+    id: UUID
+    brand_id: UUID
     storage_key: str
     public_url: str
     mime_type: str
@@ -52,11 +56,11 @@ class VoiceNoteResponse(BaseModel):
     is_transcribed: bool = False
     sender_phone: Optional[str] = None
     parsed_instructions: Optional[dict] = None
-    pending_post_id: Optional[str] = None
+    pending_post_id: Optional[UUID] = None
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MediaLibraryStats(BaseModel):
@@ -12,7 +12,6 @@ from datetime import datetime, timezone
 import httpx
 import structlog
 from PIL import Image
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
@@ -43,9 +42,7 @@ class AssetProcessorService:
 
         Triggers KB rebuild on completion.
         """
-        stmt = select(MediaAsset).where(MediaAsset.id == asset_id)
-        result = await self.db.execute(stmt)
-        asset = result.scalar_one_or_none()
+        asset = await self.db.get(MediaAsset, uuid.UUID(str(asset_id)))
         if not asset:
             raise ValueError(f"Asset {asset_id} not found")
 
@@ -107,9 +104,7 @@ class AssetProcessorService:
         if not settings.fal_key:
             raise RuntimeError("FAL_KEY is not configured")
 
-        stmt = select(MediaAsset).where(MediaAsset.id == asset_id)
-        result = await self.db.execute(stmt)
-        asset = result.scalar_one_or_none()
+        asset = await self.db.get(MediaAsset, uuid.UUID(str(asset_id)))
         if not asset:
             raise ValueError(f"Asset {asset_id} not found")
 
@@ -57,6 +57,13 @@ _MOCK_COMPETITORS = [
 # In-memory competitor tracking
 _tracked: dict[str, list[dict]] = {}
 
+# Per-brand mutation counters and the benchmark computed at each version.
+# The process token keeps versions from different workers/restarts (which
+# hold different mock data) from colliding in HTTP validators.
+_PROCESS_TOKEN = uuid.uuid4().hex[:8]
+_versions: dict[str, int] = {}
+_benchmarks: dict[str, tuple[int, dict[str, Any]]] = {}
+
 
 class CompetitorIntelService:
     """Analyze and track competitor social media activity."""
@@ -76,6 +83,11 @@ class CompetitorIntelService:
             _tracked[brand_id] = competitors
         return _tracked[brand_id]
 
+    def get_version_tag(self, brand_id: str) -> str:
+        """Opaque tag that changes whenever a brand's competitor list does."""
+        self._ensure_competitors(brand_id)
+        return f"{_PROCESS_TOKEN}-{brand_id}-{_versions.get(brand_id, 0)}"
+
     def get_competitors(self, brand_id: str) -> list[dict[str, Any]]:
         """List tracked competitors."""
         return self._ensure_competitors(brand_id)
@@ -101,6 +113,7 @@ class CompetitorIntelService:
             "last_updated": datetime.now(timezone.utc).isoformat(),
         }
         competitors.append(new_comp)
+        _versions[brand_id] = _versions.get(brand_id, 0) + 1
         return new_comp
 
     def remove_competitor(self, brand_id: str, competitor_id: str) -> bool:
@@ -108,11 +121,23 @@ class CompetitorIntelService:
         competitors = self._ensure_competitors(brand_id)
         before = len(competitors)
         _tracked[brand_id] = [c for c in competitors if c["id"] != competitor_id]
-        return len(_tracked[brand_id]) < before
+        removed = len(_tracked[brand_id]) < before
+        if removed:
+            _versions[brand_id] = _versions.get(brand_id, 0) + 1
+        return removed
 
     def get_benchmark(self, brand_id: str) -> dict[str, Any]:
-        """Compare your brand metrics against competitors."""
+        """Compare your brand metrics against competitors.
+
+        The result depends only on the tracked list, so it is memoized per
+        brand until the next add/remove.
+        """
         competitors = self._ensure_competitors(brand_id)
+        version = _versions.get(brand_id, 0)
+        cached = _benchmarks.get(brand_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
         your_metrics = {
             "followers": 2450,
             "engagement_rate": 4.2,
@@ -123,7 +148,7 @@ class CompetitorIntelService:
         avg_engagement = sum(c["engagement_rate"] for c in competitors) / len(competitors) if competitors else 0
         avg_frequency = sum(c["post_frequency"] for c in competitors) / len(competitors) if competitors else 0
 
-        return {
+        benchmark = {
             "brand_id": brand_id,
             "your_metrics": your_metrics,
             "competitor_avg": {
@@ -143,3 +168,5 @@ class CompetitorIntelService:
             ],
             "generated_at": datetime.now(timezone.utc).isoformat(),
         }
+        _benchmarks[brand_id] = (version, benchmark)
+        return benchmark
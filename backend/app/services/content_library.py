@@ -6,19 +6,36 @@ and generates AI proposals from free-text requests or assets.
 """
 import uuid
 from datetime import datetime, timezone
+from decimal import ROUND_HALF_UP, Decimal
 from typing import Any
 
 import structlog
-from sqlalchemy import select, func, delete
+from sqlalchemy import select, func, delete, lambda_stmt, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.dish import Dish, DishCategory
 from app.models.media import MediaAsset
 from app.models.ai_proposal import AIProposal, ProposalSource, ProposalStatus
+from app.schemas.dish import DISH_PAYLOAD_VERSION, dish_payload, with_live_fields
 
 logger = structlog.get_logger()
 
 
+def _to_price(value: float | None) -> Decimal | None:
+    """Round a price the way the Numeric(10, 2) column stores it.
+
+    Keeps the payload snapshot identical to what a re-read would return.
+    """
+    if value is None:
+        return None
+    return Decimal(str(value)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+def _store_payload(dish: Dish) -> None:
+    dish.payload_json = dish_payload(dish)
+    dish.payload_version = DISH_PAYLOAD_VERSION
+
+
 class ContentLibraryService:
     """Content Library: dishes CRUD + AI proposal generation triggers."""
 
@@ -45,16 +62,23 @@ class ContentLibraryService:
         result = await self.db.execute(stmt)
         max_order = result.scalar()
 
+        now = datetime.now(timezone.utc)
         dish = Dish(
+            id=uuid.uuid4(),
             brand_id=brand_id,
             name=name,
             category=category,
             description=description,
-            price=price,
+            price=_to_price(price),
+            is_available=True,
             is_featured=is_featured,
             cover_asset_id=cover_asset_id,
+            ai_post_count=0,
             display_order=max_order + 1,
+            created_at=now,
+            updated_at=now,
         )
+        _store_payload(dish)
         self.db.add(dish)
         await self.db.commit()
         await self.db.refresh(dish)
@@ -64,26 +88,68 @@ class ContentLibraryService:
         logger.info("Dish created", dish_id=str(dish.id), name=name, brand_id=brand_id)
         return dish
 
-    async def list_dishes(
+    async def list_dish_payloads(
         self,
         brand_id: str,
         category: str | None = None,
         featured_only: bool = False,
         available_only: bool = True,
-    ) -> list[Dish]:
-        """List dishes for a brand with optional filters."""
-        stmt = select(Dish).where(Dish.brand_id == brand_id)
+    ) -> list[bytes]:
+        """List dishes for a brand as their stored JSON payloads.
+
+        Snapshots that are missing or encoded for an older DishResponse
+        shape are re-encoded and stored; cover_asset_id always comes from
+        the live column.
+        """
+        # lambda_stmt: the statement is built and cache-keyed once per shape
+        stmt = lambda_stmt(
+            lambda: select(
+                Dish.id, Dish.payload_json, Dish.payload_version, Dish.cover_asset_id
+            ).where(Dish.brand_id == brand_id)
+        )
 
         if category:
-            stmt = stmt.where(Dish.category == category)
+            stmt += lambda s: s.where(Dish.category == category)
         if featured_only:
-            stmt = stmt.where(Dish.is_featured == True)
+            stmt += lambda s: s.where(Dish.is_featured == True)
         if available_only:
-            stmt = stmt.where(Dish.is_available == True)
+            stmt += lambda s: s.where(Dish.is_available == True)
 
-        stmt = stmt.order_by(Dish.display_order, Dish.name)
+        stmt += lambda s: s.order_by(Dish.display_order, Dish.name)
         result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        rows = result.all()
+
+        stale = [
+            row.id for row in rows
+            if row.payload_json is None or row.payload_version != DISH_PAYLOAD_VERSION
+        ]
+        filled = await self._refresh_payloads(stale) if stale else {}
+        return [
+            with_live_fields(filled.get(row.id) or row.payload_json, row.cover_asset_id)
+            for row in rows
+        ]
+
+    async def _refresh_payloads(self, dish_ids: list[uuid.UUID]) -> dict[uuid.UUID, bytes]:
+        """Encode and store payloads for dishes with a missing or outdated snapshot."""
+        result = await self.db.execute(select(Dish).where(Dish.id.in_(dish_ids)))
+        payloads = {dish.id: (dish, dish_payload(dish)) for dish in result.scalars()}
+
+        # updated_at is written back unchanged so onupdate doesn't outdate the payload
+        await self.db.execute(
+            update(Dish),
+            [
+                {
+                    "id": dish_id,
+                    "payload_json": payload,
+                    "payload_version": DISH_PAYLOAD_VERSION,
+                    "updated_at": dish.updated_at,
+                }
+                for dish_id, (dish, payload) in payloads.items()
+            ],
+        )
+        await self.db.commit()
+
+        return {dish_id: payload for dish_id, (_, payload) in payloads.items()}
 
     async def get_dish(self, dish_id: str) -> Dish | None:
         """Get a single dish by ID."""
@@ -107,10 +173,16 @@ class ContentLibraryService:
             "name", "category", "description", "price",
             "is_available", "is_featured", "cover_asset_id", "display_order",
         }
+        if "price" in updates:
+            updates["price"] = _to_price(updates["price"])
         for field, value in updates.items():
             if field in allowed_fields:
                 setattr(dish, field, value)
 
+        # Set updated_at ourselves so the stored payload carries the same value
+        dish.updated_at = datetime.now(timezone.utc)
+        _store_payload(dish)
+
         await self.db.commit()
         await self.db.refresh(dish)
 
@@ -152,17 +224,25 @@ class ContentLibraryService:
         result = await self.db.execute(stmt)
         order = result.scalar()
 
+        now = datetime.now(timezone.utc)
         created = []
         for data in dishes_data:
             order += 1
             dish = Dish(
+                id=uuid.uuid4(),
                 brand_id=brand_id,
                 name=data["name"],
                 category=data.get("category", "autres"),
                 description=data.get("description"),
-                price=data.get("price"),
+                price=_to_price(data.get("price")),
+                is_available=True,
+                is_featured=False,
+                ai_post_count=0,
                 display_order=order,
+                created_at=now,
+                updated_at=now,
             )
+            _store_payload(dish)
             self.db.add(dish)
             created.append(dish)
 
@@ -232,9 +312,7 @@ class ContentLibraryService:
         Returns a pending AIProposal.
         """
         # Verify asset exists
-        stmt = select(MediaAsset).where(MediaAsset.id == asset_id)
-        result = await self.db.execute(stmt)
-        asset = result.scalar_one_or_none()
+        asset = await self.db.get(MediaAsset, uuid.UUID(str(asset_id)))
         if not asset:
             raise ValueError(f"Asset {asset_id} not found")
 
@@ -609,6 +609,7 @@ class ConversationEngine:
         from app.services.storage import get_storage_service
         from app.models.media import MediaAsset, MediaSource, MediaType
         from app.core.database import async_session_maker
+        from app.services.media_stats_cache import invalidate_media_stats
 
         media_info = message.get(msg_type, {})
         media_id = media_info.get("id")
@@ -649,6 +650,7 @@ class ConversationEngine:
                 )
                 db.add(asset)
                 await db.commit()
+            await invalidate_media_stats(ctx.brand_id)
 
             # Vision analysis
             if msg_type == "image":
@@ -1,16 +1,22 @@
 """
 PresenceOS - Embedding Service for RAG
 """
+import hashlib
 import structlog
 from typing import Any
 
 import openai
+import orjson
+import redis.asyncio as aioredis
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.core.config import settings
 
 logger = structlog.get_logger()
 
+EMBEDDING_CACHE_TTL_SECONDS = 86400
+EMBEDDING_KEY_PREFIX = "presenceos:embedding:"
+
 
 class EmbeddingService:
     """Service for generating text embeddings using OpenAI."""
@@ -72,6 +78,68 @@ class EmbeddingService:
 
         return all_embeddings
 
+    def _cache_key(self, text: str) -> str:
+        # Whitespace-normalized so re-imports of the same menu text match;
+        # the model is part of the key so switching it never reuses vectors
+        normalized = " ".join(text[:8000].split())
+        digest = hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+        return f"{EMBEDDING_KEY_PREFIX}{self.model}:{digest}"
+
+    async def cached_embeddings_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings, reusing vectors already computed for the same text.
+
+        Vectors are cached in Redis for a day, keyed by a hash of the
+        normalized text. Texts repeated within the call or embedded before
+        are sent to the provider at most once. Zero vectors from failed
+        batches are never cached. Without Redis this behaves like
+        generate_embeddings_batch, apart from the in-call deduplication.
+        """
+        keys = [self._cache_key(text) for text in texts]
+        vectors: dict[str, list[float]] = {}
+
+        r = None
+        try:
+            r = aioredis.from_url(settings.redis_url)
+            unique_keys = list(dict.fromkeys(keys))
+            for key, raw in zip(unique_keys, await r.mget(unique_keys)):
+                if raw is not None:
+                    vectors[key] = orjson.loads(raw)
+        except Exception as exc:
+            logger.warning("Embedding cache lookup failed", error=str(exc))
+            if r is not None:
+                await r.aclose()
+                r = None
+
+        try:
+            missing: dict[str, str] = {}
+            for key, text in zip(keys, texts):
+                if key not in vectors:
+                    missing.setdefault(key, text)
+
+            if missing:
+                fresh = await self.generate_embeddings_batch(list(missing.values()))
+                vectors.update(zip(missing, fresh))
+                if r is not None:
+                    try:
+                        async with r.pipeline(transaction=False) as pipe:
+                            for key, embedding in zip(missing, fresh):
+                                if any(embedding):
+                                    pipe.set(key, orjson.dumps(embedding), ex=EMBEDDING_CACHE_TTL_SECONDS)
+                            await pipe.execute()
+                    except Exception as exc:
+                        logger.warning("Embedding cache store failed", error=str(exc))
+
+            logger.info(
+                "Embeddings resolved",
+                requested=len(texts),
+                generated=len(missing),
+            )
+        finally:
+            if r is not None:
+                await r.aclose()
+
+        return [vectors[key] for key in keys]
+
     def cosine_similarity(
         self, embedding1: list[float], embedding2: list[float]
     ) -> float:
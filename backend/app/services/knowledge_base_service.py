@@ -5,13 +5,13 @@ Compiles all brand data into a single cached KB used for AI prompt generation.
 Supports debounced rebuilds via Redis to avoid excessive recompilation.
 """
 import json
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime, timezone, timedelta
 
 import redis.asyncio as aioredis
 import structlog
 from sqlalchemy import select, func, desc
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.core.config import settings
 from app.models.brand import Brand, BrandVoice, KnowledgeItem
@@ -43,19 +43,27 @@ class KnowledgeBaseService:
         """
         logger.info("Rebuilding KB", brand_id=brand_id)
 
-        # Load brand with relationships
+        # Load the brand with its voice, existing KB and today's brief in one
+        # round trip; each joined table holds at most one row per brand
+        today_date = datetime.now(timezone.utc).date()
         stmt = (
-            select(Brand)
+            select(Brand, CompiledKB, DailyBrief)
             .options(
-                selectinload(Brand.voice),
+                joinedload(Brand.voice),
                 selectinload(Brand.knowledge_items),
             )
+            .outerjoin(CompiledKB, CompiledKB.brand_id == Brand.id)
+            .outerjoin(
+                DailyBrief,
+                (DailyBrief.brand_id == Brand.id) & (DailyBrief.date == today_date),
+            )
             .where(Brand.id == brand_id)
         )
         result = await self.db.execute(stmt)
-        brand = result.scalar_one_or_none()
-        if not brand:
+        row = result.one_or_none()
+        if not row:
             raise ValueError(f"Brand {brand_id} not found")
+        brand, kb, brief = row
 
         # Compile each section (resilient — log errors, use defaults)
         identity = self._compile_identity(brand)
@@ -72,11 +80,7 @@ class KnowledgeBaseService:
             logger.error("KB: _compile_media failed", brand_id=brand_id, error=str(exc))
             media = {"total_assets": 0, "assets": []}
 
-        try:
-            today = await self._compile_today(brand_id)
-        except Exception as exc:
-            logger.error("KB: _compile_today failed", brand_id=brand_id, error=str(exc))
-            today = {"has_brief": False, "date": datetime.now(timezone.utc).date().isoformat()}
+        today = self._compile_today(brief, today_date)
 
         try:
             posting_history = await self._compile_posting_history(brand_id)
@@ -95,10 +99,6 @@ class KnowledgeBaseService:
         )
 
         # Upsert CompiledKB
-        stmt = select(CompiledKB).where(CompiledKB.brand_id == brand_id)
-        result = await self.db.execute(stmt)
-        kb = result.scalar_one_or_none()
-
         if kb:
             kb.kb_version += 1
             kb.identity = identity
@@ -278,19 +278,8 @@ class KnowledgeBaseService:
             ],
         }
 
-    async def _compile_today(self, brand_id: str) -> dict:
+    def _compile_today(self, brief: DailyBrief | None, today: date) -> dict:
         """Compile today's brief response if available."""
-        today = datetime.now(timezone.utc).date()
-        stmt = (
-            select(DailyBrief)
-            .where(
-                DailyBrief.brand_id == brand_id,
-                DailyBrief.date == today,
-            )
-        )
-        result = await self.db.execute(stmt)
-        brief = result.scalar_one_or_none()
-
         if brief and brief.status == BriefStatus.ANSWERED.value:
             return {
                 "has_brief": True,
@@ -0,0 +1,46 @@
+"""
+PresenceOS - Media Library Stats Cache
+
+Keeps the encoded MediaLibraryStats payload per brand in Redis so dashboard
+renders skip the aggregate query. Every path that adds, changes or removes a
+MediaAsset or VoiceNote calls invalidate_media_stats(); the short TTL bounds
+staleness for any writer that does not.
+"""
+import structlog
+
+from app.core.redis_client import get_redis
+
+logger = structlog.get_logger()
+
+MEDIA_STATS_CACHE_TTL_SECONDS = 30
+MEDIA_STATS_KEY_PREFIX = "presenceos:media:stats:"
+
+
+async def get_cached_media_stats(brand_id) -> bytes | None:
+    """Return the cached stats payload for a brand, or None on a miss."""
+    r = await get_redis()
+    if not r:
+        return None
+    try:
+        return await r.get(f"{MEDIA_STATS_KEY_PREFIX}{brand_id}")
+    except Exception as exc:
+        logger.warning("Media stats cache lookup failed", error=str(exc))
+        return None
+
+
+async def store_media_stats(brand_id, body: bytes) -> None:
+    r = await get_redis()
+    if r:
+        try:
+            await r.set(f"{MEDIA_STATS_KEY_PREFIX}{brand_id}", body, ex=MEDIA_STATS_CACHE_TTL_SECONDS)
+        except Exception as exc:
+            logger.warning("Media stats cache store failed", error=str(exc))
+
+
+async def invalidate_media_stats(brand_id) -> None:
+    r = await get_redis()
+    if r:
+        try:
+            await r.delete(f"{MEDIA_STATS_KEY_PREFIX}{brand_id}")
+        except Exception as exc:
+            logger.warning("Media stats cache invalidation failed", error=str(exc))
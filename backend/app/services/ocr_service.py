@@ -6,15 +6,26 @@ Returns structured dish data for user validation before import.
 """
 import base64
 import json
+import uuid
 from typing import Any
 
 import anthropic
+import orjson
+import redis.asyncio as aioredis
 import structlog
 
 from app.core.config import settings
+from app.core.redis_client import get_redis
 
 logger = structlog.get_logger()
 
+# Scan jobs: the uploaded photo is parked in Redis until the worker picks it
+# up, and the job record holds the status and extracted dishes for polling
+SCAN_JOB_KEY_PREFIX = "presenceos:menu_scan:job:"
+SCAN_IMAGE_KEY_PREFIX = "presenceos:menu_scan:image:"
+SCAN_JOB_TTL_SECONDS = 3600
+SCAN_IMAGE_TTL_SECONDS = 600
+
 
 class OCRService:
     """Menu OCR using Claude Vision (Anthropic)."""
@@ -146,3 +157,81 @@ Règles :
             })
 
         return cleaned
+
+
+# ── Background Scan Jobs ─────────────────────────────────────────────────
+
+
+class ScanJobStoreUnavailable(Exception):
+    """Redis, which holds scan jobs and their images, can't be reached."""
+
+
+async def _job_store():
+    """The shared request-path Redis client; scan jobs can't run without it."""
+    r = await get_redis()
+    if r is None:
+        raise ScanJobStoreUnavailable("Redis is unavailable")
+    return r
+
+
+async def enqueue_scan_job(brand_id: str, image_bytes: bytes, mime_type: str) -> str:
+    """Store the photo and a pending job record, then queue the OCR task.
+
+    Returns the job id to poll with get_scan_job().
+    """
+    job_id = uuid.uuid4().hex
+    r = await _job_store()
+    async with r.pipeline(transaction=True) as pipe:
+        pipe.set(f"{SCAN_IMAGE_KEY_PREFIX}{job_id}", image_bytes, ex=SCAN_IMAGE_TTL_SECONDS)
+        pipe.set(
+            f"{SCAN_JOB_KEY_PREFIX}{job_id}",
+            orjson.dumps({"brand_id": brand_id, "status": "pending"}),
+            ex=SCAN_JOB_TTL_SECONDS,
+        )
+        await pipe.execute()
+
+    from app.workers.content_tasks import scan_menu_task
+    scan_menu_task.delay(job_id, mime_type)
+    return job_id
+
+
+async def get_scan_job(job_id: str) -> dict[str, Any] | None:
+    """Return the job record (brand_id, status, dishes/error), or None if unknown."""
+    r = await _job_store()
+    raw = await r.get(f"{SCAN_JOB_KEY_PREFIX}{job_id}")
+    return orjson.loads(raw) if raw is not None else None
+
+
+async def run_scan_job(job_id: str, mime_type: str) -> str:
+    """Run OCR for a queued job and record the outcome. Returns the final status."""
+    # Runs on the Celery task's own event loop, so it can't share the API
+    # process's client; the connection is opened and closed per run
+    r = aioredis.from_url(settings.redis_url)
+    try:
+        job_key = f"{SCAN_JOB_KEY_PREFIX}{job_id}"
+        image_key = f"{SCAN_IMAGE_KEY_PREFIX}{job_id}"
+        raw_job, image_bytes = await r.mget(job_key, image_key)
+        if raw_job is None:
+            return "expired"
+        job = orjson.loads(raw_job)
+
+        if image_bytes is None:
+            job.update(status="failed", error="Scan image expired before processing.")
+        else:
+            try:
+                dishes = await OCRService().scan_menu_image(image_bytes, mime_type)
+                job.update(status="done", dishes=dishes)
+            except Exception as exc:
+                logger.error("Menu scan job failed", job_id=job_id, error=str(exc))
+                job.update(
+                    status="failed",
+                    error="Could not extract menu items from this image. Please try a clearer photo.",
+                )
+
+        async with r.pipeline(transaction=True) as pipe:
+            pipe.set(job_key, orjson.dumps(job), ex=SCAN_JOB_TTL_SECONDS)
+            pipe.delete(image_key)
+            await pipe.execute()
+        return job["status"]
+    finally:
+        await r.aclose()
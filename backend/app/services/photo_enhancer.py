@@ -14,6 +14,7 @@ import base64
 from enum import Enum
 from typing import Any, Optional
 
+import orjson
 import structlog
 from PIL import Image, ImageEnhance, ImageFilter, ImageStat
 
@@ -25,6 +26,11 @@ UPLOAD_DIR = "/tmp/presenceos/uploads"
 ENHANCED_DIR = "/tmp/presenceos/uploads/enhanced"
 
 
+def scores_path(enhance_id: str) -> str:
+    """Sidecar holding the before/after scores computed at enhancement time."""
+    return os.path.join(ENHANCED_DIR, f"{enhance_id}_scores.json")
+
+
 class PhotoStyle(str, Enum):
     """Enhancement presets optimized for different use cases."""
     DELIVERY = "delivery"       # White/neutral bg, top-down, delivery app optimized
@@ -360,6 +366,14 @@ class PhotoEnhancerService:
         with open(enhanced_path, "wb") as f:
             f.write(enhanced_bytes)
 
+        # Keep the scores so comparisons don't decode both images again
+        with open(scores_path(enhance_id), "wb") as f:
+            f.write(orjson.dumps({
+                "quality_before": metadata["quality_before"],
+                "quality_after": metadata["quality_after"],
+                "improvement": metadata["improvement"],
+            }))
+
         # Optional AI analysis
         ai_analysis = None
         if include_ai_analysis:
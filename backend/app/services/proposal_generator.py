@@ -5,6 +5,7 @@ Generates AI content proposals using the Knowledge Base context.
 Uses Claude Haiku for simple generation, Sonnet for complex cases.
 """
 import json
+import uuid
 from datetime import datetime, timezone
 from typing import Any
 
@@ -100,9 +101,7 @@ class ProposalGenerator:
     ) -> AIProposal:
         """Generate a proposal from a media asset."""
         # Load asset info
-        stmt = select(MediaAsset).where(MediaAsset.id == asset_id)
-        result = await self.db.execute(stmt)
-        asset = result.scalar_one_or_none()
+        asset = await self.db.get(MediaAsset, uuid.UUID(str(asset_id)))
         if not asset:
             raise ValueError(f"Asset {asset_id} not found")
 
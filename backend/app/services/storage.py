@@ -1,6 +1,7 @@
 """
 PresenceOS - Storage Service (S3/MinIO with local fallback)
 """
+import asyncio
 import os
 import uuid
 import shutil
@@ -13,6 +14,10 @@ from app.core.config import settings
 
 logger = structlog.get_logger()
 
+# Uploads are copied/sent in parts of this size so only one chunk of the
+# file is held in memory at a time
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MB
+
 
 class LocalStorageService:
     """Fallback storage using local filesystem when S3/MinIO is not configured."""
@@ -47,7 +52,7 @@ class LocalStorageService:
         file.seek(0)
 
         with open(file_path, "wb") as f:
-            shutil.copyfileobj(file, f)
+            shutil.copyfileobj(file, f, UPLOAD_CHUNK_SIZE)
 
         url = self.get_public_url(key)
         logger.info("File uploaded (local)", key=key, size=size)
@@ -95,6 +100,7 @@ class StorageService:
 
     def __init__(self):
         import boto3
+        from boto3.s3.transfer import TransferConfig
         from botocore.config import Config
 
         self.client = boto3.client(
@@ -107,6 +113,11 @@ class StorageService:
         )
         self.bucket_name = settings.s3_bucket_name
         self.public_url = settings.s3_public_url or settings.s3_endpoint_url
+        # Files above one chunk go through a multipart upload
+        self.transfer_config = TransferConfig(
+            multipart_threshold=UPLOAD_CHUNK_SIZE,
+            multipart_chunksize=UPLOAD_CHUNK_SIZE,
+        )
 
     async def ensure_bucket_exists(self) -> bool:
         """Ensure the storage bucket exists."""
@@ -153,6 +164,10 @@ class StorageService:
         """
         Upload a file to storage.
 
+        ``file`` is streamed to the bucket in ``UPLOAD_CHUNK_SIZE`` parts from
+        a worker thread, so callers can pass the request's spooled temporary
+        file as-is instead of reading it into memory.
+
         Returns:
             {
                 "key": str,
@@ -172,11 +187,13 @@ class StorageService:
         file.seek(0)
 
         try:
-            self.client.upload_fileobj(
+            await asyncio.to_thread(
+                self.client.upload_fileobj,
                 file,
                 self.bucket_name,
                 key,
                 ExtraArgs=extra_args,
+                Config=self.transfer_config,
             )
 
             url = self.get_public_url(key)
@@ -263,7 +280,8 @@ class StorageService:
     async def delete_file(self, key: str) -> bool:
         """Delete a file from storage."""
         try:
-            self.client.delete_object(
+            await asyncio.to_thread(
+                self.client.delete_object,
                 Bucket=self.bucket_name,
                 Key=key,
             )
@@ -322,3 +340,15 @@ def get_storage_service() -> StorageService | LocalStorageService:
             logger.info("S3 not configured, using local storage fallback")
             _storage_service = LocalStorageService()
     return _storage_service
+
+
+async def get_storage_service_async() -> StorageService | LocalStorageService:
+    """FastAPI dependency form of get_storage_service.
+
+    Resolves on the event loop once the singleton exists instead of being
+    dispatched to the threadpool like a sync dependency; the first call still
+    runs in a worker thread because the S3 reachability probe blocks.
+    """
+    if _storage_service is not None:
+        return _storage_service
+    return await asyncio.to_thread(get_storage_service)
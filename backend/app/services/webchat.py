@@ -7,7 +7,13 @@ Used by the web Content Studio to interact with ConversationEngine.
 
 
 class WebChatService:
-    """Accumulates AI responses for web-based conversation."""
+    """Accumulates AI responses for web-based conversation.
+
+    Instantiated per request: construction is a single list allocation, so
+    there is nothing worth pooling.
+    """
+
+    __slots__ = ("responses",)
 
     def __init__(self):
         self.responses: list[dict] = []
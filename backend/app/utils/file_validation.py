@@ -1,5 +1,6 @@
 """File upload validation utilities."""
-from fastapi import UploadFile, HTTPException
+from fastapi import Request, UploadFile, HTTPException
+import asyncio
 import hashlib
 import io
 
@@ -20,6 +21,30 @@ MAX_IMAGE_SIZE = 20 * 1024 * 1024  # 20 MB
 MAX_VIDEO_SIZE = 100 * 1024 * 1024  # 100 MB
 MIN_IMAGE_DIMENSION = 100  # px
 MAX_IMAGE_DIMENSION = 8000  # px
+# Allowance for multipart boundaries, part headers and small form fields
+# sent alongside the file in the same request body
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+def check_upload_size(request: Request, file: UploadFile, max_size: int) -> None:
+    """
+    Reject an upload whose declared size exceeds max_size, before its
+    content is read into memory or validated.
+
+    Checks the request's Content-Length, then the byte count Starlette
+    recorded while spooling the file part.
+    Raises: HTTPException(413) if too large
+    """
+    try:
+        declared = int(request.headers.get("content-length") or 0)
+    except ValueError:
+        declared = 0
+
+    if declared > max_size + MULTIPART_OVERHEAD or (file.size or 0) > max_size:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Fichier trop volumineux. Maximum {max_size // (1024 * 1024)} Mo",
+        )
 
 
 async def validate_image_upload(file: UploadFile) -> tuple[bytes, str]:
@@ -50,6 +75,18 @@ async def validate_image_upload(file: UploadFile) -> tuple[bytes, str]:
     if len(contents) < 100:
         raise HTTPException(status_code=400, detail="Fichier trop petit ou corrompu")
 
+    # Header decoding and hashing are CPU-bound; keep them off the event loop
+    file_hash = await asyncio.to_thread(_check_image_contents, contents)
+    return contents, file_hash
+
+
+def _check_image_contents(contents: bytes) -> str:
+    """
+    Check magic bytes and dimensions of an image buffer.
+
+    Returns: the SHA-256 hex digest of contents
+    Raises: HTTPException if invalid
+    """
     # Check magic bytes for image format
     if contents[:2] == b"\xff\xd8":
         detected = "jpeg"
@@ -87,5 +124,4 @@ async def validate_image_upload(file: UploadFile) -> tuple[bytes, str]:
     except Exception:
         raise HTTPException(status_code=400, detail="Fichier image invalide ou corrompu")
 
-    file_hash = hashlib.sha256(contents).hexdigest()
-    return contents, file_hash
+    return hashlib.sha256(contents).hexdigest()
@@ -0,0 +1,49 @@
+"""HTTP conditional request (ETag / If-None-Match) utilities."""
+import hashlib
+
+from fastapi import Request, Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Lists are per-user data: let the browser keep them but revalidate each time
+PRIVATE_REVALIDATE = "private, no-cache"
+
+
+def make_etag(*parts, weak: bool = False) -> str:
+    digest = hashlib.blake2b(
+        "|".join(str(part) for part in parts).encode(), digest_size=8
+    ).hexdigest()
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of etag against the request's If-None-Match header."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(",")
+    )
+
+
+def not_modified(etag: str, cache_control: str = PRIVATE_REVALIDATE) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
+
+async def collection_etag(db: AsyncSession, model, conditions: list, *variant) -> str:
+    """
+    Weak ETag for a filtered collection, from its row count and newest
+    updated_at, so a list can answer 304 without loading its rows.
+
+    Inserts and updates move updated_at and deletes change the count. The
+    variant parts (page bounds, etc.) keep each page's tag distinct.
+    """
+    result = await db.execute(
+        select(func.count(), func.max(model.updated_at)).where(*conditions)
+    )
+    count, last_updated = result.one()
+    stamp = last_updated.timestamp() if last_updated is not None else 0
+    return make_etag(count, stamp, *variant, weak=True)
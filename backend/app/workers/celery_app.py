@@ -40,6 +40,11 @@ celery_app.conf.beat_schedule = {
         "task": "app.workers.tasks.sync_all_metrics",
         "schedule": crontab(minute=0),  # Every hour
     },
+    # Refresh the dashboard metrics rollup every 5 minutes
+    "refresh-brand-daily-metrics": {
+        "task": "app.workers.tasks.refresh_brand_daily_metrics",
+        "schedule": 300.0,
+    },
     # Generate daily ideas at 6 AM
     "generate-daily-ideas": {
         "task": "app.workers.tasks.generate_daily_ideas",
@@ -2,13 +2,16 @@
 PresenceOS - Content Library Celery Tasks
 
 Background tasks for KB rebuild, asset processing, FLUX Kontext
-improvement, proposal generation, and daily brief notifications.
+improvement, proposal generation, knowledge item embeddings, menu OCR
+scans, and daily brief notifications.
 """
+from contextlib import asynccontextmanager
 from datetime import date, datetime, timezone
 
 import structlog
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from app.workers.celery_app import celery_app
 
@@ -28,11 +31,25 @@ def _get_sync_session():
     return Session(engine)
 
 
-def _get_async_session():
-    """Get an async database session for Celery tasks."""
-    import asyncio
-    from app.core.database import async_session_factory
-    return async_session_factory()
+@asynccontextmanager
+async def _get_async_session():
+    """Get an async database session for Celery tasks.
+
+    _run_async runs each task on a new event loop, so connections can't be
+    pooled across runs (they would stay bound to a closed loop): every run
+    gets its own NullPool engine, disposed when the session closes.
+    """
+    from app.core.config import settings
+
+    connect_args = {"statement_cache_size": 0} if settings.db_pgbouncer else {}
+    engine = create_async_engine(
+        settings.database_url, poolclass=NullPool, connect_args=connect_args
+    )
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+    finally:
+        await engine.dispose()
 
 
 def _run_async(coro):
@@ -176,6 +193,85 @@ def generate_proposal_task(self, brand_id: str, source_type: str, source_data: d
         raise self.retry(exc=exc, countdown=30)
 
 
+@celery_app.task(name="app.workers.content_tasks.generate_embeddings_task", bind=True, max_retries=2)
+def generate_embeddings_task(self, item_ids: list[str]):
+    """Compute and store RAG embeddings for knowledge items."""
+    logger.info("Celery: generating embeddings", count=len(item_ids))
+
+    async def _embed():
+        async with _get_async_session() as db:
+            from app.models.brand import KnowledgeItem
+            from app.services.embeddings import EmbeddingService
+
+            # No row locks: the provider call can take seconds, and holding
+            # locks across it would block edits or skip rows another run holds
+            result = await db.execute(
+                select(
+                    KnowledgeItem.id,
+                    KnowledgeItem.title,
+                    KnowledgeItem.content,
+                ).where(KnowledgeItem.id.in_(item_ids))
+            )
+            rows = result.all()
+            if not rows:
+                return 0, []
+
+            embeddings = await EmbeddingService().cached_embeddings_batch(
+                [f"{row.title}\n{row.content}" for row in rows]
+            )
+            stored = 0
+            failed = []
+            for row, embedding in zip(rows, embeddings):
+                # Failed batches come back as zero vectors; leave those unset
+                if not any(embedding):
+                    failed.append(str(row.id))
+                    continue
+                # Only write if the embedded text is still current; an edit to
+                # it queues its own embedding run, so a stale vector is dropped
+                # rather than stored over the new text. updated_at is left as
+                # is since the item itself didn't change.
+                written = await db.execute(
+                    update(KnowledgeItem)
+                    .where(
+                        KnowledgeItem.id == row.id,
+                        KnowledgeItem.title == row.title,
+                        KnowledgeItem.content == row.content,
+                    )
+                    .values(embedding=embedding, updated_at=KnowledgeItem.updated_at)
+                    .execution_options(synchronize_session=False)
+                )
+                stored += written.rowcount
+            await db.commit()
+            return stored, failed
+
+    try:
+        stored, failed = _run_async(_embed())
+    except Exception as exc:
+        logger.error("Celery: embedding generation failed", error=str(exc))
+        raise self.retry(exc=exc, countdown=30)
+
+    logger.info("Celery: embeddings stored", count=stored, failed=len(failed))
+    if failed:
+        # The provider failed for these items; retry just them
+        raise self.retry(
+            args=[failed],
+            exc=RuntimeError(f"Embedding provider failed for {len(failed)} item(s)"),
+            countdown=30,
+        )
+    return {"requested": len(item_ids), "stored": stored}
+
+
+@celery_app.task(name="app.workers.content_tasks.scan_menu_task", bind=True, max_retries=0)
+def scan_menu_task(self, job_id: str, mime_type: str):
+    """Extract dishes from a queued menu photo; the result is polled from Redis."""
+    logger.info("Celery: scanning menu", job_id=job_id)
+    from app.services.ocr_service import run_scan_job
+
+    status = _run_async(run_scan_job(job_id, mime_type))
+    logger.info("Celery: menu scan finished", job_id=job_id, status=status)
+    return {"job_id": job_id, "status": status}
+
+
 @celery_app.task(name="app.workers.content_tasks.send_daily_brief_notifications")
 def send_daily_brief_notifications():
     """Create DailyBrief records for all active brands and send push notifications.
@@ -6,7 +6,7 @@ import structlog
 from datetime import datetime, timezone, timedelta
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.orm import selectinload
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
@@ -23,6 +23,7 @@ from app.models.publishing import (
     PostStatus,
     JobStatus,
     ConnectorStatus,
+    BRAND_DAILY_METRICS_VIEW,
 )
 from app.models.brand import Brand
 from app.models.content import ContentIdea, IdeaSource, IdeaStatus
@@ -313,6 +314,26 @@ async def _sync_all_metrics():
         return {"dispatched": len(connectors)}
 
 
+@celery_app.task
+def refresh_brand_daily_metrics():
+    """Refresh the dashboard's per-day metrics rollup."""
+    return run_async(_refresh_brand_daily_metrics())
+
+
+async def _refresh_brand_daily_metrics():
+    """Rebuild mv_brand_daily_metrics without blocking dashboard reads."""
+    session_maker, engine = _make_session_maker()
+    try:
+        async with session_maker() as db:
+            await db.execute(
+                text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {BRAND_DAILY_METRICS_VIEW}")
+            )
+            await db.commit()
+            return {"status": "refreshed"}
+    finally:
+        await engine.dispose()
+
+
 @celery_app.task
 def generate_daily_ideas():
     """Generate daily content ideas for all active brands."""
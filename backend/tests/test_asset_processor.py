@@ -180,9 +180,7 @@ class TestProcessUpload:
     async def test_process_upload_sets_ready(self):
         db = _mock_db()
         asset = _mock_asset(status="pending")
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = asset
-        db.execute = AsyncMock(return_value=mock_result)
+        db.get = AsyncMock(return_value=asset)
 
         service = AssetProcessorService(db)
         service.storage = MagicMock()
@@ -208,9 +206,7 @@ class TestProcessUpload:
     @pytest.mark.asyncio
     async def test_process_upload_not_found(self):
         db = _mock_db()
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        db.execute = AsyncMock(return_value=mock_result)
+        db.get = AsyncMock(return_value=None)
 
         service = AssetProcessorService(db)
         with pytest.raises(ValueError, match="not found"):
@@ -223,9 +219,7 @@ class TestProcessUpload:
     async def test_process_upload_failure_sets_failed(self):
         db = _mock_db()
         asset = _mock_asset(status="pending")
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = asset
-        db.execute = AsyncMock(return_value=mock_result)
+        db.get = AsyncMock(return_value=asset)
 
         service = AssetProcessorService(db)
         service.storage = MagicMock()
@@ -263,9 +257,7 @@ class TestFluxKontext:
     @pytest.mark.asyncio
     async def test_improve_asset_not_found(self):
         db = _mock_db()
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        db.execute = AsyncMock(return_value=mock_result)
+        db.get = AsyncMock(return_value=None)
 
         service = AssetProcessorService(db)
         with patch("app.services.asset_processor.settings") as mock_settings:
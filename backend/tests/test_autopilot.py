@@ -176,6 +176,18 @@ def test_str_to_platform_enum():
     assert _str_to_platform_enum("unknown") == SocialPlatform.INSTAGRAM
 
 
+def test_parse_posting_time():
+    """Test "HH:MM" posting time parsing into hour/minute columns."""
+    from app.api.v1.endpoints.autopilot import _parse_posting_time
+
+    assert _parse_posting_time("09:30") == (9, 30)
+    assert _parse_posting_time("23:05") == (23, 5)
+    assert _parse_posting_time(None) == (None, None)
+    assert _parse_posting_time("") == (None, None)
+    assert _parse_posting_time("nope") == (None, None)
+    assert _parse_posting_time("25:00") == (None, None)
+
+
 # ── Schema Tests ────────────────────────────────────────────────────
 
 
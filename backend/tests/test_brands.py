@@ -561,3 +561,43 @@ class TestWorkspacePermissions:
             headers=member_headers,
         )
         assert response.status_code == 200
+
+
+class TestBrandRoutes:
+    """Tests for brand router registration."""
+
+    def test_brand_routes_registered_once(self):
+        """Each brand (method, path) pair is served by exactly one handler."""
+        from collections import Counter
+        from app.api.v1.router import api_router
+
+        registered = Counter(
+            (method, route.path)
+            for route in api_router.routes
+            if route.path.startswith("/brands")
+            for method in route.methods
+        )
+        assert registered, "Brand router is not registered"
+        duplicates = [key for key, count in registered.items() if count > 1]
+        assert not duplicates, f"Duplicate brand routes: {duplicates}"
+        assert ("POST", "/brands/{brand_id}/onboard") in registered
+
+
+class TestGetBrandAccess:
+    """Tests for the get_brand authorization dependency."""
+
+    async def test_repeat_lookup_is_memoized(
+        self,
+        db: AsyncSession,
+        test_user: User,
+        test_brand: Brand,
+    ):
+        """A second check in the same session does not hit the database."""
+        from unittest.mock import patch
+        from app.api.v1.deps import get_brand
+
+        brand = await get_brand(test_brand.id, test_user, db)
+        assert brand.id == test_brand.id
+
+        with patch.object(db, "execute", side_effect=AssertionError("queried")):
+            assert await get_brand(test_brand.id, test_user, db) is brand
@@ -0,0 +1,63 @@
+"""
+PresenceOS - Competitor Intelligence Tests.
+
+Tests:
+  1. Benchmark is memoized until the competitor list changes
+  2. GET /competitor/list returns an ETag and honours If-None-Match
+"""
+import uuid
+
+import pytest
+
+
+def test_benchmark_memoized_until_mutation():
+    """get_benchmark reuses its result until a competitor is added/removed."""
+    from app.services.competitor_intel import CompetitorIntelService
+
+    svc = CompetitorIntelService()
+    brand_id = f"brand-{uuid.uuid4()}"
+
+    first = svc.get_benchmark(brand_id)
+    assert svc.get_benchmark(brand_id) is first
+
+    tag = svc.get_version_tag(brand_id)
+    svc.add_competitor(brand_id, "Chez Paul", "@chezpaul")
+    assert svc.get_version_tag(brand_id) != tag
+
+    updated = svc.get_benchmark(brand_id)
+    assert updated is not first
+    assert updated["ranking"]["total_competitors"] == first["ranking"]["total_competitors"] + 1
+
+
+@pytest.mark.asyncio
+async def test_competitor_list_conditional_get():
+    """A matching If-None-Match gets a 304; a mutation invalidates it."""
+    from httpx import ASGITransport, AsyncClient
+    from app.main import app
+
+    brand_id = f"brand-{uuid.uuid4()}"
+    url = f"/api/v1/competitor/list/{brand_id}"
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.get(url)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == "private, max-age=30"
+
+        response = await ac.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["cache-control"] == "private, max-age=30"
+
+        # Validators compare weakly, as on the other cached lists
+        strong = etag.removeprefix("W/")
+        response = await ac.get(url, headers={"If-None-Match": f'"other", {strong}'})
+        assert response.status_code == 304
+
+        await ac.post(
+            f"/api/v1/competitor/track/{brand_id}",
+            json={"name": "Chez Paul", "handle": "@chezpaul"},
+        )
+        response = await ac.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
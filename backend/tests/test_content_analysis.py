@@ -0,0 +1,92 @@
+"""
+PresenceOS - Content Analysis Tests.
+
+Tests:
+  1. Background analysis job records a completed result
+  2. Background analysis job records a failure instead of raising
+  3. The request session is released before the analysis runs
+"""
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.api.v1.endpoints.content_analysis import _run_analysis, analyze_instagram_content
+
+
+def _job() -> dict:
+    return {"job_id": "job-1", "status": "pending", "created_at": "", "result": None}
+
+
+@pytest.mark.asyncio
+async def test_run_analysis_completes_job():
+    job = _job()
+    brand = SimpleNamespace(id=uuid.uuid4(), name="Chez Paul")
+    result = {
+        "success": True,
+        "posts_found": 12,
+        "posts_analyzed": 10,
+        "summary": "Ton chaleureux",
+        "tone": {
+            "tone_formal": 30,
+            "tone_playful": 70,
+            "tone_bold": 50,
+            "tone_emotional": 60,
+            "humor_level": 40,
+        },
+        "vocabulary": {"favorite_words": ["maison"]},
+        "stored": {"voice_updated": True, "knowledge_items_created": 2},
+    }
+
+    with patch(
+        "app.api.v1.endpoints.content_analysis.ContentAnalyzerFree.analyze_and_store",
+        new=AsyncMock(return_value=result),
+    ):
+        await _run_analysis(job, brand, "chezpaul")
+
+    assert job["status"] == "completed"
+    assert job["result"]["posts_analyzed"] == 10
+    assert job["result"]["stored"]["knowledge_items_created"] == 2
+
+
+@pytest.mark.asyncio
+async def test_run_analysis_records_failure():
+    job = _job()
+    brand = SimpleNamespace(id=uuid.uuid4(), name="Chez Paul")
+
+    with patch(
+        "app.api.v1.endpoints.content_analysis.ContentAnalyzerFree.analyze_and_store",
+        new=AsyncMock(side_effect=RuntimeError("LLM down")),
+    ):
+        await _run_analysis(job, brand, "chezpaul")
+
+    assert job["status"] == "failed"
+    assert job["result"]["success"] is False
+
+
+@pytest.mark.asyncio
+async def test_analyze_releases_session_before_background_run():
+    from fastapi import BackgroundTasks
+
+    from app.api.v1.endpoints.content_analysis import AnalyzeRequest
+
+    events = []
+    db = MagicMock()
+    db.close = AsyncMock(side_effect=lambda: events.append("session closed"))
+    brand = SimpleNamespace(id=uuid.uuid4(), name="Chez Paul")
+    tasks = BackgroundTasks()
+
+    async def fake_run(job, brand, username):
+        events.append("analysis ran")
+
+    with patch(
+        "app.api.v1.endpoints.content_analysis.get_brand", AsyncMock(return_value=brand)
+    ), patch("app.api.v1.endpoints.content_analysis._run_analysis", fake_run):
+        response = await analyze_instagram_content(
+            brand.id, AnalyzeRequest(instagram_username="@chezpaul"), tasks, MagicMock(), db
+        )
+        await tasks()
+
+    assert response.status == "pending"
+    assert events == ["session closed", "analysis ran"]
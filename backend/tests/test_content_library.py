@@ -4,6 +4,7 @@ PresenceOS - Content Library Service Tests
 Tests for dish CRUD, asset linking, KB rebuild triggers.
 """
 import uuid
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -48,8 +49,8 @@ def _mock_dish(
     dish.ai_post_count = 0
     dish.last_posted_at = None
     dish.display_order = 0
-    dish.created_at = MagicMock()
-    dish.updated_at = MagicMock()
+    dish.created_at = datetime(2024, 1, 15, 8, 0, tzinfo=timezone.utc)
+    dish.updated_at = datetime(2024, 1, 15, 8, 0, tzinfo=timezone.utc)
     return dish
 
 
@@ -248,3 +249,83 @@ class TestKBRebuildTrigger:
         with patch.object(service, "_trigger_kb_rebuild", new_callable=AsyncMock) as mock_rebuild:
             await service.delete_dish(str(dish.id))
             mock_rebuild.assert_called_once()
+
+
+# ── Dish Response Serialization ──────────────────────────────────────────
+
+
+class TestDishPayload:
+    def test_payload_encodes_orm_row(self):
+        import json
+
+        from app.schemas.dish import dish_payload
+
+        dish = _mock_dish()
+
+        data = json.loads(dish_payload(dish))
+        assert data["id"] == str(dish.id)
+        assert data["price"] == 24.90
+        assert data["created_at"].startswith("2024-01-15T08:00:00")
+
+    @pytest.mark.asyncio
+    async def test_create_dish_stores_payload(self):
+        import json
+
+        db = _mock_db()
+        mock_result = MagicMock()
+        mock_result.scalar.return_value = -1
+        db.execute = AsyncMock(return_value=mock_result)
+
+        service = ContentLibraryService(db)
+        with patch.object(service, "_trigger_kb_rebuild", new_callable=AsyncMock):
+            dish = await service.create_dish(
+                brand_id=str(uuid.uuid4()),
+                name="Tartare de boeuf",
+                price=18.555,
+            )
+
+        data = json.loads(dish.payload_json)
+        assert data["id"] == str(dish.id)
+        assert data["name"] == "Tartare de boeuf"
+        # Rounded like the Numeric(10, 2) column
+        assert data["price"] == 18.56
+        assert data["is_available"] is True
+        assert data["created_at"] == data["updated_at"]
+
+    @pytest.mark.asyncio
+    async def test_list_payloads_backfills_missing(self):
+        from app.schemas.dish import DISH_PAYLOAD_VERSION
+
+        stored = _mock_dish(name="Soupe")
+        legacy = _mock_dish(name="Steak")
+        outdated = _mock_dish(name="Tarte")
+        cover_id = uuid.uuid4()
+
+        db = _mock_db()
+        list_result = MagicMock()
+        list_result.all.return_value = [
+            MagicMock(id=stored.id, payload_json=b'{"name":"Soupe"}',
+                      payload_version=DISH_PAYLOAD_VERSION, cover_asset_id=cover_id),
+            MagicMock(id=legacy.id, payload_json=None, payload_version=None, cover_asset_id=None),
+            MagicMock(id=outdated.id, payload_json=b'{"name":"Tarte","old":1}',
+                      payload_version="0" * 16, cover_asset_id=None),
+        ]
+        load_result = MagicMock()
+        load_result.scalars.return_value = [legacy, outdated]
+        db.execute = AsyncMock(side_effect=[list_result, load_result, MagicMock()])
+
+        service = ContentLibraryService(db)
+        payloads = await service.list_dish_payloads(str(uuid.uuid4()))
+
+        # cover_asset_id is always taken from the live column
+        assert payloads[0] == b'{"name":"Soupe","cover_asset_id":"%s"}' % str(cover_id).encode()
+        assert b'"name":"Steak"' in payloads[1]
+        assert payloads[1].endswith(b',"cover_asset_id":null}')
+        assert b'"old"' not in payloads[2]
+        # Re-encoded snapshots are written back with updated_at unchanged
+        params = db.execute.call_args_list[2][0][1]
+        assert [p["id"] for p in params] == [legacy.id, outdated.id]
+        assert all(p["payload_version"] == DISH_PAYLOAD_VERSION for p in params)
+        assert params[0]["updated_at"] == legacy.updated_at
+        assert b"cover_asset_id" not in params[0]["payload_json"]
+        db.commit.assert_called_once()
@@ -135,3 +135,26 @@ class TestBriefNotification:
         first_time = datetime(2024, 1, 15, 8, 0, tzinfo=timezone.utc)
         brief.notif_sent_at = first_time
         assert brief.notif_sent_at == first_time
+
+
+class TestBriefResponseSchema:
+    """Tests for the BriefResponse API schema."""
+
+    def test_validates_from_orm_with_native_types(self):
+        from app.api.v1.endpoints.brief import BriefResponse
+
+        brief = MagicMock(spec=DailyBrief)
+        brief.id = uuid.uuid4()
+        brief.brand_id = uuid.uuid4()
+        brief.date = date(2024, 1, 15)
+        brief.response = None
+        brief.status = BriefStatus.PENDING.value
+        brief.responded_at = None
+        brief.generated_proposal_id = None
+        brief.notif_sent_at = None
+        brief.created_at = datetime(2024, 1, 15, 8, 0, tzinfo=timezone.utc)
+
+        result = BriefResponse.model_validate(brief)
+        assert result.id == brief.id
+        assert result.date == date(2024, 1, 15)
+        assert result.created_at == brief.created_at
@@ -0,0 +1,127 @@
+"""
+PresenceOS - Google Business Profile Tests.
+
+Tests:
+  1. A retried POST /gbp/publish returns the first post instead of publishing again
+  2. An explicit Idempotency-Key header scopes the dedup
+  3. The dedup key is claimed atomically before publishing
+"""
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.api.v1.endpoints import gbp
+from app.main import app
+
+
+@pytest.mark.asyncio
+async def test_publish_retry_is_deduplicated():
+    """An identical publish within the TTL gets the original response."""
+    body = {"brand_id": f"brand-{uuid.uuid4()}", "caption": "Menu du jour"}
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        first = await ac.post("/api/v1/gbp/publish", json=body)
+        retry = await ac.post("/api/v1/gbp/publish", json=body)
+        assert first.status_code == 200
+        assert retry.json()["id"] == first.json()["id"]
+
+        posts = await ac.get(f"/api/v1/gbp/posts/{body['brand_id']}")
+        assert len(posts.json()) == 1
+
+
+@pytest.mark.asyncio
+async def test_publish_idempotency_key_header():
+    """Distinct Idempotency-Key values publish separately."""
+    body = {"brand_id": f"brand-{uuid.uuid4()}", "caption": "Menu du jour"}
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        first = await ac.post(
+            "/api/v1/gbp/publish", json=body, headers={"Idempotency-Key": "a"}
+        )
+        second = await ac.post(
+            "/api/v1/gbp/publish", json=body, headers={"Idempotency-Key": "b"}
+        )
+        again = await ac.post(
+            "/api/v1/gbp/publish", json=body, headers={"Idempotency-Key": "a"}
+        )
+        assert second.json()["id"] != first.json()["id"]
+        assert again.json()["id"] == first.json()["id"]
+
+
+class _FakeRedis:
+    """SET NX / GET / DELETE over a dict, enough for the publish claim."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def delete(self, key):
+        self.store.pop(key, None)
+
+
+@pytest.fixture
+def fake_redis():
+    redis = _FakeRedis()
+    with patch.object(gbp, "get_redis", AsyncMock(return_value=redis)):
+        yield redis
+
+
+def _publish_body() -> dict:
+    return {"brand_id": f"brand-{uuid.uuid4()}", "caption": "Menu du jour"}
+
+
+@pytest.mark.asyncio
+async def test_publish_in_flight_is_conflict(fake_redis):
+    """A retry arriving while the first publish holds the claim gets a 409."""
+    body = _publish_body()
+    key = gbp._publish_key(gbp.GBPPublishRequest(**body), None)
+    fake_redis.store[key] = gbp.PUBLISH_PENDING
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.post("/api/v1/gbp/publish", json=body)
+        posts = await ac.get(f"/api/v1/gbp/posts/{body['brand_id']}")
+
+    assert response.status_code == 409
+    assert posts.json() == []
+
+
+@pytest.mark.asyncio
+async def test_publish_claim_replaced_by_response(fake_redis):
+    """The claim is overwritten with the response, which retries get back."""
+    body = _publish_body()
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        first = await ac.post("/api/v1/gbp/publish", json=body)
+        retry = await ac.post("/api/v1/gbp/publish", json=body)
+
+    key = gbp._publish_key(gbp.GBPPublishRequest(**body), None)
+    assert fake_redis.store[key] != gbp.PUBLISH_PENDING
+    assert retry.status_code == 200
+    assert retry.json()["id"] == first.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_failed_publish_releases_claim(fake_redis):
+    """A publish that raises drops its claim so the client can retry."""
+    body = _publish_body()
+    with patch.object(
+        gbp.GBPPublisherService, "publish_post", side_effect=RuntimeError("GBP down")
+    ):
+        with pytest.raises(RuntimeError):
+            await gbp.publish_post(gbp.GBPPublishRequest(**body), None)
+
+    assert fake_redis.store == {}
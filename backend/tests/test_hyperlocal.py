@@ -0,0 +1,46 @@
+"""
+PresenceOS - Hyperlocal Intelligence Tests.
+
+Tests:
+  1. GET /hyperlocal/weather is cached and honours If-None-Match
+  2. GET /hyperlocal/context caches per rounded coordinates
+"""
+import uuid
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+
+
+@pytest.mark.asyncio
+async def test_weather_conditional_get():
+    """Repeat calls reuse the cached payload; a matching ETag gets a 304."""
+    url = f"/api/v1/hyperlocal/weather/brand-{uuid.uuid4()}"
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.get(url)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == "public, max-age=300"
+
+        again = await ac.get(url)
+        assert again.headers["etag"] == etag
+        assert again.json() == response.json()
+
+        response = await ac.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_context_cached_per_rounded_coordinates():
+    """Nearby coordinates share a cache entry."""
+    url = f"/api/v1/hyperlocal/context/brand-{uuid.uuid4()}"
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        first = await ac.get(url, params={"lat": 48.8566, "lon": 2.3522})
+        second = await ac.get(url, params={"lat": 48.8571, "lon": 2.3519})
+        assert first.status_code == 200
+        assert second.headers["etag"] == first.headers["etag"]
@@ -107,6 +107,47 @@ class TestListIdeas:
         for idea in data:
             assert idea["status"] == "new"
 
+    async def test_list_ideas_cursor_pagination(
+        self,
+        client: AsyncClient,
+        test_brand: Brand,
+        test_idea: ContentIdea,
+        test_approved_idea: ContentIdea,
+        auth_headers: dict,
+    ):
+        """Test walking the idea list one page at a time with the cursor."""
+        first = await client.get(
+            f"/api/v1/ideas/brands/{test_brand.id}",
+            headers=auth_headers,
+            params={"limit": 1},
+        )
+        assert first.status_code == 200
+        assert len(first.json()) == 1
+        cursor = first.headers["X-Next-Cursor"]
+
+        second = await client.get(
+            f"/api/v1/ideas/brands/{test_brand.id}",
+            headers=auth_headers,
+            params={"limit": 1, "cursor": cursor},
+        )
+        assert second.status_code == 200
+        assert len(second.json()) == 1
+        assert second.json()[0]["id"] != first.json()[0]["id"]
+
+    async def test_list_ideas_invalid_cursor(
+        self,
+        client: AsyncClient,
+        test_brand: Brand,
+        auth_headers: dict,
+    ):
+        """Test that a malformed cursor is rejected."""
+        response = await client.get(
+            f"/api/v1/ideas/brands/{test_brand.id}",
+            headers=auth_headers,
+            params={"cursor": "not-a-cursor"},
+        )
+        assert response.status_code == 400
+
     async def test_list_ideas_unauthorized(
         self,
         client: AsyncClient,
@@ -317,3 +317,140 @@ class TestRecentlyPostedDishes:
         menu = {"categories": {"plats": [{"name": "Steak", "last_posted_at": "2024-01-15"}]}}
         result = pb._get_recently_posted_dishes(menu)
         assert "Steak" in result
+
+
+class _FakeRedis:
+    """Minimal async Redis stand-in for the embedding cache."""
+
+    def __init__(self, store: dict):
+        self.store = store
+
+    async def mget(self, keys):
+        return [self.store.get(k) for k in keys]
+
+    def pipeline(self, transaction=True):
+        redis = self
+
+        class _Pipe:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def set(self, key, value, ex=None):
+                redis.store[key] = value
+
+            async def execute(self):
+                return []
+
+        return _Pipe()
+
+    async def aclose(self):
+        pass
+
+
+class TestEmbeddingCache:
+    """Tests for cached_embeddings_batch."""
+
+    @pytest.mark.asyncio
+    async def test_duplicates_and_cached_texts_skip_provider(self):
+        import orjson
+
+        from app.services.embeddings import EmbeddingService
+
+        service = EmbeddingService()
+        store = {service._cache_key("Tiramisu\nMaison"): orjson.dumps([0.5, 0.5])}
+        generate = AsyncMock(return_value=[[0.1, 0.2]])
+
+        with patch("app.services.embeddings.aioredis.from_url", return_value=_FakeRedis(store)), \
+                patch.object(service, "generate_embeddings_batch", generate):
+            vectors = await service.cached_embeddings_batch(
+                ["Steak\nFrites", "Steak  \nFrites", "Tiramisu\nMaison"]
+            )
+
+        generate.assert_awaited_once_with(["Steak\nFrites"])
+        assert vectors == [[0.1, 0.2], [0.1, 0.2], [0.5, 0.5]]
+        assert store[service._cache_key("Steak\nFrites")] == orjson.dumps([0.1, 0.2])
+
+    @pytest.mark.asyncio
+    async def test_zero_vectors_not_cached(self):
+        from app.services.embeddings import EmbeddingService
+
+        service = EmbeddingService()
+        store = {}
+        with patch("app.services.embeddings.aioredis.from_url", return_value=_FakeRedis(store)), \
+                patch.object(service, "generate_embeddings_batch", AsyncMock(return_value=[[0.0, 0.0]])):
+            vectors = await service.cached_embeddings_batch(["Soupe"])
+
+        assert vectors == [[0.0, 0.0]]
+        assert store == {}
+
+
+class TestEmbeddingTask:
+    """generate_embeddings_task writes unlocked, guarded, and retries failures."""
+
+    def _run(self, embeddings, rowcounts=None):
+        from contextlib import asynccontextmanager
+
+        from app.workers import content_tasks
+
+        rows = [MagicMock(id=uuid.uuid4(), title="Pizza", content="Margherita") for _ in embeddings]
+        select_result = MagicMock()
+        select_result.all.return_value = rows
+        update_results = [MagicMock(rowcount=n) for n in (rowcounts or [1] * len(rows))]
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[select_result, *update_results])
+
+        @asynccontextmanager
+        async def fake_session():
+            yield db
+
+        task = content_tasks.generate_embeddings_task
+        with patch.object(content_tasks, "_get_async_session", fake_session), \
+                patch("app.services.embeddings.EmbeddingService.cached_embeddings_batch",
+                      AsyncMock(return_value=embeddings)), \
+                patch.object(task, "retry", side_effect=RuntimeError("retry")) as retry:
+            try:
+                outcome = task.run([str(row.id) for row in rows])
+            except RuntimeError:
+                outcome = None
+        return rows, db, outcome, retry
+
+    def test_all_stored(self):
+        rows, db, outcome, retry = self._run([[0.1, 0.2], [0.3, 0.4]])
+        retry.assert_not_called()
+        assert outcome == {"requested": 2, "stored": 2}
+
+    def test_read_takes_no_row_locks(self):
+        from sqlalchemy.dialects import postgresql
+
+        rows, db, outcome, retry = self._run([[0.1, 0.2]])
+        read = str(db.execute.call_args_list[0][0][0].compile(dialect=postgresql.dialect()))
+        assert "FOR UPDATE" not in read
+
+    def test_write_guarded_on_embedded_text(self):
+        from sqlalchemy.dialects import postgresql
+
+        rows, db, outcome, retry = self._run([[0.1, 0.2]])
+        write = db.execute.call_args_list[1][0][0].compile(dialect=postgresql.dialect())
+        sql = str(write)
+        assert sql.startswith("UPDATE knowledge_items SET")
+        assert "knowledge_items.title = " in sql
+        assert "knowledge_items.content = " in sql
+        assert "updated_at=knowledge_items.updated_at" in sql.replace(" ", "")
+        assert write.params["title_1"] == "Pizza"
+        assert write.params["content_1"] == "Margherita"
+
+    def test_edited_item_not_overwritten(self):
+        """An item edited mid-run matches no row and isn't counted as stored."""
+        rows, db, outcome, retry = self._run([[0.1, 0.2], [0.3, 0.4]], rowcounts=[1, 0])
+        retry.assert_not_called()
+        assert outcome == {"requested": 2, "stored": 1}
+
+    def test_zero_vectors_retried(self):
+        rows, db, outcome, retry = self._run([[0.1, 0.2], [0.0, 0.0]])
+        retry.assert_called_once()
+        assert retry.call_args.kwargs["args"] == [[str(rows[1].id)]]
+        # Only the good vector is written
+        assert db.execute.await_count == 2
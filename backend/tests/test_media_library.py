@@ -389,6 +389,157 @@ async def test_media_library_stats_endpoint_unauthorized():
         assert response.status_code == 401
 
 
+@pytest.mark.asyncio
+async def test_media_library_stats_single_query():
+    """Stats come from one FILTER-aggregate statement, voice notes included."""
+    import json
+    import uuid
+    from sqlalchemy.dialects import postgresql
+    from app.api.v1.endpoints.media_library import get_media_stats
+
+    row = MagicMock(
+        images=3, videos=1, total_size=4096, from_whatsapp=2,
+        from_upload=2, ai_analyzed=1, voice_notes=5,
+    )
+    result = MagicMock()
+    result.one.return_value = row
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value=result)
+    brand_id = uuid.uuid4()
+
+    with patch(
+        "app.api.v1.endpoints.media_library.get_cached_media_stats",
+        AsyncMock(return_value=None),
+    ), patch(
+        "app.api.v1.endpoints.media_library.store_media_stats", AsyncMock()
+    ) as store:
+        response = await get_media_stats(brand_id, db, MagicMock())
+
+    db.execute.assert_awaited_once()
+    sql = str(db.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+    assert "FILTER (WHERE" in sql
+    assert "CASE" not in sql
+    assert "voice_notes" in sql
+    stats = json.loads(response.body)
+    assert stats["total_images"] == 3
+    assert stats["total_voice_notes"] == 5
+    assert stats["total_size_bytes"] == 4096
+    store.assert_awaited_once_with(brand_id, response.body)
+
+
+@pytest.mark.asyncio
+async def test_media_library_stats_served_from_cache():
+    """A cached payload is returned without querying the database."""
+    import uuid
+    from app.api.v1.endpoints.media_library import get_media_stats
+
+    db = AsyncMock()
+    cached = b'{"total_images":7}'
+    with patch(
+        "app.api.v1.endpoints.media_library.get_cached_media_stats",
+        AsyncMock(return_value=cached),
+    ):
+        response = await get_media_stats(uuid.uuid4(), db, MagicMock())
+
+    assert response.body == cached
+    db.execute.assert_not_called()
+
+
+def _etag_request(if_none_match: str | None = None):
+    from starlette.requests import Request
+
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+@pytest.mark.asyncio
+async def test_media_library_assets_etag_roundtrip():
+    """The list carries an ETag, and a matching If-None-Match gets a bare 304."""
+    import uuid
+    from app.api.v1.endpoints.media_library import list_media_assets
+
+    stamp = MagicMock()
+    stamp.one.return_value = (0, datetime(2026, 1, 1, tzinfo=timezone.utc))
+    rows = MagicMock()
+    rows.scalars.return_value.all.return_value = []
+    db = AsyncMock()
+    db.execute = AsyncMock(side_effect=[stamp, rows])
+    brand_id = uuid.uuid4()
+    kwargs = dict(media_type=None, source=None, archived=False, limit=50, offset=0)
+
+    first = await list_media_assets(brand_id, _etag_request(), db, MagicMock(), **kwargs)
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert etag.startswith('W/"')
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    db.execute = AsyncMock(return_value=stamp)
+    second = await list_media_assets(brand_id, _etag_request(etag), db, MagicMock(), **kwargs)
+    assert second.status_code == 304
+    assert second.body == b""
+    db.execute.assert_awaited_once()
+
+    # A different page of the same collection must not share the tag
+    db.execute = AsyncMock(side_effect=[stamp, rows])
+    other_page = await list_media_assets(
+        brand_id, _etag_request(etag), db, MagicMock(), **{**kwargs, "offset": 50}
+    )
+    assert other_page.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_delete_media_asset_removes_file_and_row():
+    """The row is deleted and committed, then the file is removed."""
+    import uuid
+    from app.api.v1.endpoints.media_library import delete_media_asset
+
+    asset = MagicMock(brand_id=uuid.uuid4(), storage_key="brands/x/media/a.jpg")
+    storage = MagicMock()
+    storage.delete_file = AsyncMock(return_value=True)
+    db = AsyncMock()
+
+    with patch(
+        "app.api.v1.endpoints.media_library._get_asset", AsyncMock(return_value=asset)
+    ), patch(
+        "app.api.v1.endpoints.media_library.get_storage_service", return_value=storage
+    ), patch(
+        "app.api.v1.endpoints.media_library.invalidate_media_stats", AsyncMock()
+    ) as invalidate:
+        asset_id = uuid.uuid4()
+        result = await delete_media_asset(asset_id, db, MagicMock())
+
+    storage.delete_file.assert_awaited_once_with("brands/x/media/a.jpg")
+    db.delete.assert_awaited_once_with(asset)
+    db.commit.assert_awaited_once()
+    invalidate.assert_awaited_once_with(asset.brand_id)
+    assert result == {"status": "deleted", "id": str(asset_id)}
+
+
+@pytest.mark.asyncio
+async def test_delete_media_asset_keeps_file_when_commit_fails():
+    """A failed commit leaves the stored file in place for the surviving row."""
+    import uuid
+    from app.api.v1.endpoints.media_library import delete_media_asset
+
+    asset = MagicMock(brand_id=uuid.uuid4(), storage_key="brands/x/media/a.jpg")
+    storage = MagicMock()
+    storage.delete_file = AsyncMock(return_value=True)
+    db = AsyncMock()
+    db.commit = AsyncMock(side_effect=RuntimeError("commit failed"))
+
+    with patch(
+        "app.api.v1.endpoints.media_library._get_asset", AsyncMock(return_value=asset)
+    ), patch(
+        "app.api.v1.endpoints.media_library.get_storage_service", return_value=storage
+    ), patch(
+        "app.api.v1.endpoints.media_library.invalidate_media_stats", AsyncMock()
+    ):
+        with pytest.raises(RuntimeError):
+            await delete_media_asset(uuid.uuid4(), db, MagicMock())
+
+    storage.delete_file.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_media_library_asset_detail_unauthorized():
     """Test asset detail requires auth."""
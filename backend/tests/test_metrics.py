@@ -0,0 +1,129 @@
+"""
+PresenceOS - Metrics Endpoint Tests
+
+Tests for the dashboard KPI and top-posts queries.
+"""
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.api.v1.endpoints import metrics
+from app.models.publishing import SocialPlatform
+
+
+def _compile(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_dashboard_metrics_single_query():
+    """All dashboard KPIs come back from one statement."""
+    row = MagicMock(
+        published=4, scheduled=2, impressions=1000, likes=30, comments=5,
+        shares=3, saves=2, engagement_rate=6.5, top_platform=SocialPlatform.INSTAGRAM,
+    )
+    result = MagicMock()
+    result.one.return_value = row
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value=result)
+
+    with patch.object(metrics, "get_brand", AsyncMock()):
+        dashboard = await metrics.get_dashboard_metrics(uuid.uuid4(), MagicMock(), db, 30)
+
+    db.execute.assert_awaited_once()
+    sql = _compile(db.execute.call_args[0][0])
+    assert sql.count("FILTER (WHERE") == 2
+    assert "mv_brand_daily_metrics" in sql
+    assert "metrics_snapshots" not in sql
+    assert dashboard.total_posts_published == 4
+    assert dashboard.total_posts_scheduled == 2
+    assert dashboard.total_impressions == 1000
+    assert dashboard.total_engagement == 40
+    assert dashboard.top_platform == "instagram"
+    assert "Excellent" in dashboard.ai_insight
+
+
+@pytest.mark.asyncio
+async def test_dashboard_metrics_empty_brand():
+    """A brand without posts or snapshots gets zeroed KPIs."""
+    row = MagicMock(
+        published=0, scheduled=0, impressions=None, likes=None, comments=None,
+        shares=None, saves=None, engagement_rate=None, top_platform=None,
+    )
+    result = MagicMock()
+    result.one.return_value = row
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value=result)
+
+    with patch.object(metrics, "get_brand", AsyncMock()):
+        dashboard = await metrics.get_dashboard_metrics(uuid.uuid4(), MagicMock(), db, 30)
+
+    assert dashboard.total_impressions == 0
+    assert dashboard.total_engagement == 0
+    assert dashboard.average_engagement_rate == 0.0
+    assert dashboard.top_platform is None
+    assert dashboard.ai_insight is None
+
+
+@pytest.mark.asyncio
+async def test_platform_breakdown_reads_daily_rollup():
+    """The breakdown aggregates the materialized view, not raw snapshots."""
+    from decimal import Decimal
+
+    row = MagicMock(
+        platform=SocialPlatform.TIKTOK, posts_count=Decimal(12),
+        total_impressions=Decimal(5400), total_engagement=Decimal(310), avg_engagement=4.25,
+    )
+    result = MagicMock()
+    result.all.return_value = [row]
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value=result)
+
+    with patch.object(metrics, "get_brand", AsyncMock()):
+        platforms = await metrics.get_platform_breakdown(uuid.uuid4(), MagicMock(), db, 30)
+
+    sql = _compile(db.execute.call_args[0][0])
+    assert "FROM mv_brand_daily_metrics" in sql
+    assert "metrics_snapshots" not in sql
+    assert platforms[0].platform == "tiktok"
+    assert platforms[0].posts_count == 12
+    assert platforms[0].total_engagement == 310
+    assert platforms[0].average_engagement_rate == 4.25
+
+
+def test_brand_daily_metrics_refresh_scheduled():
+    """The rollup is refreshed on a short beat interval."""
+    from app.workers.celery_app import celery_app
+
+    entry = celery_app.conf.beat_schedule["refresh-brand-daily-metrics"]
+    assert entry["task"] == "app.workers.tasks.refresh_brand_daily_metrics"
+    assert entry["schedule"] <= 300
+
+
+@pytest.mark.asyncio
+async def test_top_posts_projects_columns():
+    """Top posts select plain columns and cut the caption preview in SQL."""
+    from datetime import datetime, timezone
+
+    post_id = uuid.uuid4()
+    row = MagicMock(
+        id=post_id, platform_post_url="https://instagram.com/p/x",
+        published_at=datetime(2026, 5, 1, tzinfo=timezone.utc), caption_preview="Brunch",
+        impressions=900, reach=700, likes=40, comments=4, shares=2, engagement_rate=5.1,
+    )
+    result = MagicMock()
+    result.all.return_value = [row]
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value=result)
+
+    with patch.object(metrics, "get_brand", AsyncMock()):
+        body = await metrics.get_top_posts(uuid.uuid4(), MagicMock(), db, "engagement", 10)
+
+    sql = _compile(db.execute.call_args[0][0])
+    assert "SUBSTRING(" in sql
+    assert "scheduled_posts.content_snapshot," not in sql
+    assert body["posts"][0]["post_id"] == str(post_id)
+    assert body["posts"][0]["caption_preview"] == "Brunch"
+    assert body["posts"][0]["published_at"] == "2026-05-01T00:00:00+00:00"
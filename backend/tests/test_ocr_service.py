@@ -160,3 +160,141 @@ class TestScanMenuImage:
 
         assert len(result) == 1
         assert result[0]["name"] == "Tartare"
+
+
+# ── Background Scan Job Tests ────────────────────────────────────────────
+
+
+class _FakeRedis:
+    """Minimal async Redis stand-in for the scan job store."""
+
+    def __init__(self, store: dict):
+        self.store = store
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def mget(self, *keys):
+        return [self.store.get(k) for k in keys]
+
+    def pipeline(self, transaction=True):
+        redis = self
+
+        class _Pipe:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def set(self, key, value, ex=None):
+                redis.store[key] = value
+
+            def delete(self, key):
+                redis.store.pop(key, None)
+
+            async def execute(self):
+                return []
+
+        return _Pipe()
+
+    async def aclose(self):
+        pass
+
+
+class TestScanJobs:
+    """Tests for the queued scan job lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_then_run_stores_dishes(self):
+        from app.services import ocr_service
+
+        store = {}
+        dishes = [{"name": "Tartare", "category": "plats", "price": 19.0, "description": None}]
+        redis = _FakeRedis(store)
+        with patch.object(ocr_service, "get_redis", AsyncMock(return_value=redis)), \
+                patch.object(ocr_service.aioredis, "from_url", return_value=redis), \
+                patch("app.workers.content_tasks.scan_menu_task.delay") as delay:
+            job_id = await ocr_service.enqueue_scan_job("brand-1", b"img", "image/png")
+
+            delay.assert_called_once_with(job_id, "image/png")
+            assert (await ocr_service.get_scan_job(job_id))["status"] == "pending"
+
+            with patch.object(OCRService, "scan_menu_image", AsyncMock(return_value=dishes)):
+                status = await ocr_service.run_scan_job(job_id, "image/png")
+
+            job = await ocr_service.get_scan_job(job_id)
+
+        assert status == "done"
+        assert job == {"brand_id": "brand-1", "status": "done", "dishes": dishes}
+        # The parked image is dropped once processed
+        assert f"{ocr_service.SCAN_IMAGE_KEY_PREFIX}{job_id}" not in store
+
+    @pytest.mark.asyncio
+    async def test_run_records_ocr_failure(self):
+        from app.services import ocr_service
+
+        store = {
+            f"{ocr_service.SCAN_JOB_KEY_PREFIX}j1": json.dumps(
+                {"brand_id": "b", "status": "pending"}
+            ).encode(),
+            f"{ocr_service.SCAN_IMAGE_KEY_PREFIX}j1": b"img",
+        }
+        with patch.object(ocr_service.aioredis, "from_url", return_value=_FakeRedis(store)), \
+                patch.object(OCRService, "scan_menu_image", AsyncMock(side_effect=Exception("API error"))):
+            status = await ocr_service.run_scan_job("j1", "image/jpeg")
+
+        job = json.loads(store[f"{ocr_service.SCAN_JOB_KEY_PREFIX}j1"])
+        assert status == "failed"
+        assert job["error"].startswith("Could not extract menu items")
+
+    @pytest.mark.asyncio
+    async def test_request_path_uses_shared_client(self):
+        """Enqueue and poll reuse the process's client instead of dialling Redis."""
+        from app.services import ocr_service
+
+        redis = _FakeRedis({})
+        with patch.object(ocr_service, "get_redis", AsyncMock(return_value=redis)), \
+                patch.object(ocr_service.aioredis, "from_url") as from_url, \
+                patch("app.workers.content_tasks.scan_menu_task.delay"):
+            job_id = await ocr_service.enqueue_scan_job("brand-1", b"img", "image/png")
+            await ocr_service.get_scan_job(job_id)
+
+        from_url.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_enqueue_without_redis_raises(self):
+        from app.services import ocr_service
+
+        with patch.object(ocr_service, "get_redis", AsyncMock(return_value=None)), \
+                patch("app.workers.content_tasks.scan_menu_task.delay") as delay:
+            with pytest.raises(ocr_service.ScanJobStoreUnavailable):
+                await ocr_service.enqueue_scan_job("brand-1", b"img", "image/png")
+
+        delay.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("redis", [None, "error"])
+    async def test_job_status_unavailable_is_503(self, redis):
+        """Polling answers 503 like the upload does when Redis is down or fails."""
+        import uuid
+
+        from fastapi import HTTPException
+
+        from app.api.v1.endpoints import menu_scan
+        from app.services import ocr_service
+
+        if redis == "error":
+            client = MagicMock()
+            client.get = AsyncMock(side_effect=ConnectionError("reset"))
+            get_redis = AsyncMock(return_value=client)
+        else:
+            get_redis = AsyncMock(return_value=None)
+
+        with patch.object(ocr_service, "get_redis", get_redis), \
+                patch.object(menu_scan, "get_brand", AsyncMock()):
+            with pytest.raises(HTTPException) as exc_info:
+                await menu_scan.get_scan_job_status(uuid.uuid4(), "j1", MagicMock(), AsyncMock())
+
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.detail.startswith("Menu scanning is temporarily unavailable")
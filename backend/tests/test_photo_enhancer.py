@@ -0,0 +1,71 @@
+"""
+PresenceOS - Photo Enhancer Tests
+
+Tests for the enhancement pipeline's score sidecar and the comparison endpoint.
+"""
+import io
+from unittest.mock import patch
+
+import orjson
+import pytest
+from PIL import Image
+
+from app.api.v1.endpoints import photos
+from app.services import photo_enhancer
+from app.services.photo_enhancer import PhotoEnhancerService, PhotoStyle
+
+
+def _jpeg_bytes() -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", (64, 48), (120, 80, 40)).save(buf, format="JPEG")
+    return buf.getvalue()
+
+
+@pytest.fixture
+def enhanced_dir(tmp_path):
+    with patch.object(photo_enhancer, "ENHANCED_DIR", str(tmp_path)), \
+            patch.object(photos, "ENHANCED_DIR", str(tmp_path)):
+        photos._load_scores.cache_clear()
+        yield tmp_path
+        photos._load_scores.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_enhance_writes_scores_sidecar(enhanced_dir):
+    """Enhancement records its before/after scores next to the images."""
+    result = await PhotoEnhancerService().enhance(_jpeg_bytes(), PhotoStyle.MENU)
+
+    scores = orjson.loads((enhanced_dir / f"{result['id']}_scores.json").read_bytes())
+    assert scores["quality_before"] == result["quality_before"]
+    assert scores["quality_after"] == result["quality_after"]
+    assert scores["improvement"] == result["improvement"]
+
+
+@pytest.mark.asyncio
+async def test_comparison_uses_recorded_scores(enhanced_dir):
+    """Comparisons read the sidecar instead of decoding both images."""
+    result = await PhotoEnhancerService().enhance(_jpeg_bytes(), PhotoStyle.INSTAGRAM)
+
+    with patch.object(PhotoEnhancerService, "get_quality_score") as rescore:
+        first = await photos.get_comparison(result["id"])
+        second = await photos.get_comparison(result["id"])
+
+    rescore.assert_not_called()
+    assert first == second
+    assert first["quality_after"] == result["quality_after"]
+    assert first["enhanced_url"] == result["enhanced_url"]
+    assert photos._load_scores.cache_info().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_comparison_without_sidecar_recomputes(enhanced_dir):
+    """Enhancements stored before the sidecar existed still compare."""
+    result = await PhotoEnhancerService().enhance(_jpeg_bytes(), PhotoStyle.STORY)
+    (enhanced_dir / f"{result['id']}_scores.json").unlink()
+
+    comparison = await photos.get_comparison(result["id"])
+
+    assert comparison["quality_before"]["width"] == 64
+    assert comparison["improvement"] == (
+        comparison["quality_after"]["score"] - comparison["quality_before"]["score"]
+    )
@@ -187,14 +187,13 @@ class TestGenerateFromAsset:
         asset.asset_label = "pizza"
         asset.linked_dish_id = None
 
-        # Returns: asset, kb, no existing proposal
-        asset_result = MagicMock()
-        asset_result.scalar_one_or_none.return_value = asset
+        # Asset by primary key, then kb and no existing proposal
+        db.get = AsyncMock(return_value=asset)
         kb_result = MagicMock()
         kb_result.scalar_one_or_none.return_value = kb
         no_result = MagicMock()
         no_result.scalar_one_or_none.return_value = None
-        db.execute = AsyncMock(side_effect=[asset_result, kb_result, no_result])
+        db.execute = AsyncMock(side_effect=[kb_result, no_result])
 
         generator = ProposalGenerator(db)
 
@@ -212,9 +211,7 @@ class TestGenerateFromAsset:
     @pytest.mark.asyncio
     async def test_generate_from_asset_not_found(self):
         db = _mock_db()
-        no_result = MagicMock()
-        no_result.scalar_one_or_none.return_value = None
-        db.execute = AsyncMock(return_value=no_result)
+        db.get = AsyncMock(return_value=None)
 
         generator = ProposalGenerator(db)
         with pytest.raises(ValueError, match="not found"):
@@ -0,0 +1,49 @@
+"""
+PresenceOS - Shared Redis Client Tests
+
+Tests for the process-wide Redis client's failure backoff.
+"""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core import redis_client
+
+
+@pytest.fixture(autouse=True)
+def _reset_client(monkeypatch):
+    monkeypatch.setattr(redis_client, "_client", None)
+    monkeypatch.setattr(redis_client, "_retry_at", 0.0)
+
+
+def _client(ping):
+    r = MagicMock()
+    r.ping = ping
+    return r
+
+
+@pytest.mark.asyncio
+async def test_client_reused_once_connected():
+    r = _client(AsyncMock())
+    with patch("redis.asyncio.from_url", return_value=r) as from_url:
+        assert await redis_client.get_redis() is r
+        assert await redis_client.get_redis() is r
+    from_url.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_failure_backs_off_then_retries(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(redis_client.time, "monotonic", lambda: clock[0])
+    down = _client(AsyncMock(side_effect=ConnectionError("down")))
+    up = _client(AsyncMock())
+
+    with patch("redis.asyncio.from_url", side_effect=[down, up]) as from_url:
+        assert await redis_client.get_redis() is None
+        # Within the backoff window no new connection is attempted
+        clock[0] += redis_client.REDIS_RETRY_SECONDS - 1
+        assert await redis_client.get_redis() is None
+        assert from_url.call_count == 1
+        # After it, Redis is tried again instead of staying disabled
+        clock[0] += 2
+        assert await redis_client.get_redis() is up
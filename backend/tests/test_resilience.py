@@ -70,6 +70,27 @@ class TestHealthProbes:
         assert response.status_code == 200
         assert response.json()["status"] == "healthy"
 
+    @pytest.mark.asyncio
+    async def test_health_pool_reports_usage(self, client, monkeypatch):
+        """Pool endpoint reports connection usage without touching the DB."""
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "debug", True)
+        response = await client.get("/health/pool")
+        assert response.status_code == 200
+        data = response.json()
+        assert "pool" in data
+        assert data["checked_out"] == 0
+
+    @pytest.mark.asyncio
+    async def test_health_pool_hidden_without_debug(self, client, monkeypatch):
+        """Pool internals are not exposed outside DEBUG."""
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "debug", False)
+        response = await client.get("/health/pool")
+        assert response.status_code == 404
+
 
 # ── Degraded Mode GET Endpoints ──────────────────────────────────
 
@@ -206,6 +227,16 @@ class TestServiceRegistry:
         assert "postgresql" in status
         assert status["postgresql"]["status"] == "unavailable"
 
+    def test_get_status_snapshot_invalidated_on_update(self):
+        """get_status reuses its snapshot until a service status is updated."""
+        from app.core.resilience import ServiceRegistry, ServiceStatus
+        reg = ServiceRegistry()
+        reg.register("postgresql", ServiceStatus.UNAVAILABLE)
+        first = reg.get_status()
+        assert reg.get_status() is first
+        reg.update("postgresql", ServiceStatus.HEALTHY)
+        assert reg.get_status()["postgresql"]["status"] == "healthy"
+
     def test_is_degraded(self):
         """is_degraded is True when postgresql is unavailable."""
         from app.core.resilience import ServiceRegistry, ServiceStatus
@@ -214,3 +245,23 @@ class TestServiceRegistry:
         assert reg.is_degraded is True
         reg.update("postgresql", ServiceStatus.HEALTHY)
         assert reg.is_degraded is False
+
+
+# ── PostgreSQL Probe ─────────────────────────────────────────────
+
+class TestPostgresProbe:
+    @pytest.mark.asyncio
+    async def test_probe_updates_registry(self):
+        """The raw asyncpg probe reports into the registry and never leaks a dead pool."""
+        from app.core import database
+        from app.core.resilience import registry, ServiceStatus
+        from app.main import _probe_postgresql
+
+        registry.register("postgresql", ServiceStatus.UNAVAILABLE)
+        ok = await _probe_postgresql()
+
+        assert registry.is_available("postgresql") is ok
+        if not ok:
+            assert database._probe_pool is None
+        await database.close_probe_pool()
+        assert database._probe_pool is None
@@ -50,6 +50,14 @@ class TestConnectorFactory:
         assert isinstance(handler, UploadPostConnector)
         assert handler.platform == "tiktok"
 
+    def test_handlers_are_reused(self):
+        assert get_connector_handler(SocialPlatform.INSTAGRAM) is get_connector_handler(
+            SocialPlatform.INSTAGRAM
+        )
+        assert get_connector_handler(SocialPlatform.INSTAGRAM) is not get_connector_handler(
+            SocialPlatform.TIKTOK
+        )
+
     def test_unsupported_platform_raises(self):
         with pytest.raises(ValueError, match="Unsupported platform"):
             get_connector_handler("twitter")
@@ -148,6 +148,11 @@ async def test_chat_upload_endpoint():
     assert data["media_id"].endswith(".jpg")
     assert data["mime_type"] == "image/jpeg"
 
+    import os
+    from app.api.v1.endpoints.chat import UPLOAD_DIR
+    with open(os.path.join(UPLOAD_DIR, data["media_id"]), "rb") as f:
+        assert f.read() == b"\xff\xd8\xff\xe0" + b"\x00" * 100
+
 
 # ── Module importability ──────────────────────────────────────────
 
@@ -158,3 +163,38 @@ def test_chat_modules_importable():
 
     assert WebChatService is not None
     assert router is not None
+
+
+@pytest.mark.asyncio
+async def test_resolve_brand_is_memoized(monkeypatch):
+    """_resolve_brand hits the DB once, then serves from the TTL memo."""
+    from app.api.v1.endpoints import chat
+
+    brand = MagicMock(id="brand-1")
+    config = MagicMock(id="config-1")
+    brand_result = MagicMock()
+    brand_result.scalar_one_or_none.return_value = brand
+    config_result = MagicMock()
+    config_result.scalar_one_or_none.return_value = config
+    db = MagicMock()
+    db.execute = AsyncMock(side_effect=[brand_result, config_result])
+
+    # monkeypatch restores whatever memo was there before the test
+    monkeypatch.setattr(chat, "_resolved_brand", None)
+    assert await chat._resolve_brand(db) == ("brand-1", "config-1")
+    assert await chat._resolve_brand(db) == ("brand-1", "config-1")
+    assert db.execute.await_count == 2
+
+
+def test_message_builders_normalize_payloads():
+    """Each msg_type maps to the WhatsApp-style payload the engine expects."""
+    from app.api.v1.endpoints.chat import MESSAGE_BUILDERS, ChatMessageRequest
+
+    req = ChatMessageRequest(msg_type="image", media_id="abc.jpg", text="Menu")
+    assert MESSAGE_BUILDERS["image"](req) == {"image": {"id": "abc.jpg", "caption": "Menu"}}
+
+    req = ChatMessageRequest(msg_type="interactive", button_id="btn_ok")
+    assert MESSAGE_BUILDERS["interactive"](req)["interactive"]["button_reply"] == {"id": "btn_ok"}
+
+    req = ChatMessageRequest(msg_type="text")
+    assert MESSAGE_BUILDERS["text"](req) == {"text": {"body": ""}}
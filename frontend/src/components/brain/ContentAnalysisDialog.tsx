@@ -73,6 +73,30 @@ const toneLabels: Record<string, { label: string; low: string; high: string }> =
   humor_level: { label: "Humour", low: "Aucun", high: "Tres drole" },
 };
 
+const POLL_INTERVAL_MS = 2000;
+// Jobs live in the API process's memory; stop polling if one never finishes
+const MAX_WAIT_MS = 5 * 60 * 1000;
+
+async function waitForAnalysis(
+  brandId: string,
+  jobId: string
+): Promise<AnalysisResult> {
+  const deadline = Date.now() + MAX_WAIT_MS;
+  while (Date.now() < deadline) {
+    await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS));
+    const { data } = await contentAnalysisApi.getStatus(brandId);
+    const job = data.analysis;
+    // A missing or replaced job (e.g. after an API restart) counts as failed
+    if (!job || job.job_id !== jobId) {
+      throw new Error("Analyse introuvable");
+    }
+    if (job.status === "completed" || job.status === "failed") {
+      return job.result as AnalysisResult;
+    }
+  }
+  throw new Error("L'analyse prend trop de temps, réessayez plus tard");
+}
+
 export function ContentAnalysisDialog({
   onKnowledgeUpdated,
 }: ContentAnalysisDialogProps) {
@@ -111,16 +135,21 @@ export function ContentAnalysisDialog({
         });
       }, 2000);
 
-      const response = await contentAnalysisApi.analyze(
-        brandId,
-        username.trim()
-      );
+      // The analysis runs in the background: start it, then poll its status
+      let data: AnalysisResult;
+      try {
+        const response = await contentAnalysisApi.analyze(
+          brandId,
+          username.trim()
+        );
+        data = await waitForAnalysis(brandId, response.data.job_id);
+      } finally {
+        clearInterval(progressTimer);
+      }
 
-      clearInterval(progressTimer);
       setProgress(100);
       setProgressLabel("Analyse terminée !");
 
-      const data = response.data as AnalysisResult;
       setResult(data);
 
       if (data.success) {
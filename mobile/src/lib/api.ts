@@ -168,6 +168,8 @@ export const contentApi = {
 export const menuApi = {
   scan: (brandId: string, formData: FormData) =>
     api.post(`/menu/${brandId}/scan`, formData),
+  scanJob: (brandId: string, jobId: string) =>
+    api.get(`/menu/${brandId}/scan/jobs/${jobId}`),
   importDishes: (brandId: string, dishes: any[]) =>
     api.post(`/menu/${brandId}/scan/import`, { dishes }),
 };
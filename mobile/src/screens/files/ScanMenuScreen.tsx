@@ -28,6 +28,25 @@ interface ScannedDish {
   selected: boolean;
 }
 
+// OCR runs in a worker: the scan endpoint returns a job to poll
+const SCAN_POLL_INTERVAL_MS = 1500;
+const SCAN_MAX_WAIT_MS = 2 * 60 * 1000;
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
+async function waitForScan(brandId: string, jobId: string): Promise<any[]> {
+  const deadline = Date.now() + SCAN_MAX_WAIT_MS;
+  while (Date.now() < deadline) {
+    await sleep(SCAN_POLL_INTERVAL_MS);
+    const res = await menuApi.scanJob(brandId, jobId);
+    if (res.data.status === "done") return res.data.dishes || [];
+    if (res.data.status === "failed") {
+      throw new Error(res.data.error || "Scan failed");
+    }
+  }
+  throw new Error("Scan timed out");
+}
+
 export default function ScanMenuScreen() {
   const nav = useNavigation();
   const brand = useContext(BrandContext);
@@ -62,7 +81,8 @@ export default function ScanMenuScreen() {
 
       try {
         const res = await menuApi.scan(brandId, formData);
-        const scanned = (res.data.dishes || res.data || []).map((d: any) => ({
+        const found = await waitForScan(brandId, res.data.job_id);
+        const scanned = found.map((d: any) => ({
           ...d,
           selected: true,
         }));